@@ -1,55 +1,91 @@
 """Main entry point for the application."""
 
+import asyncio
 import logging
 import sys
+from importlib import import_module
 
-from modules.bot import JfaGoBot, register_event_handlers
-from modules.commands.admin_commands import setup_commands as setup_admin_commands
-from modules.commands.invite_commands import setup_commands as setup_invite_commands
-from modules.commands.user_invite_commands import (
-    setup_commands as setup_user_invite_commands,
-)
-from modules.config import get_config_value, validate_config
+from modules.config import ensure_config_validated, get_config_snapshot
 from modules.logging_setup import setup_logging
 
+# Command modules are imported lazily, only once the bot is about to start,
+# so importing this module doesn't drag in the whole command dependency graph.
+COMMAND_MODULES = ("invite_commands", "user_invite_commands", "admin_commands")
+
 # Setup logging first
 setup_logging()
 
 # Get the main logger
 logger = logging.getLogger(__name__)
 
-# Validate configuration
-validate_config()
+
+def __getattr__(name: str):
+    """Resolve the legacy ``setup_*_commands`` names on demand."""
+    if name.startswith("setup_") and name.endswith("_commands"):
+        module_name = name[len("setup_") :]
+        if module_name in COMMAND_MODULES:
+            return import_module(f"modules.commands.{module_name}").setup_commands
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     try:
+        # Validate configuration
+        ensure_config_validated()
+
         logger.info("Starting JFA-GO Discord Bot")
 
         # Fetch required config values
-        jfa_username = get_config_value("jfa_go.username")
-        jfa_password = get_config_value("jfa_go.password")
-        jfa_base_url = get_config_value("jfa_go.base_url")
-        discord_token = get_config_value("discord.token")
+        cfg = get_config_snapshot()
+        jfa_username = cfg["jfa_go"]["username"]
+        jfa_password = cfg["jfa_go"]["password"]
+        jfa_base_url = cfg["jfa_go"]["base_url"]
+        discord_token = cfg["discord"]["token"]
 
-        if not all([jfa_username, jfa_password, jfa_base_url, discord_token]):
+        if not (jfa_username and jfa_password and jfa_base_url and discord_token):
+            missing = [
+                name
+                for name, value in (
+                    ("jfa_go.username", jfa_username),
+                    ("jfa_go.password", jfa_password),
+                    ("jfa_go.base_url", jfa_base_url),
+                    ("discord.token", discord_token),
+                )
+                if not value
+            ]
             logger.critical(
-                "Missing critical JFA-GO or Discord configuration. Please check your config.yaml and .env file."
+                f"Missing critical JFA-GO or Discord configuration ({', '.join(missing)}). Please check your config.yaml and .env file."
             )
             sys.exit(1)
 
+        from modules.bot import JfaGoBot, register_event_handlers
+
         # Initialize the bot
         bot = JfaGoBot(jfa_username, jfa_password, jfa_base_url)
 
         # Register event handlers
         register_event_handlers(bot)
 
-        # Register command handlers
-        setup_invite_commands(bot)
-        logger.debug("Invite commands setup.")
-        setup_user_invite_commands(bot)
-        logger.debug("User invite commands setup.")
-        setup_admin_commands(bot)
-        logger.debug("Admin commands setup.")
+        # Register command handlers. These only add commands to bot.tree in memory
+        # (the single Discord sync happens in setup_hook), so there is no I/O to
+        # overlap and they stay sequential to keep command registration order stable.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for module_name in COMMAND_MODULES:
+            import_module(f"modules.commands.{module_name}").setup_commands(bot)
+            if debug_enabled:
+                logger.debug(f"Commands from {module_name} setup.")
+
+        # Use uvloop's event loop when it is available (not supported on Windows)
+        if sys.platform != "win32":
+            try:
+                import uvloop
+
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                logger.info("Using uvloop event loop policy.")
+            except ImportError:
+                logger.info(
+                    "uvloop not installed; using the default asyncio event loop."
+                )
 
         # Run the bot
         bot.run(discord_token)
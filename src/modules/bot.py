@@ -13,20 +13,70 @@ Key components:
 
 import asyncio
 import datetime
+import functools
+import hashlib
+import json
 import logging
-from typing import List, Any
+import random
+import sys
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import tasks
 
 from modules.config import (
+    ensure_config_validated,
     get_config_value,
 )
-from modules.messaging import create_embed, get_message
+from modules.messaging import create_embed, get_message, get_static_message
 from modules.database import Database
-from modules.jfa_client import JfaGoClient
-from modules.models import AdminAction
+from modules.jfa_client import JFA_CONNECTION_POOL_SIZE, JfaGoClient
+from modules.models import AdminAction, ExpirySummaryRow
+
+# bot_state key holding the Unix timestamp of the last expiry notification run
+EXPIRY_CHECK_LAST_RUN_KEY = "expiry_check_last_run"
+
+# Discord limits for the expiry summary embeds
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBEDS_PER_MESSAGE_LIMIT = 10
+EMBED_TOTAL_CHARACTERS_LIMIT = 6000
+
+# Regular expiry check interval, and the shortest interval used when a user is about
+# to enter a notification day sooner than that
+EXPIRY_CHECK_INTERVAL_HOURS = 6
+EXPIRY_CHECK_MIN_INTERVAL_SECONDS = 300
+
+# Discord stops counting Thread.member_count at this value
+THREAD_MEMBER_COUNT_CAP = 50
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_expiry_timestamp(
+    expires_at_ts: int,
+) -> Tuple[datetime.datetime, str, str]:
+    """
+    Format an expiry timestamp for notifications, memoized per timestamp.
+
+    Args:
+        expires_at_ts: Timestamp of when the account expires
+
+    Returns:
+        Tuple[datetime.datetime, str, str]: UTC expiry datetime, formatted date string
+        and Discord relative timestamp markup
+    """
+    expiry_datetime = datetime.datetime.fromtimestamp(
+        expires_at_ts, tz=datetime.timezone.utc
+    )
+    return (
+        expiry_datetime,
+        expiry_datetime.strftime("%Y-%m-%d %H:%M %Z"),
+        # Same markup discord.utils.format_dt(expiry_datetime, style="R") produces
+        f"<t:{int(expires_at_ts)}:R>",
+    )
 
 
 class JfaGoBot(discord.Client):
@@ -52,6 +102,9 @@ class JfaGoBot(discord.Client):
             self.__class__.__name__
         )  # Logger for JfaGoBot class
         try:
+            # No-op if the entry point already validated the configuration
+            ensure_config_validated()
+
             intents = discord.Intents.default()
             intents.members = True
             intents.message_content = True
@@ -62,6 +115,27 @@ class JfaGoBot(discord.Client):
             self.logger.info("Initializing Database...")
             db_file_path = get_config_value("bot_settings.db_file_name", "jfa_bot.db")
             self.db = Database(db_file_path)
+            # Single long-lived worker for all database calls, so they run one at a
+            # time and don't queue behind JFA-GO requests in the default pool
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="jfa-bot-db"
+            )
+            # One worker per pooled JFA-GO connection, so a request never waits for
+            # a connection and JFA-GO calls don't take slots from the default pool
+            self._jfa_executor = ThreadPoolExecutor(
+                max_workers=JFA_CONNECTION_POOL_SIZE, thread_name_prefix="jfa-bot-http"
+            )
+            # Admin actions waiting to be written by _admin_action_writer
+            self._admin_action_queue: asyncio.Queue[AdminAction] = asyncio.Queue()
+            self._admin_action_writer_task: Optional[asyncio.Task] = None
+            # Strong references to fire-and-forget tasks until they finish
+            self._background_tasks: Set[asyncio.Task] = set()
+            # Per-target locks for admin commands; entries disappear once unused
+            self._target_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+                weakref.WeakValueDictionary()
+            )
+            # Per-guild {role name: role} maps, built lazily by get_role_by_name
+            self._role_name_index: Dict[int, Dict[str, discord.Role]] = {}
             self.logger.info("Initializing Command Tree...")
             self.tree = app_commands.CommandTree(self)
 
@@ -86,8 +160,8 @@ class JfaGoBot(discord.Client):
                     f"Admin log channel ID set to: {self.admin_log_channel_id}"
                 )
 
-            # Cache for support category ID - This is no longer used by the refactored is_support_category
-            # self.support_category_id = None
+            # Resolve config values read on hot paths once instead of per call
+            self.load_cached_config()
             self.logger.info("JfaGoBot initialized successfully.")
 
         except Exception as e:
@@ -98,6 +172,182 @@ class JfaGoBot(discord.Client):
             )
             raise
 
+    def load_cached_config(self) -> None:
+        """
+        Cache config values used by per-event and per-tick code paths.
+
+        Called from __init__. Call it again after reloading the configuration
+        (modules.config.load_app_config) to refresh the cached values. Also applies a
+        changed JFA-GO user sync interval to its task loop.
+        """
+        command_channel_ids = set()
+        for channel_id in get_config_value("discord.command_channel_ids", []):
+            try:
+                command_channel_ids.add(int(channel_id))
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    f"Ignoring non-numeric entry in discord.command_channel_ids: '{channel_id}'."
+                )
+        self._command_channel_ids = frozenset(command_channel_ids)
+
+        # Roles allowed to run commands, matched by name or by numeric role ID
+        authorized_roles = [
+            str(role)
+            for role in get_config_value("discord.command_authorized_roles", [])
+        ]
+        self._authorized_role_names = frozenset(authorized_roles)
+        self._authorized_role_ids = frozenset(
+            int(role) for role in authorized_roles if role.isdigit()
+        )
+
+        guild_id_str = get_config_value("discord.guild_id")
+        self._guild_id_int = None
+        self._guild = None  # Resolved lazily by get_configured_guild
+        if guild_id_str:
+            try:
+                self._guild_id_int = int(guild_id_str)
+            except ValueError:
+                self.logger.warning(
+                    f"Invalid format for discord.guild_id: '{guild_id_str}'."
+                )
+
+        self._expiry_fetch_days = get_config_value(
+            "notification_settings.expiry_check_fetch_days", 4
+        )
+        self._notification_interval_seconds = (
+            get_config_value(
+                "notification_settings.expiry_notification_interval_days", 2
+            )
+            * 86400
+        )
+        self._notification_days_set = frozenset(
+            get_config_value(
+                "notification_settings.notification_days_before_expiry", [3, 0]
+            )
+        )
+        self._notification_channel_id_str = get_config_value(
+            "discord.notification_channel_id"
+        )
+        self._notification_channel_id_int = None
+        self._notification_channel = None  # Resolved lazily by get_notification_channel
+        if self._notification_channel_id_str:
+            try:
+                self._notification_channel_id_int = int(
+                    self._notification_channel_id_str
+                )
+            except ValueError:
+                self.logger.warning(
+                    f"Invalid notification_channel_id: {self._notification_channel_id_str}"
+                )
+        self._dm_concurrency = max(
+            1, int(get_config_value("notification_settings.dm_concurrency", 8))
+        )
+        self._bot_name = get_config_value("bot_settings.bot_name", "Our Server")
+        self._trial_role_name = get_config_value("discord.trial_user_role_name")
+        # Role names or IDs (as strings) of the paid plan roles managed by the bot
+        self._managed_paid_role_keys = frozenset(
+            str(role)
+            for role in get_config_value(
+                "commands.create_user_invite.plan_to_role_map", {}
+            ).values()
+        )
+
+        self._jfa_user_sync_interval_hours = get_config_value(
+            "sync_settings.jfa_user_sync_interval_hours", 12
+        )
+        if self.sync_jfa_users_cache_task.hours != self._jfa_user_sync_interval_hours:
+            self.sync_jfa_users_cache_task.change_interval(
+                hours=self._jfa_user_sync_interval_hours
+            )
+
+    @property
+    def authorized_role_names(self) -> FrozenSet[str]:
+        """Role names or IDs (as strings) allowed to run commands."""
+        return self._authorized_role_names
+
+    @property
+    def authorized_role_ids(self) -> FrozenSet[int]:
+        """Numeric IDs of the roles allowed to run commands."""
+        return self._authorized_role_ids
+
+    @property
+    def trial_role_name(self) -> Optional[str]:
+        """Name of the configured trial user role, if any."""
+        return self._trial_role_name
+
+    @property
+    def managed_paid_role_keys(self) -> FrozenSet[str]:
+        """Role names or IDs (as strings) of the paid plan roles managed by the bot."""
+        return self._managed_paid_role_keys
+
+    def get_configured_guild(self) -> Optional[discord.Guild]:
+        """
+        Get the guild configured in discord.guild_id.
+
+        The guild object is looked up once and reused; the cached reference is reset
+        by load_cached_config and whenever the bot becomes ready again.
+
+        Returns:
+            Optional[discord.Guild]: The configured guild, or None if it is not
+            configured or not in the bot's cache
+        """
+        if self._guild is None and self._guild_id_int is not None:
+            self._guild = self.get_guild(self._guild_id_int)
+        return self._guild
+
+    def get_role_by_name(
+        self, guild: discord.Guild, role_name: Optional[str]
+    ) -> Optional[discord.Role]:
+        """
+        Look up a guild role by its name.
+
+        The guild's roles are indexed by name on first use, so repeated lookups are a
+        dict hit instead of a scan over guild.roles. The index for a guild is dropped
+        whenever one of its roles is created, updated or deleted, and rebuilt on the
+        next lookup.
+
+        Args:
+            guild: The guild to look the role up in
+            role_name: The role name; None or an empty name returns None
+
+        Returns:
+            Optional[discord.Role]: The role, or None if the guild has no role with
+            that name
+        """
+        if not role_name:
+            return None
+        roles_by_name = self._role_name_index.get(guild.id)
+        if roles_by_name is None:
+            roles_by_name = {}
+            # guild.roles is ordered lowest first; keep the first match like
+            # discord.utils.get does when several roles share a name
+            for role in guild.roles:
+                roles_by_name.setdefault(role.name, role)
+            self._role_name_index[guild.id] = roles_by_name
+        return roles_by_name.get(role_name)
+
+    def get_notification_channel(self) -> Optional[discord.abc.GuildChannel]:
+        """
+        Get the channel configured in discord.notification_channel_id.
+
+        Like get_configured_guild, the channel is looked up once and reused until
+        load_cached_config runs again or the bot becomes ready again.
+
+        Returns:
+            Optional[discord.abc.GuildChannel]: The expiry summary channel, or None if
+            it is not configured or could not be found
+        """
+        if (
+            self._notification_channel is None
+            and self._notification_channel_id_int is not None
+        ):
+            guild = self.get_configured_guild()
+            if guild:
+                self._notification_channel = guild.get_channel(
+                    self._notification_channel_id_int
+                )
+        return self._notification_channel
+
     def is_support_category(self, channel: discord.abc.GuildChannel) -> bool:
         """
         Check if a channel is in the support category or is a configured command channel.
@@ -113,15 +363,19 @@ class JfaGoBot(discord.Client):
             bool: True if the channel is allowed for commands, False otherwise
         """
         try:
-            if not channel or not hasattr(channel, "category") or not channel.category:
+            # GuildChannels and Threads expose category_id (None if not in a category;
+            # a thread reports its parent channel's category)
+            category_id = getattr(channel, "category_id", None)
+            if category_id is None:
                 self.logger.debug(
-                    f"Channel {channel.name if channel else 'None'} is not in a category."
+                    "Channel %s is not in a category.",
+                    channel.name if channel else "None",
                 )
                 return False
 
-            # Use COMMAND_CHANNEL_IDS from the new config
+            # Use COMMAND_CHANNEL_IDS from the new config (cached in load_cached_config)
             # This replaces the old SUPPORT_CATEGORY_NAME logic
-            configured_channel_ids = get_config_value("discord.command_channel_ids", [])
+            configured_channel_ids = self._command_channel_ids
 
             if not configured_channel_ids:
                 self.logger.warning(
@@ -130,43 +384,42 @@ class JfaGoBot(discord.Client):
                 return False
 
             # Check direct channel ID match
-            if str(channel.id) in configured_channel_ids:
+            if channel.id in configured_channel_ids:
                 self.logger.debug(
-                    f"Channel {channel.name} ({channel.id}) is directly in configured command_channel_ids."
+                    "Channel %s (%s) is directly in configured command_channel_ids.",
+                    channel.name,
+                    channel.id,
                 )
                 return True
 
             # Check parent category ID match
-            if hasattr(channel, "category_id") and channel.category_id:
-                if str(channel.category_id) in configured_channel_ids:
-                    self.logger.debug(
-                        f"Channel {channel.name} ({channel.id}) is in a configured support category ({channel.category_id})."
-                    )
-                    return True
+            if category_id in configured_channel_ids:
+                self.logger.debug(
+                    "Channel %s (%s) is in a configured support category (%s).",
+                    channel.name,
+                    channel.id,
+                    category_id,
+                )
+                return True
 
-            # Check if the channel is a thread and its parent is a support channel/category
+            # Check if the channel is a thread and its parent is a support channel
+            # (the parent's category was already checked through category_id above)
             if isinstance(channel, discord.Thread):
                 parent_channel_id = channel.parent_id
-                if str(parent_channel_id) in configured_channel_ids:
+                if parent_channel_id in configured_channel_ids:
                     self.logger.debug(
-                        f"Thread {channel.name} ({channel.id}) has parent channel ({parent_channel_id}) in configured command_channel_ids."
+                        "Thread %s (%s) has parent channel (%s) in configured command_channel_ids.",
+                        channel.name,
+                        channel.id,
+                        parent_channel_id,
                     )
                     return True
-                # Check thread's parent channel's category
-                parent_channel = self.get_channel(parent_channel_id)
-                if (
-                    parent_channel
-                    and hasattr(parent_channel, "category_id")
-                    and parent_channel.category_id
-                ):
-                    if str(parent_channel.category_id) in configured_channel_ids:
-                        self.logger.debug(
-                            f"Thread {channel.name} ({channel.id}) has parent channel in configured support category ({parent_channel.category_id})."
-                        )
-                        return True
 
             self.logger.debug(
-                f"Channel {channel.name} ({channel.id}) with category ID {channel.category_id if hasattr(channel, 'category_id') else 'N/A'} is not a configured support channel/category."
+                "Channel %s (%s) with category ID %s is not a configured support channel/category.",
+                channel.name,
+                channel.id,
+                category_id,
             )
             return False
         except Exception as e:
@@ -188,56 +441,203 @@ class JfaGoBot(discord.Client):
 
         This is called automatically by discord.py when the bot connects.
         """
+        guild_id_int = self._guild_id_int  # Parsed once in load_cached_config
         try:
-            # Fetch GUILD_ID from config
-            guild_id_str = get_config_value("discord.guild_id")
-            if not guild_id_str:
+            if guild_id_int is None:
                 self.logger.error(
-                    "discord.guild_id is not set in config. Command sync will be skipped."
+                    "discord.guild_id is not set or is not a valid integer. Command sync will be skipped."
                 )
-                # Start background tasks even if guild sync fails, as they might be independent
-                self.check_expiry_notifications.start()
-                self.sync_jfa_users_cache_task.start()
-                return
+            else:
+                self.logger.info(
+                    f"Running setup_hook to sync commands for guild ID: {guild_id_int}"
+                )
+                guild = discord.Object(id=guild_id_int)
+                self.tree.copy_global_to(guild=guild)
+
+                # Skip the rate-limited sync call if the commands haven't changed since the last sync
+                sync_state_key = f"command_tree_hash:{guild_id_int}"
+                command_tree_hash = self._get_command_tree_hash()
+                if (
+                    await self.run_db(self.db.get_bot_state, sync_state_key)
+                    == command_tree_hash
+                ):
+                    self.logger.info(
+                        f"Command tree unchanged since last sync. Skipping sync for guild ID: {guild_id_int}"
+                    )
+                else:
+                    await self.tree.sync(guild=guild)
+                    await self.run_db(
+                        self.db.set_bot_state, sync_state_key, command_tree_hash
+                    )
+                    self.logger.info(
+                        f"Successfully synced commands to guild ID: {guild_id_int}"
+                    )
+                self.logger.info(f"Bot {self.user} is ready and online!")
+                self.logger.info(f"Connected to {len(self.guilds)} guilds.")
+        except Exception as e:
+            self.logger.error(
+                f"Error during setup_hook command sync: {str(e)}", exc_info=True
+            )
+            raise
+
+        # Start background tasks even if guild sync was skipped, as they are independent of it
+        self._start_background_tasks()
+        self.logger.info("All background tasks started.")
+
+    async def run_db(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking Database method on the bot's database worker thread.
 
+        Args:
+            func: The Database method (or other blocking callable) to run
+            *args: Positional arguments passed to func
+            **kwargs: Keyword arguments passed to func
+
+        Returns:
+            Any: The value returned by func
+        """
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, func, *args
+        )
+
+    async def run_jfa(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking JfaGoClient method on the bot's JFA-GO worker threads.
+
+        Args:
+            func: The JfaGoClient method (or other blocking callable) to run
+            *args: Positional arguments passed to func
+            **kwargs: Keyword arguments passed to func
+
+        Returns:
+            Any: The value returned by func
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._jfa_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def target_lock(self, key: str) -> asyncio.Lock:
+        """
+        Get the lock serializing admin commands that act on the same target.
+
+        Locks are held weakly, so a key's lock is dropped as soon as no command is
+        holding or waiting for it.
+
+        Args:
+            key: Identifies the target, e.g. "discord:<user id>"
+
+        Returns:
+            asyncio.Lock: The lock for this target
+        """
+        lock = self._target_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._target_locks[key] = lock
+        return lock
+
+    def queue_admin_action(self, action: AdminAction) -> None:
+        """
+        Queue an admin action to be recorded in the database.
+
+        Commands call this instead of writing the row themselves; the background
+        admin action writer stores queued actions in batches on the database worker
+        thread, so the command never waits on the insert.
+
+        Args:
+            action: The admin action to record
+        """
+        self._admin_action_queue.put_nowait(action)
+
+    def _drain_admin_action_queue(self) -> List[AdminAction]:
+        """Take every admin action currently waiting in the queue."""
+        actions = []
+        while True:
             try:
-                guild_id_int = int(guild_id_str)
-            except ValueError:
+                actions.append(self._admin_action_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return actions
+
+    async def _admin_action_writer(self) -> None:
+        """
+        Background task that records queued admin actions.
+
+        Waits for an action, then takes every other action queued by that point and
+        writes them all in one transaction.
+        """
+        while True:
+            actions = [await self._admin_action_queue.get()]
+            actions.extend(self._drain_admin_action_queue())
+            try:
+                await self.run_db(self.db.record_admin_actions, actions)
+            except Exception as e:
                 self.logger.error(
-                    f"Invalid format for discord.guild_id: '{guild_id_str}'. Command sync will be skipped."
+                    f"Failed to record {len(actions)} admin action(s): {e}",
+                    exc_info=True,
                 )
-                # Start background tasks even if guild sync fails
-                self.check_expiry_notifications.start()
-                self.sync_jfa_users_cache_task.start()
-                return
 
-            self.logger.info(
-                f"Running setup_hook to sync commands for guild ID: {guild_id_int}"
-            )
-            guild = discord.Object(id=guild_id_int)
-            self.tree.copy_global_to(guild=guild)
-            await self.tree.sync(guild=guild)
-            self.logger.info(
-                f"Successfully synced commands to guild ID: {guild_id_int}"
+    async def close(self) -> None:
+        """
+        Close the Discord connection and shut down the database and JFA-GO workers.
+
+        Admin actions still waiting in the queue are written before the database
+        worker is shut down.
+        """
+        if self._admin_action_writer_task is not None:
+            # A batch being written when the task is cancelled still completes on
+            # the worker thread, so only the actions left in the queue need a flush
+            self._admin_action_writer_task.cancel()
+            self._admin_action_writer_task = None
+        pending_actions = self._drain_admin_action_queue()
+        if pending_actions:
+            try:
+                await self.run_db(self.db.record_admin_actions, pending_actions)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to record {len(pending_actions)} admin action(s) on shutdown: {e}"
+                )
+        await super().close()
+        self._db_executor.shutdown(wait=False)
+        self._jfa_executor.shutdown(wait=False)
+
+    def _get_command_tree_hash(self) -> str:
+        """
+        Hash the payload of the registered application commands.
+
+        Returns:
+            str: SHA-256 hex digest that changes whenever a command definition changes
+        """
+        # Same payload tree.sync sends; to_dict takes the tree since discord.py 2.4
+        payload = sorted(
+            (command.to_dict(self.tree) for command in self.tree.get_commands()),
+            key=lambda command_dict: (
+                command_dict.get("type", 1),
+                command_dict["name"],
+            ),
+        )
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def _start_background_tasks(self) -> None:
+        """Start the background task loops that are not already running."""
+        if self._admin_action_writer_task is None:
+            self._admin_action_writer_task = asyncio.create_task(
+                self._admin_action_writer(), name="jfa-bot-admin-action-writer"
             )
-            self.logger.info(f"Bot {self.user} is ready and online!")
-            self.logger.info(f"Connected to {len(self.guilds)} guilds.")
-            # Start background tasks here
+        if not self.check_expiry_notifications.is_running():
             self.check_expiry_notifications.start()
+        if not self.sync_jfa_users_cache_task.is_running():
             self.sync_jfa_users_cache_task.start()
-            self.logger.info("All background tasks started.")
-        except Exception as e:
-            self.logger.error(
-                f"Error during setup_hook command sync: {str(e)}", exc_info=True
-            )
-            raise
 
     async def get_thread_members(self, thread: discord.Thread) -> List[discord.Member]:
         """
         Get all members in a Discord thread with retry logic.
 
-        This method attempts to fetch all members of a thread, with built-in retry logic
-        to handle potential Discord API rate limits or temporary failures.
+        When the cached thread member list is complete it is returned directly. Otherwise
+        this method fetches all members of the thread, with built-in retry logic to handle
+        potential Discord API rate limits or temporary failures.
 
         Args:
             thread: The Discord thread object to fetch members from
@@ -249,10 +649,38 @@ class JfaGoBot(discord.Client):
             discord.HTTPException: If fetching thread members fails after all retries
         """
         self.logger.debug(
-            f"Attempting to fetch members for thread: {thread.name} (ID: {thread.id})"
+            "Attempting to fetch members for thread: %s (ID: %s)",
+            thread.name,
+            thread.id,
         )
+        # Use the cached thread member list when it is complete to skip the HTTP fetch.
+        # member_count is approximate and stops counting at 50, so it only proves the
+        # cache complete when it is known and below that cap.
+        cached_thread_members = thread.members
+        member_count = thread.member_count
+        if (
+            cached_thread_members
+            and member_count is not None
+            and member_count < THREAD_MEMBER_COUNT_CAP
+            and len(cached_thread_members) >= member_count
+        ):
+            members = [
+                thread.guild.get_member(thread_member.id)
+                for thread_member in cached_thread_members
+            ]
+            if all(members):
+                self.logger.debug(
+                    "Using %d cached members for thread: %s", len(members), thread.name
+                )
+                return members
+            self.logger.debug(
+                "Cached members for thread %s are incomplete. Fetching from API.",
+                thread.name,
+            )
+
         max_retries = 3
         retry_delay = 1  # seconds
+        max_retry_delay = 8  # seconds
 
         for attempt in range(max_retries):
             try:
@@ -261,7 +689,10 @@ class JfaGoBot(discord.Client):
                     member_obj = thread.guild.get_member(member.id)
                     if member_obj:
                         self.logger.debug(
-                            f"Fetched member {member_obj.display_name} (ID: {member_obj.id}) from thread {thread.name}"
+                            "Fetched member %s (ID: %s) from thread %s",
+                            member_obj.display_name,
+                            member_obj.id,
+                            thread.name,
                         )
                         members.append(member_obj)
                     else:
@@ -277,8 +708,9 @@ class JfaGoBot(discord.Client):
                     f"discord.HTTPException while fetching thread members (attempt {attempt + 1}/{max_retries}) for thread {thread.name}: {str(e)}"
                 )
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                    # Jittered exponential backoff, capped at max_retry_delay
+                    await asyncio.sleep(retry_delay * (0.5 + random.random()))
+                    retry_delay = min(retry_delay * 2, max_retry_delay)
                 else:
                     self.logger.error(
                         f"Failed to fetch thread members for thread {thread.name} after {max_retries} attempts: {str(e)}"
@@ -291,8 +723,6 @@ class JfaGoBot(discord.Client):
                 )
                 if attempt >= max_retries - 1:
                     raise  # Rethrow after final attempt
-                await asyncio.sleep(retry_delay)
-                retry_delay *= 2
 
         # Should not be reachable if loop finishes, but added for safety
         self.logger.error(
@@ -311,38 +741,31 @@ class JfaGoBot(discord.Client):
             action: AdminAction object containing details about the admin action
         """
         try:
-            await (
-                self.wait_until_ready()
-            )  # Ensure the bot is fully connected and cache is populated
-
+            # Check the cheap config flag before waiting on the gateway
             if self.admin_log_channel_id == 0:
                 self.logger.warning(
                     "Skipping Discord admin log: ADMIN_LOG_CHANNEL_ID is not configured."
                 )
                 return
 
+            await (
+                self.wait_until_ready()
+            )  # Ensure the bot is fully connected and cache is populated
+
             self.logger.info(
                 f"Attempting to send admin action log ({action.action_type} by {action.admin_username}) to channel {self.admin_log_channel_id}"
             )
 
-            guild_id_to_check_str = get_config_value("discord.guild_id")
-            if not guild_id_to_check_str:
-                self.logger.error(
-                    "Cannot log admin action to Discord: GUILD_ID is not configured."
-                )
-                return
-            try:
-                guild_id_to_check = int(guild_id_to_check_str)
-            except ValueError:
+            if self._guild_id_int is None:
                 self.logger.error(
-                    f"Cannot log admin action to Discord: GUILD_ID '{guild_id_to_check_str}' is not a valid integer."
+                    "Cannot log admin action to Discord: GUILD_ID is not configured or is not a valid integer."
                 )
                 return
 
-            guild = self.get_guild(guild_id_to_check)
+            guild = self.get_configured_guild()
             if not guild:
                 self.logger.error(
-                    f"Cannot log admin action to Discord: Guild {guild_id_to_check} not found in bot's cache. Ensure GUILD_ID in config.yaml is correct and the bot is in that guild."
+                    f"Cannot log admin action to Discord: Guild {self._guild_id_int} not found in bot's cache. Ensure GUILD_ID in config.yaml is correct and the bot is in that guild."
                 )
                 return
 
@@ -375,14 +798,14 @@ class JfaGoBot(discord.Client):
             )
 
             embed.add_field(
-                name=get_message("admin_log.field_action_type_name"),
+                name=get_static_message("admin_log.field_action_type_name"),
                 value=get_message(
                     "admin_log.field_action_type_value", action_type=action.action_type
                 ),
                 inline=True,
             )
             embed.add_field(
-                name=get_message("admin_log.field_performed_by_name"),
+                name=get_static_message("admin_log.field_performed_by_name"),
                 value=get_message(
                     "admin_log.field_performed_by_value",
                     admin_username=action.admin_username,
@@ -391,7 +814,7 @@ class JfaGoBot(discord.Client):
                 inline=True,
             )
             embed.add_field(
-                name=get_message("admin_log.field_target_user_name"),
+                name=get_static_message("admin_log.field_target_user_name"),
                 value=get_message(
                     "admin_log.field_target_user_value",
                     target_username=action.target_username,
@@ -400,7 +823,7 @@ class JfaGoBot(discord.Client):
                 inline=True,
             )
             embed.add_field(
-                name=get_message("admin_log.field_details_name"),
+                name=get_static_message("admin_log.field_details_name"),
                 value=get_message(
                     "admin_log.field_details_value", details=(action.details or "N/A")
                 ),
@@ -426,6 +849,20 @@ class JfaGoBot(discord.Client):
                 exc_info=True,
             )
 
+    def log_admin_action_in_background(self, action: AdminAction) -> None:
+        """
+        Send an admin action to the admin log channel without waiting for it.
+
+        Commands use this so their confirmation isn't held up by the log channel
+        round trip. log_admin_action handles and logs its own errors.
+
+        Args:
+            action: AdminAction object containing details about the admin action
+        """
+        task = asyncio.create_task(self.log_admin_action(action))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _get_expiry_notification_data(self, expires_at_ts: int) -> dict:
         """
         Helper method to prepare formatted date strings for expiry notifications.
@@ -436,57 +873,106 @@ class JfaGoBot(discord.Client):
         Returns:
             dict: Mapping containing formatted date strings
         """
-        expiry_datetime = datetime.datetime.fromtimestamp(
-            expires_at_ts, tz=datetime.timezone.utc
+        expiry_datetime, expiry_date_str, human_readable_expiry = (
+            _format_expiry_timestamp(expires_at_ts)
         )
         return {
-            "expiry_date_str": expiry_datetime.strftime("%Y-%m-%d %H:%M %Z"),
-            "human_readable_expiry": discord.utils.format_dt(
-                expiry_datetime, style="R"
-            ),
+            "expiry_date_str": expiry_date_str,
+            "human_readable_expiry": human_readable_expiry,
             "expiry_datetime": expiry_datetime,
         }
 
+    async def get_or_fetch_user(self, user_id: int) -> discord.User:
+        """
+        Get a Discord user from the client cache, fetching it from the API only on a miss.
+
+        Args:
+            user_id: The Discord user ID
+
+        Returns:
+            discord.User: The resolved user
+
+        Raises:
+            discord.NotFound: If no user with this ID exists
+            discord.HTTPException: If fetching the user failed
+        """
+        return self.get_user(user_id) or await self.fetch_user(user_id)
+
+    async def _resolve_discord_users(
+        self, user_ids: List[int], max_concurrency: int = 5
+    ) -> Dict[int, Optional[discord.User]]:
+        """
+        Helper method to resolve Discord user objects for a batch of user IDs.
+
+        Users already in the client cache are taken from it; the rest are fetched
+        from the API concurrently, with at most max_concurrency requests in flight.
+
+        Args:
+            user_ids: Discord user IDs to resolve
+            max_concurrency: Maximum number of concurrent fetch_user calls
+
+        Returns:
+            Dict[int, Optional[discord.User]]: User object per ID, None if it could not be found
+        """
+        resolved: Dict[int, Optional[discord.User]] = {}
+        missing_ids = []
+        for user_id in user_ids:
+            cached_user = self.get_user(user_id)
+            if cached_user:
+                resolved[user_id] = cached_user
+            else:
+                missing_ids.append(user_id)
+
+        if missing_ids:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _fetch(user_id: int) -> Optional[discord.User]:
+                async with semaphore:
+                    try:
+                        return await self.fetch_user(user_id)
+                    except discord.HTTPException as e:
+                        self.logger.warning(
+                            f"Could not fetch Discord user with ID {user_id}: {e}"
+                        )
+                        return None
+
+            fetched_users = await asyncio.gather(
+                *(_fetch(user_id) for user_id in missing_ids)
+            )
+            resolved.update(zip(missing_ids, fetched_users))
+
+        return resolved
+
     async def _send_expiry_dm(
         self,
+        discord_user_obj: discord.User,
         user_id_str: str,
         username: str,
         plan_type: str,
-        expires_at_ts: int,
+        expiry_data: dict,
         days_remaining: int,
     ) -> tuple:
         """
         Helper method to send a DM to a user about their expiring account.
 
         Args:
+            discord_user_obj: Resolved Discord user to send the DM to
             user_id_str: Discord user ID as string
             username: User's username
             plan_type: User's plan type in JFA-GO
-            expires_at_ts: Timestamp when account expires
+            expiry_data: Formatted expiry dates from _get_expiry_notification_data
             days_remaining: Days remaining until expiry
 
         Returns:
             tuple: (success_status, status_key)
         """
         try:
-            user_id_int = int(user_id_str)
-            discord_user_obj = self.get_user(user_id_int) or await self.fetch_user(
-                user_id_int
-            )
-
-            if not discord_user_obj:
-                self.logger.warning(
-                    f"Could not find Discord user with ID {user_id_int} for {username}. Skipping DM."
-                )
-                return False, "expiry_notification_summary.dm_status_failed"
-
-            expiry_data = self._get_expiry_notification_data(expires_at_ts)
             expiry_date_str_formatted = expiry_data["expiry_date_str"]
             human_readable_expiry_formatted = expiry_data["human_readable_expiry"]
             expiry_datetime = expiry_data["expiry_datetime"]
 
             # Safely get guild name
-            guild_name = get_config_value("bot_settings.bot_name", "Our Server")
+            guild_name = self._bot_name
             if hasattr(discord_user_obj, "guild") and discord_user_obj.guild:
                 guild_name = discord_user_obj.guild.name
 
@@ -532,10 +1018,6 @@ class JfaGoBot(discord.Client):
                 f"Sent expiry notification DM to {username} ({user_id_str}). Days remaining: {days_remaining}"
             )
 
-            # Update the notification timestamp in DB
-            now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
-            self.db.update_last_notified(user_id_str, now_ts)
-
             return True, "expiry_notification_summary.dm_status_success"
 
         except discord.Forbidden:
@@ -549,13 +1031,16 @@ class JfaGoBot(discord.Client):
             )
             return False, "expiry_notification_summary.dm_status_failed"
         except Exception as e:
-            self.logger.error(
-                f"Unexpected error sending DM to {username} ({user_id_str}): {e}",
-                exc_info=True,
+            self.logger.warning(
+                "Unexpected error sending DM to %s (%s): %s: %s",
+                username,
+                user_id_str,
+                type(e).__name__,
+                e,
             )
             return False, "expiry_notification_summary.dm_status_failed"
 
-    @tasks.loop(hours=6)  # Check every 6 hours (adjust as needed)
+    @tasks.loop(hours=EXPIRY_CHECK_INTERVAL_HOURS)
     async def check_expiry_notifications(self):
         """
         Background task to check for expiring accounts and notify users.
@@ -568,54 +1053,50 @@ class JfaGoBot(discord.Client):
         - notification_settings.expiry_check_fetch_days: How many days ahead to check
         - notification_settings.expiry_notification_interval_days: Minimum days between notifications
         - notification_settings.notification_days_before_expiry: Days before expiry to notify
+        - notification_settings.dm_concurrency: Maximum number of DMs sent at the same time
         """
         await self.wait_until_ready()  # Wait until the bot is fully ready
         self.logger.info("Running check_expiry_notifications task...")
+        # The next run is scheduled relative to this run's start, as tasks.Loop does
+        run_started_ts = int(time.time())
+        # Persist the run time so a restart doesn't trigger an early extra run.
+        # Only bookkeeping, so a failed write must not stop this run or the loop.
+        try:
+            await self.run_db(
+                self.db.set_bot_state, EXPIRY_CHECK_LAST_RUN_KEY, str(run_started_ts)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to record the expiry check run time: {e}")
 
-        # Get settings from config
-        fetch_days = get_config_value(
-            "notification_settings.expiry_check_fetch_days", 4
-        )
-        notification_interval_days = get_config_value(
-            "notification_settings.expiry_notification_interval_days", 2
-        )
-        notification_days_list = get_config_value(
-            "notification_settings.notification_days_before_expiry", [3, 0]
-        )
-        notification_interval_seconds = notification_interval_days * 86400
-        notification_channel_id_str = get_config_value(
-            "discord.notification_channel_id"
-        )
-        notification_channel = None
+        # Get settings from the cached config
+        fetch_days = self._expiry_fetch_days
+        notification_days_set = self._notification_days_set
+        notification_interval_seconds = self._notification_interval_seconds
+        notification_channel = self.get_notification_channel()
 
-        if notification_channel_id_str:
-            try:
-                guild_id = int(get_config_value("discord.guild_id", 0))
-                guild = self.get_guild(guild_id)
-                if guild:
-                    notification_channel = guild.get_channel(
-                        int(notification_channel_id_str)
-                    )
-                if not notification_channel:
-                    self.logger.warning(
-                        f"Expiry notification channel ID {notification_channel_id_str} not found."
-                    )
-            except ValueError:
-                self.logger.warning(
-                    f"Invalid notification_channel_id: {notification_channel_id_str}"
-                )
-        else:
+        if not self._notification_channel_id_str:
             self.logger.info(
                 "No Discord notification channel configured for expiry summaries."
             )
+        elif self._notification_channel_id_int is not None and not notification_channel:
+            self.logger.warning(
+                f"Expiry notification channel ID {self._notification_channel_id_str} not found."
+            )
 
         expiring_user_details_for_summary = []
         notified_count = 0
         failed_dm_count = 0
 
         try:
-            potential_users_data = self.db.get_expiring_users(fetch_days)
-            now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            now_ts = int(time.time())  # Unix epoch, timezone-agnostic
+            # days_remaining and notification_due are computed by SQLite
+            potential_users_data = await self.run_db(
+                self.db.get_expiring_users_due_status,
+                now_ts,
+                fetch_days,
+                notification_days_set,
+                notification_interval_seconds,
+            )
 
             if not potential_users_data:
                 self.logger.info(
@@ -635,19 +1116,36 @@ class JfaGoBot(discord.Client):
                 f"Found {len(potential_users_data)} potential users nearing expiry. Processing notifications..."
             )
 
+            # Resolve every Discord user up front: cache hits first, then one
+            # bounded batch of API fetches for the rest.
+            user_ids_to_resolve = [
+                int(user_row["user_id"])
+                for user_row in potential_users_data
+                # isdecimal, unlike isdigit, rejects characters int() can't parse
+                if str(user_row["user_id"]).isdecimal()
+            ]
+            discord_users = await self._resolve_discord_users(user_ids_to_resolve)
+            pending_dms = []  # (summary index, _send_expiry_dm args) per DM to send
+
             for user_row in potential_users_data:
                 user_id_str = user_row["user_id"]
                 username = user_row["username"]
                 expires_at_ts = user_row["account_expires_at"]
                 plan_type = user_row["plan_type"] or "Unknown Plan"
-                last_notified_at = user_row["last_notified_at"]
                 dm_status_key = "expiry_notification_summary.dm_status_not_attempted"  # Default status
+                expiry_data = None
+
+                # Don't add to summary if user_id is fundamentally broken
+                if not str(user_id_str).isdecimal():
+                    self.logger.error(
+                        f"Invalid user_id format found in database: {user_id_str}"
+                    )
+                    continue
 
                 try:
                     user_id_int = int(user_id_str)
-                    discord_user_obj = self.get_user(
-                        user_id_int
-                    ) or await self.fetch_user(user_id_int)
+                    expiry_data = self._get_expiry_notification_data(expires_at_ts)
+                    discord_user_obj = discord_users.get(user_id_int)
 
                     if not discord_user_obj:
                         self.logger.warning(
@@ -655,94 +1153,135 @@ class JfaGoBot(discord.Client):
                         )
                         failed_dm_count += 1  # Count as failed if user object not found
                         dm_status_key = "expiry_notification_summary.dm_status_failed"
-                        expiry_data = self._get_expiry_notification_data(expires_at_ts)
                         expiring_user_details_for_summary.append(
-                            {
-                                "username": username,
-                                "user_id": user_id_str,
-                                "plan_type_display": plan_type,
-                                "expiry_date_str": expiry_data["expiry_date_str"],
-                                "human_readable_expiry": expiry_data[
+                            ExpirySummaryRow(
+                                username=username,
+                                user_id=user_id_str,
+                                plan_type_display=plan_type,
+                                expiry_date_str=expiry_data["expiry_date_str"],
+                                human_readable_expiry=expiry_data[
                                     "human_readable_expiry"
                                 ],
-                                "dm_status_key": dm_status_key,
-                            }
+                                dm_status_key=dm_status_key,
+                            )
                         )
                         continue
 
-                    remaining_seconds = expires_at_ts - now_ts
-                    days_remaining = remaining_seconds // 86400
-                    should_notify_discord_user = False
-
-                    if days_remaining in notification_days_list:
-                        if (
-                            last_notified_at is None
-                            or (now_ts - last_notified_at)
-                            > notification_interval_seconds
-                        ):
-                            should_notify_discord_user = True
-                        else:
-                            self.logger.debug(
-                                f"User {username} ({user_id_str}) due for {days_remaining}-day notice, but notified recently. Skipping DM."
-                            )
-                            # dm_status_key remains "not_attempted"
+                    days_remaining = user_row["days_remaining"]
+                    should_notify_discord_user = bool(user_row["notification_due"])
 
-                    if should_notify_discord_user:
-                        success_status, dm_status_key = await self._send_expiry_dm(
-                            user_id_str,
+                    if (
+                        not should_notify_discord_user
+                        and days_remaining in notification_days_set
+                    ):
+                        self.logger.debug(
+                            "User %s (%s) due for %s-day notice, but notified recently. Skipping DM.",
                             username,
-                            plan_type,
-                            expires_at_ts,
+                            user_id_str,
                             days_remaining,
                         )
-                        if success_status:
-                            notified_count += 1
-                        else:
-                            failed_dm_count += 1
+                        # dm_status_key remains "not_attempted"
 
-                    # Add to summary list regardless of DM attempt, but with correct status
-                    expiry_data = self._get_expiry_notification_data(expires_at_ts)
+                    # Add to summary list regardless of DM attempt; the status of
+                    # queued DMs is filled in once they have been sent below
                     expiring_user_details_for_summary.append(
-                        {
-                            "username": username,
-                            "user_id": user_id_str,
-                            "plan_type_display": plan_type,
-                            "expiry_date_str": expiry_data["expiry_date_str"],
-                            "human_readable_expiry": expiry_data[
-                                "human_readable_expiry"
-                            ],
-                            "dm_status_key": dm_status_key,
-                        }
+                        ExpirySummaryRow(
+                            username=username,
+                            user_id=user_id_str,
+                            plan_type_display=plan_type,
+                            expiry_date_str=expiry_data["expiry_date_str"],
+                            human_readable_expiry=expiry_data["human_readable_expiry"],
+                            dm_status_key=dm_status_key,
+                        )
                     )
 
-                except ValueError:
-                    self.logger.error(
-                        f"Invalid user_id format found in database: {user_id_str}"
-                    )
-                    # Don't add to summary if user_id is fundamentally broken
+                    if should_notify_discord_user:
+                        pending_dms.append(
+                            (
+                                len(expiring_user_details_for_summary) - 1,
+                                (
+                                    discord_user_obj,
+                                    user_id_str,
+                                    username,
+                                    plan_type,
+                                    expiry_data,
+                                    days_remaining,
+                                ),
+                            )
+                        )
+
                 except Exception as e:
-                    self.logger.error(
-                        f"Error processing expiry for user_id {user_id_str} ({username}): {e}",
-                        exc_info=True,
+                    # Per-user failures are expected on bad rows; log them without
+                    # a traceback and leave exc_info to the task-level handler
+                    self.logger.warning(
+                        "Error processing expiry for user_id %s (%s): %s: %s",
+                        user_id_str,
+                        username,
+                        type(e).__name__,
+                        e,
                     )
                     # Add to summary with failed status if we got this far
-                    expiry_data = self._get_expiry_notification_data(expires_at_ts)
+                    if expiry_data is None:
+                        expiry_data = self._get_expiry_notification_data(expires_at_ts)
                     expiring_user_details_for_summary.append(
-                        {
-                            "username": username,
-                            "user_id": user_id_str,
-                            "plan_type_display": plan_type,
-                            "expiry_date_str": expiry_data["expiry_date_str"],
-                            "human_readable_expiry": expiry_data[
-                                "human_readable_expiry"
-                            ],
-                            "dm_status_key": "expiry_notification_summary.dm_status_failed",  # Mark as failed due to processing error
-                        }
+                        ExpirySummaryRow(
+                            username=username,
+                            user_id=user_id_str,
+                            plan_type_display=plan_type,
+                            expiry_date_str=expiry_data["expiry_date_str"],
+                            human_readable_expiry=expiry_data["human_readable_expiry"],
+                            dm_status_key="expiry_notification_summary.dm_status_failed",  # Mark as failed due to processing error
+                        )
                     )
                     failed_dm_count += (
                         1  # Assume DM failed if user processing had an error
                     )
 
+            # Send the queued DMs concurrently, bounded by notification_settings.dm_concurrency
+            if pending_dms:
+                dm_semaphore = asyncio.Semaphore(self._dm_concurrency)
+                notified_updates = []
+
+                async def _send_expiry_dm_bounded(dm_args: tuple) -> tuple:
+                    async with dm_semaphore:
+                        return await self._send_expiry_dm(*dm_args)
+
+                # On Python 3.12+ the DM tasks start eagerly: a DM that finishes without
+                # suspending (e.g. rejected straight away) never needs an event loop
+                # iteration. Only these tasks are affected, not the loop's task factory.
+                loop = asyncio.get_running_loop()
+                if sys.version_info >= (3, 12):
+                    dm_tasks = [
+                        asyncio.eager_task_factory(
+                            loop, _send_expiry_dm_bounded(dm_args)
+                        )
+                        for _, dm_args in pending_dms
+                    ]
+                else:
+                    dm_tasks = [
+                        loop.create_task(_send_expiry_dm_bounded(dm_args))
+                        for _, dm_args in pending_dms
+                    ]
+                # _send_expiry_dm handles its own errors, so one failed DM doesn't
+                # affect the others
+                dm_results = await asyncio.gather(*dm_tasks)
+                for (summary_index, dm_args), (success_status, dm_status_key) in zip(
+                    pending_dms, dm_results
+                ):
+                    expiring_user_details_for_summary[summary_index] = (
+                        expiring_user_details_for_summary[summary_index]._replace(
+                            dm_status_key=dm_status_key
+                        )
+                    )
+                    if success_status:
+                        notified_count += 1
+                        notified_updates.append((dm_args[1], now_ts))
+                    else:
+                        failed_dm_count += 1
+
+                # Record all successful notifications in one transaction
+                await self.run_db(self.db.batch_update_last_notified, notified_updates)
+
             # Send summary to notification channel if configured
             if notification_channel and expiring_user_details_for_summary:
                 summary_desc_kwargs = {
@@ -758,58 +1297,157 @@ class JfaGoBot(discord.Client):
                     footer_key="expiry_notification_summary.footer_text",
                 )
 
-                field_texts = []
-                for user_detail in expiring_user_details_for_summary:
-                    field_text = get_message(
+                # Status labels are fixed strings, so resolve each distinct key once
+                dm_status_texts = {
+                    dm_status_key: get_static_message(dm_status_key)
+                    for dm_status_key in {
+                        user_detail.dm_status_key
+                        for user_detail in expiring_user_details_for_summary
+                    }
+                }
+                field_texts = [
+                    get_message(
                         "expiry_notification_summary.field_expiring_user_entry",
-                        username=user_detail["username"],
-                        user_id=user_detail["user_id"],
-                        plan_type_display=user_detail["plan_type_display"],
-                        expiry_date_str=user_detail["expiry_date_str"],
-                        human_readable_expiry=user_detail["human_readable_expiry"],
-                        dm_status=get_message(
-                            user_detail["dm_status_key"]
-                        ),  # Get the translated status message
+                        username=user_detail.username,
+                        user_id=user_detail.user_id,
+                        plan_type_display=user_detail.plan_type_display,
+                        expiry_date_str=user_detail.expiry_date_str,
+                        human_readable_expiry=user_detail.human_readable_expiry,
+                        dm_status=dm_status_texts[user_detail.dm_status_key],
                     )
-                    field_texts.append(field_text)
+                    for user_detail in expiring_user_details_for_summary
+                ]
 
                 # Discord embed field values have a limit of 1024 characters.
                 # Descriptions have a limit of 4096. We'll add entries to description to avoid hitting field limits too fast.
-                current_description = summary_embed.description + "\n\n**Details:**\n"
+                # Collect the description in a list and join it once per embed, tracking the
+                # running length instead of re-copying a growing string for every entry
+                description_parts = [summary_embed.description, "\n\n**Details:**\n"]
                 if not field_texts:
-                    current_description += "No specific user details to list for this summary (e.g. all users processed without DMs being attempted or failing)."
+                    description_parts.append(
+                        "No specific user details to list for this summary (e.g. all users processed without DMs being attempted or failing)."
+                    )
+                description_length = sum(map(len, description_parts))
+                summary_embeds = []
 
                 for (
                     text_chunk
                 ) in field_texts:  # Iterate and add to description, handling limits
-                    if (
-                        len(current_description) + len(text_chunk) + 2 > 4096
-                    ):  # +2 for newline chars
-                        summary_embed.description = current_description
-                        await notification_channel.send(embed=summary_embed)
+                    chunk_length = len(text_chunk) + 2  # +2 for newline chars
+                    if description_length + chunk_length > EMBED_DESCRIPTION_LIMIT:
+                        summary_embed.description = "".join(description_parts)
+                        summary_embeds.append(summary_embed)
                         # Start a new embed for overflow
                         summary_embed = create_embed(
                             title_key="expiry_notification_summary.embed_title",
-                            title_kwargs={"continued": True},
                             color_type="info",
                             footer_key="expiry_notification_summary.footer_text",
                         )
-                        current_description = "**Details (continued):**\n"
-                    current_description += text_chunk + "\n\n"
+                        description_parts = ["**Details (continued):**\n"]
+                        description_length = len(description_parts[0])
+                    description_parts.append(text_chunk)
+                    description_parts.append("\n\n")
+                    description_length += chunk_length
 
-                summary_embed.description = current_description.strip()
+                summary_embed.description = "".join(description_parts).strip()
                 if summary_embed.description:  # Ensure there's something to send
-                    await notification_channel.send(embed=summary_embed)
+                    summary_embeds.append(summary_embed)
+
+                # Send the finished embeds in as few messages as Discord allows
+                # (at most 10 embeds and 6000 embed characters per message)
+                embed_batch = []
+                embed_batch_length = 0
+                for summary_embed in summary_embeds:
+                    if embed_batch and (
+                        len(embed_batch) == EMBEDS_PER_MESSAGE_LIMIT
+                        or embed_batch_length + len(summary_embed)
+                        > EMBED_TOTAL_CHARACTERS_LIMIT
+                    ):
+                        await notification_channel.send(embeds=embed_batch)
+                        embed_batch = []
+                        embed_batch_length = 0
+                    embed_batch.append(summary_embed)
+                    embed_batch_length += len(summary_embed)
+                if embed_batch:
+                    await notification_channel.send(embeds=embed_batch)
 
         except Exception as e:
             self.logger.error(
                 f"Error in check_expiry_notifications task: {e}", exc_info=True
             )
+        finally:
+            await self._schedule_next_expiry_check(run_started_ts)
+
+    async def _expiry_check_interval_from(self, from_ts: int) -> int:
+        """
+        Compute the interval until the expiry check that follows a run at from_ts.
+
+        The check normally runs every EXPIRY_CHECK_INTERVAL_HOURS. If a user enters one
+        of the notification days before then, the next run is moved up to that moment
+        (but no sooner than EXPIRY_CHECK_MIN_INTERVAL_SECONDS) so the notice isn't sent
+        up to a full interval late.
+
+        Args:
+            from_ts: Unix timestamp of the run the interval is measured from
+
+        Returns:
+            int: Seconds between that run and the next one
+        """
+        interval_seconds = EXPIRY_CHECK_INTERVAL_HOURS * 3600
+        try:
+            next_start_ts = await self.run_db(
+                self.db.get_next_notification_day_start,
+                from_ts,
+                self._notification_days_set,
+            )
+            if next_start_ts is not None:
+                interval_seconds = min(
+                    interval_seconds,
+                    max(EXPIRY_CHECK_MIN_INTERVAL_SECONDS, next_start_ts - from_ts),
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Error computing the next expiry check time: {e}", exc_info=True
+            )
+        return interval_seconds
+
+    async def _schedule_next_expiry_check(self, run_started_ts: int) -> None:
+        """
+        Set the interval until the next expiry check.
+
+        tasks.Loop adds the interval to the scheduled start of the current iteration,
+        so it is measured from the run's start rather than from when the run finished.
+
+        Args:
+            run_started_ts: Unix timestamp at which the current run started
+        """
+        default_interval_seconds = EXPIRY_CHECK_INTERVAL_HOURS * 3600
+        interval_seconds = await self._expiry_check_interval_from(run_started_ts)
+        if interval_seconds != default_interval_seconds:
+            self.logger.info(
+                f"Next expiry check in {interval_seconds} seconds, when a user enters a notification day."
+            )
+        self.check_expiry_notifications.change_interval(seconds=interval_seconds)
 
     @check_expiry_notifications.before_loop
     async def before_check_expiry(self):
-        """Wait until the bot is ready before starting the loop."""
+        """
+        Wait until the bot is ready and the check interval has passed before starting the loop.
+
+        The first run is delayed until the check that would have followed the last
+        recorded run, so restarting the bot doesn't repeat a check that completed shortly
+        before, nor push back a run that was moved up for a notification day.
+        """
         await self.wait_until_ready()
+        last_run = await self.run_db(self.db.get_bot_state, EXPIRY_CHECK_LAST_RUN_KEY)
+        if last_run and last_run.isdigit():
+            interval_seconds = await self._expiry_check_interval_from(int(last_run))
+            delay = int(last_run) + interval_seconds - time.time()
+            if delay > 0:
+                self.logger.info(
+                    f"Last expiry check ran at {last_run}. Delaying the first check by {int(delay)} seconds."
+                )
+                await asyncio.sleep(delay)
         self.logger.info("Expiry notification task loop is starting.")
 
     @tasks.loop(
@@ -819,14 +1457,12 @@ class JfaGoBot(discord.Client):
         """Periodically fetches all users from JFA-GO and updates the local cache."""
         self.logger.info("Starting JFA-GO user cache sync task...")
         try:
-            users_data, message = await asyncio.to_thread(
-                self.jfa_client.get_all_jfa_users
-            )
+            users_data, message = await self.run_jfa(self.jfa_client.get_all_jfa_users)
             if users_data is not None:
                 self.logger.info(
                     f"Fetched {len(users_data)} users from JFA-GO. Updating local cache."
                 )
-                await asyncio.to_thread(self.db.upsert_jfa_users, users_data)
+                await self.run_db(self.db.upsert_jfa_users, users_data)
                 self.logger.info("JFA-GO user cache sync task completed successfully.")
             else:
                 self.logger.error(
@@ -840,9 +1476,8 @@ class JfaGoBot(discord.Client):
     @sync_jfa_users_cache_task.before_loop
     async def before_sync_jfa_users_cache(self):
         await self.wait_until_ready()
-        interval = get_config_value("sync_settings.jfa_user_sync_interval_hours", 12)
         self.logger.info(
-            f"sync_jfa_users_cache_task is about to start. Interval: {interval} hours."
+            f"sync_jfa_users_cache_task is about to start. Interval: {self._jfa_user_sync_interval_hours} hours."
         )
 
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
@@ -860,6 +1495,8 @@ def register_event_handlers(bot: JfaGoBot):
     Args:
         bot: The JfaGoBot instance to register handlers for
     """
+    # Use the bot's logger instance, resolved once for all handlers
+    bot_logger = getattr(bot, "logger", None) or logging.getLogger("JfaGoBot")
 
     @bot.event
     async def on_ready():
@@ -871,12 +1508,10 @@ def register_event_handlers(bot: JfaGoBot):
         - Number of connected guilds
         - Discord.py version
         """
-        # Use the bot's logger instance
-        bot_logger = (
-            bot.logger
-            if bot and hasattr(bot, "logger")
-            else logging.getLogger("JfaGoBot")
-        )
+        # Guild and channel objects are rebuilt on a fresh session, so drop the cached ones
+        bot._guild = None
+        bot._notification_channel = None
+        bot._role_name_index.clear()
         try:
             bot_logger.info("------ BOT READY ------")
             bot_logger.info(f"Logged in as: {bot.user} (ID: {bot.user.id})")
@@ -885,3 +1520,38 @@ def register_event_handlers(bot: JfaGoBot):
             bot_logger.info("-----------------------")
         except Exception as e:
             bot_logger.error(f"Error in on_ready event: {str(e)}", exc_info=True)
+
+    @bot.event
+    async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+        """
+        Event handler for when a guild channel is deleted.
+
+        Drops the cached expiry notification channel if it was the one deleted, so a
+        channel recreated under the configured ID is looked up again.
+        """
+        if (
+            bot._notification_channel is not None
+            and channel.id == bot._notification_channel.id
+        ):
+            bot_logger.warning(
+                f"Expiry notification channel #{channel.name} ({channel.id}) was deleted."
+            )
+            bot._notification_channel = None
+
+    def _drop_role_name_index(role: discord.Role) -> None:
+        bot._role_name_index.pop(role.guild.id, None)
+
+    @bot.event
+    async def on_guild_role_create(role: discord.Role):
+        """Event handler for a new guild role; invalidates that guild's role index."""
+        _drop_role_name_index(role)
+
+    @bot.event
+    async def on_guild_role_update(before: discord.Role, after: discord.Role):
+        """Event handler for a changed guild role; invalidates that guild's role index."""
+        _drop_role_name_index(after)
+
+    @bot.event
+    async def on_guild_role_delete(role: discord.Role):
+        """Event handler for a deleted guild role; invalidates that guild's role index."""
+        _drop_role_name_index(role)
@@ -3,24 +3,105 @@
 import asyncio
 import datetime
 import logging
+import re
 import sqlite3
-from typing import Optional
+from typing import Iterable, List, Optional
 
 import discord
 from discord import app_commands
 
 from modules.commands.auth import is_in_support_and_authorized
 from modules.models import AdminAction, InviteInfo
-from modules.messaging import get_message, create_embed, create_direct_embed
-from modules.config import get_config_value
+from modules.messaging import (
+    get_message,
+    get_static_message,
+    create_embed,
+    create_direct_embed,
+)
 
 logger = logging.getLogger(__name__)
 
+# Admin command replies mention users for display only, so never ping anyone
+NO_MENTIONS = discord.AllowedMentions.none()
+
+# A Discord user mention, <@id> or the legacy nickname form <@!id>
+USER_MENTION_RE = re.compile(r"<@!?(\d+)>")
+
+# Per-command child loggers, created once at import
+_remove_invite_err_logger = logger.getChild("remove_invite.error")
+_extend_plan_logger = logger.getChild("extend_plan")
+_extend_plan_err_logger = logger.getChild("extend-plan.error")
+
+# (label, seconds) for the extend-plan duration options, in parameter order:
+# months, days, hours, minutes. A month is approximated as 30 days.
+EXTEND_PLAN_DURATION_UNITS = (
+    ("month(s)", 30 * 86400),
+    ("day(s)", 86400),
+    ("hour(s)", 3600),
+    ("minute(s)", 60),
+)
+
+# Characters of the remove-invite confirmation text kept before truncating.
+# Discord's embed description limit is 4096, the rest is left for the suffix.
+REMOVE_INVITE_DESCRIPTION_BUDGET = 4000
+
+
+def _join_lines_within_limit(lines: Iterable[str], limit: int, suffix: str) -> str:
+    """
+    Join lines with newlines, stopping before the text would exceed limit.
+
+    Lines are only taken while they fit, so a long summary is never built in
+    full just to be cut down afterwards.
+
+    Args:
+        lines: The lines to join, in order
+        limit: Maximum length of the joined lines, not counting the suffix
+        suffix: Appended after the last kept line when lines were dropped
+
+    Returns:
+        str: The joined text, ending with suffix if it was truncated
+    """
+    kept_lines: List[str] = []
+    length = -1  # The first line has no newline in front of it
+    for line in lines:
+        length += len(line) + 1
+        if length > limit:
+            return "\n".join(kept_lines) + suffix
+        kept_lines.append(line)
+    return "\n".join(kept_lines)
+
+
 # Define managed paid role names (consistency with user_invite_commands.py)
 # MANAGED_PAID_ROLE_NAMES = {"Ultimate", "Premium", "Standard", "Basic"} # To be replaced by config
 # TRIAL_ROLE_NAME = "Trial" # To be replaced by config
 
 
+def _identification_error_embed(
+    user_identifier: str, error_messages: List[str]
+) -> discord.Embed:
+    """
+    Build the remove-invite reply for an identifier that matched no user.
+
+    Args:
+        user_identifier: The identifier the admin entered
+        error_messages: The identification errors to list in the reply
+
+    Returns:
+        discord.Embed: The error embed
+    """
+    return create_embed(
+        title_key="remove_invite.error_title",
+        description_key="remove_invite.error_user_not_found_detailed",  # A new key might be better
+        description_kwargs={
+            "user_identifier": user_identifier,
+            "error_details": "\n- " + "\n- ".join(error_messages)
+            if error_messages
+            else "No specific error details.",
+        },
+        color_type="error",
+    )
+
+
 async def _process_remove_invite(
     interaction: discord.Interaction, user_identifier: str
 ):
@@ -29,9 +110,31 @@ async def _process_remove_invite(
     Attempts to delete the user from JFA-GO and their invite code from JFA-GO.
     Updates the user's status to 'disabled' in the local database.
     """
-    await interaction.response.defer(ephemeral=True)
     bot_instance = interaction.client
     logger = bot_instance.logger
+
+    # A malformed mention can be rejected without any lookups, so answer it with the
+    # initial response instead of deferring and then editing
+    is_mention = user_identifier.startswith("<@") and user_identifier.endswith(">")
+    mention_match = USER_MENTION_RE.fullmatch(user_identifier) if is_mention else None
+    if is_mention and not mention_match:
+        logger.warning(
+            f"[remove_invite] Invalid Discord mention format: {user_identifier}"
+        )
+        await interaction.response.send_message(
+            embed=_identification_error_embed(
+                user_identifier,
+                [
+                    f"Invalid Discord mention format: '{user_identifier}'.",
+                    f"Could not identify user from identifier '{user_identifier}'. Not a recognized Discord user, and not found as a Jellyfin username in the JFA cache.",
+                ],
+            ),
+            ephemeral=True,
+            allowed_mentions=NO_MENTIONS,
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True)
     db = bot_instance.db
     jfa_client = bot_instance.jfa_client  # Will be used in later steps
 
@@ -43,7 +146,7 @@ async def _process_remove_invite(
     identification_notes = []
     error_messages = []
 
-    logger.info(f"[remove_invite] Initiated for identifier: {user_identifier}")
+    logger.info("[remove_invite] Initiated for identifier: %s", user_identifier)
 
     # 1. User Identification Logic
     try:
@@ -51,13 +154,15 @@ async def _process_remove_invite(
         if user_identifier.isdigit():
             try:
                 user_id_int = int(user_identifier)
-                target_discord_user = await bot_instance.fetch_user(user_id_int)
+                target_discord_user = await bot_instance.get_or_fetch_user(user_id_int)
                 discord_user_id_for_db = str(target_discord_user.id)
                 identification_notes.append(
                     f"Identified as Discord User by ID: {target_discord_user.name} (`{target_discord_user.id}`)."
                 )
                 logger.info(
-                    f"[remove_invite] Identified Discord User by ID: {target_discord_user.name} ({target_discord_user.id})."
+                    "[remove_invite] Identified Discord User by ID: %s (%s).",
+                    target_discord_user.name,
+                    target_discord_user.id,
                 )
             except discord.NotFound:
                 logger.warning(
@@ -74,35 +179,28 @@ async def _process_remove_invite(
                 )
 
         # Attempt to parse as Discord Mention (if not already identified by ID)
-        elif user_identifier.startswith("<@") and user_identifier.endswith(">"):
-            mention_id_str = user_identifier.strip(
-                "<@!>"
-            )  # Handles both <@id> and <@!id>
-            if mention_id_str.isdigit():
-                try:
-                    target_discord_user = await bot_instance.fetch_user(
-                        int(mention_id_str)
-                    )
-                    discord_user_id_for_db = str(target_discord_user.id)
-                    identification_notes.append(
-                        f"Identified as Discord User by mention: {target_discord_user.name} (`{target_discord_user.id}`)."
-                    )
-                    logger.info(
-                        f"[remove_invite] Identified Discord User by mention: {target_discord_user.name} ({target_discord_user.id})."
-                    )
-                except discord.NotFound:
-                    logger.warning(
-                        f"[remove_invite] Discord User for mention '{user_identifier}' (ID: {mention_id_str}) not found."
-                    )
-                    error_messages.append(
-                        f"Discord User for mention '{user_identifier}' not found."
-                    )
-            else:
+        # (malformed mentions were already rejected above)
+        elif mention_match:
+            mention_id_str = mention_match.group(1)
+            try:
+                target_discord_user = await bot_instance.get_or_fetch_user(
+                    int(mention_id_str)
+                )
+                discord_user_id_for_db = str(target_discord_user.id)
+                identification_notes.append(
+                    f"Identified as Discord User by mention: {target_discord_user.name} (`{target_discord_user.id}`)."
+                )
+                logger.info(
+                    "[remove_invite] Identified Discord User by mention: %s (%s).",
+                    target_discord_user.name,
+                    target_discord_user.id,
+                )
+            except discord.NotFound:
                 logger.warning(
-                    f"[remove_invite] Invalid Discord mention format: {user_identifier}"
+                    f"[remove_invite] Discord User for mention '{user_identifier}' (ID: {mention_id_str}) not found."
                 )
                 error_messages.append(
-                    f"Invalid Discord mention format: '{user_identifier}'."
+                    f"Discord User for mention '{user_identifier}' not found."
                 )
 
         # If not identified as a Discord user directly, treat as Jellyfin username and check cache
@@ -110,9 +208,10 @@ async def _process_remove_invite(
             not target_discord_user and not error_messages
         ):  # Only proceed if no Discord user found yet and no fatal ID/mention parse error
             logger.info(
-                f"[remove_invite] Identifier '{user_identifier}' not a direct Discord user. Checking JFA cache for Jellyfin username."
+                "[remove_invite] Identifier '%s' not a direct Discord user. Checking JFA cache for Jellyfin username.",
+                user_identifier,
             )
-            jfa_user_cache_entry = await asyncio.to_thread(
+            jfa_user_cache_entry = await bot_instance.run_db(
                 db.get_jfa_user_from_cache_by_jellyfin_username, user_identifier
             )
             if jfa_user_cache_entry:
@@ -121,20 +220,23 @@ async def _process_remove_invite(
                     f"Identifier '{user_identifier}' matches Jellyfin username '{jellyfin_username_to_process}' in JFA cache."
                 )
                 logger.info(
-                    f"[remove_invite] Found Jellyfin username '{jellyfin_username_to_process}' in JFA cache."
+                    "[remove_invite] Found Jellyfin username '%s' in JFA cache.",
+                    jellyfin_username_to_process,
                 )
                 if jfa_user_cache_entry["discord_id"]:
                     discord_user_id_for_db = jfa_user_cache_entry["discord_id"]
                     try:
                         # Attempt to fetch the Discord user object if we only had Jellyfin username initially
-                        target_discord_user = await bot_instance.fetch_user(
+                        target_discord_user = await bot_instance.get_or_fetch_user(
                             int(discord_user_id_for_db)
                         )
                         identification_notes.append(
                             f"Associated Discord User from JFA cache: {target_discord_user.name} (`{discord_user_id_for_db}`)."
                         )
                         logger.info(
-                            f"[remove_invite] Fetched associated Discord User {target_discord_user.name} from JFA cache (ID: {discord_user_id_for_db})."
+                            "[remove_invite] Fetched associated Discord User %s from JFA cache (ID: %s).",
+                            target_discord_user.name,
+                            discord_user_id_for_db,
                         )
                     except discord.NotFound:
                         logger.warning(
@@ -152,15 +254,17 @@ async def _process_remove_invite(
                         )
                 else:
                     logger.info(
-                        f"[remove_invite] Identifier '{user_identifier}' not found as Jellyfin username in JFA cache."
+                        "[remove_invite] Identifier '%s' not found as Jellyfin username in JFA cache.",
+                        user_identifier,
                     )
                     # No error_message append here, as it might be a Discord user not in cache but directly identifiable next
 
                     # Check if the identifier matches a Discord username in the user_invites table
                     logger.info(
-                        f"[remove_invite] Checking if '{user_identifier}' matches a Discord username in user_invites table."
+                        "[remove_invite] Checking if '%s' matches a Discord username in user_invites table.",
+                        user_identifier,
                     )
-                    invite_by_username = await asyncio.to_thread(
+                    invite_by_username = await bot_instance.run_db(
                         db.get_invite_by_username, user_identifier
                     )
                     if invite_by_username:
@@ -169,18 +273,22 @@ async def _process_remove_invite(
                             f"Found Discord user ID '{discord_user_id_for_db}' for username '{user_identifier}' in user_invites table."
                         )
                         logger.info(
-                            f"[remove_invite] Found Discord user ID '{discord_user_id_for_db}' for username '{user_identifier}' in local database."
+                            "[remove_invite] Found Discord user ID '%s' for username '%s' in local database.",
+                            discord_user_id_for_db,
+                            user_identifier,
                         )
                         try:
                             # Try to fetch the Discord user object
-                            target_discord_user = await bot_instance.fetch_user(
+                            target_discord_user = await bot_instance.get_or_fetch_user(
                                 int(discord_user_id_for_db)
                             )
                             identification_notes.append(
                                 f"Retrieved Discord user object for {target_discord_user.name} (ID: {discord_user_id_for_db})."
                             )
                             logger.info(
-                                f"[remove_invite] Retrieved Discord user object for {target_discord_user.name} (ID: {discord_user_id_for_db})."
+                                "[remove_invite] Retrieved Discord user object for %s (ID: %s).",
+                                target_discord_user.name,
+                                discord_user_id_for_db,
                             )
                         except (discord.NotFound, ValueError):
                             # We have the user ID but couldn't fetch the Discord user object
@@ -192,90 +300,87 @@ async def _process_remove_invite(
                                 f"Could not fetch Discord user object for ID '{discord_user_id_for_db}', but we have the ID for DB operations."
                             )
 
-        # If we have a target_discord_user but no jellyfin_username_to_process yet, try to find it via their Discord ID in cache
+        # If we have a target_discord_user but no jellyfin_username_to_process yet, try to find it via their Discord ID in cache.
+        # The linked-ID lookup and both username fallbacks are resolved with one cache query.
         if target_discord_user and not jellyfin_username_to_process:
             logger.info(
-                f"[remove_invite] Have Discord user {target_discord_user.name}, checking JFA cache for linked Jellyfin username."
+                "[remove_invite] Have Discord user %s, checking JFA cache for linked Jellyfin username.",
+                target_discord_user.name,
+            )
+            discord_name = target_discord_user.name
+            discord_display_name = getattr(
+                target_discord_user, "display_name", discord_name
             )
-            cached_by_discord_id = await asyncio.to_thread(
-                db.get_jfa_user_from_cache_by_discord_id, str(target_discord_user.id)
+            fallback_usernames = [discord_name]
+            if discord_display_name != discord_name:
+                fallback_usernames.append(discord_display_name)
+            cached_user = await bot_instance.run_db(
+                db.resolve_jfa_user_from_cache,
+                str(target_discord_user.id),
+                fallback_usernames,
             )
-            if cached_by_discord_id:
-                jellyfin_username_to_process = cached_by_discord_id["jellyfin_username"]
+            matched_username = cached_user["jellyfin_username"] if cached_user else None
+
+            if cached_user and cached_user["discord_id"] == str(target_discord_user.id):
+                jellyfin_username_to_process = matched_username
                 identification_notes.append(
-                    f"Found linked Jellyfin username '{jellyfin_username_to_process}' in JFA cache for Discord user {target_discord_user.name}."
+                    f"Found linked Jellyfin username '{jellyfin_username_to_process}' in JFA cache for Discord user {discord_name}."
                 )
                 logger.info(
-                    f"[remove_invite] Found Jellyfin username '{jellyfin_username_to_process}' for Discord user {target_discord_user.name} via JFA cache."
+                    "[remove_invite] Found Jellyfin username '%s' for Discord user %s via JFA cache.",
+                    jellyfin_username_to_process,
+                    discord_name,
                 )
             else:
                 logger.info(
-                    f"[remove_invite] No Jellyfin username linked in JFA cache for Discord user {target_discord_user.name}."
+                    "[remove_invite] No Jellyfin username linked in JFA cache for Discord user %s.",
+                    discord_name,
                 )
                 identification_notes.append(
-                    f"No Jellyfin username found in JFA cache for Discord user {target_discord_user.name}."
+                    f"No Jellyfin username found in JFA cache for Discord user {discord_name}."
                 )
 
                 # FALLBACK: Try using the Discord username as a potential Jellyfin username
-                logger.info(
-                    f"[remove_invite] Trying fallback: checking if Discord username '{target_discord_user.name}' exists as Jellyfin username."
-                )
-                jfa_user_by_discord_name = await asyncio.to_thread(
-                    db.get_jfa_user_from_cache_by_jellyfin_username,
-                    target_discord_user.name,
-                )
-                if jfa_user_by_discord_name:
-                    jellyfin_username_to_process = jfa_user_by_discord_name[
-                        "jellyfin_username"
-                    ]
+                if matched_username == discord_name:
+                    jellyfin_username_to_process = matched_username
                     identification_notes.append(
                         f"Fallback: Found Jellyfin username '{jellyfin_username_to_process}' matching Discord username."
                     )
                     logger.info(
-                        f"[remove_invite] Fallback successful: Discord username '{target_discord_user.name}' matches Jellyfin username."
+                        "[remove_invite] Fallback successful: Discord username '%s' matches Jellyfin username.",
+                        discord_name,
                     )
                 else:
                     logger.info(
-                        f"[remove_invite] Fallback failed: Discord username '{target_discord_user.name}' not found as Jellyfin username."
+                        "[remove_invite] Fallback failed: Discord username '%s' not found as Jellyfin username.",
+                        discord_name,
                     )
                     identification_notes.append(
-                        f"Fallback attempt: Discord username '{target_discord_user.name}' not found as Jellyfin username."
+                        f"Fallback attempt: Discord username '{discord_name}' not found as Jellyfin username."
                     )
 
                     # FALLBACK 2: Check if Discord display name matches any Jellyfin username
                     # This might be needed if usernames get altered due to Discord's username system
-                    if (
-                        hasattr(target_discord_user, "display_name")
-                        and target_discord_user.display_name != target_discord_user.name
-                    ):
-                        logger.info(
-                            f"[remove_invite] Trying second fallback: checking if Discord display name '{target_discord_user.display_name}' exists as Jellyfin username."
-                        )
-                        jfa_user_by_display_name = await asyncio.to_thread(
-                            db.get_jfa_user_from_cache_by_jellyfin_username,
-                            target_discord_user.display_name,
-                        )
-                        if jfa_user_by_display_name:
-                            jellyfin_username_to_process = jfa_user_by_display_name[
-                                "jellyfin_username"
-                            ]
+                    if discord_display_name != discord_name:
+                        if matched_username == discord_display_name:
+                            jellyfin_username_to_process = matched_username
                             identification_notes.append(
                                 f"Second fallback: Found Jellyfin username '{jellyfin_username_to_process}' matching Discord display name."
                             )
                             logger.info(
-                                f"[remove_invite] Second fallback successful: Discord display name '{target_discord_user.display_name}' matches Jellyfin username."
+                                "[remove_invite] Second fallback successful: Discord display name '%s' matches Jellyfin username.",
+                                discord_display_name,
                             )
                         else:
                             # FORCE ATTEMPT: Try to delete using display name even if not found in cache
                             logger.info(
-                                f"[remove_invite] Force attempt: Will try to delete JFA-GO user '{target_discord_user.display_name}' even though not in cache."
+                                "[remove_invite] Force attempt: Will try to delete JFA-GO user '%s' even though not in cache.",
+                                discord_display_name,
                             )
                             # Set the jellyfin_username_to_process to force deletion attempt
-                            jellyfin_username_to_process = (
-                                target_discord_user.display_name
-                            )
+                            jellyfin_username_to_process = discord_display_name
                             identification_notes.append(
-                                f"Force attempt: Will try to delete JFA-GO user '{target_discord_user.display_name}' directly."
+                                f"Force attempt: Will try to delete JFA-GO user '{discord_display_name}' directly."
                             )
 
     except Exception as e:
@@ -294,7 +399,8 @@ async def _process_remove_invite(
         if not error_messages:
             # FORCE ATTEMPT: Try using the original identifier as Jellyfin username
             logger.info(
-                f"[remove_invite] Force attempt: Will try to delete JFA-GO user '{user_identifier}' even though not in cache."
+                "[remove_invite] Force attempt: Will try to delete JFA-GO user '%s' even though not in cache.",
+                user_identifier,
             )
             # Set the jellyfin_username_to_process to force deletion attempt
             jellyfin_username_to_process = user_identifier
@@ -310,583 +416,616 @@ async def _process_remove_invite(
                 f"[remove_invite] Failed to identify user from '{user_identifier}'. Errors: {'; '.join(error_messages)}"
             )
             await interaction.edit_original_response(
-                embed=create_embed(
-                    title_key="remove_invite.error_title",
-                    description_key="remove_invite.error_user_not_found_detailed",  # A new key might be better
-                    description_kwargs={
-                        "user_identifier": user_identifier,
-                        "error_details": "\\n- " + "\\n- ".join(error_messages)
-                        if error_messages
-                        else "No specific error details.",
-                    },
-                    color_type="error",
-                )
+                embed=_identification_error_embed(user_identifier, error_messages),
+                allowed_mentions=NO_MENTIONS,
             )
             return
 
     # At this point, we should have at least one of target_discord_user or jellyfin_username_to_process
     # Or discord_user_id_for_db if a Jellyfin user had a Discord ID in cache that wasn't fetchable but is still valid for DB ops.
 
-    # --- Begin Step 2: JFA-GO User Deletion ---
-    if jellyfin_username_to_process:
-        logger.info(
-            f"[remove_invite] Attempting to delete JFA-GO user: '{jellyfin_username_to_process}'."
-        )
-        try:
-            success, message = await asyncio.to_thread(
-                jfa_client.delete_jfa_user_by_username, jellyfin_username_to_process
-            )
-            if success:
+    # Serialize removals of the same user so two admins can't race each other through
+    # the JFA-GO and database steps below; other users proceed concurrently
+    lock_key = (
+        f"discord:{discord_user_id_for_db}"
+        if discord_user_id_for_db
+        else f"jellyfin:{jellyfin_username_to_process}"
+    )
+    async with bot_instance.target_lock(lock_key):
+        # --- Begin Step 2: JFA-GO User Deletion ---
+        # Steps 2-4 only depend on the identification above, so they run concurrently.
+        # Each step collects its own notes and errors, which are merged back in step
+        # order afterwards so the summary reads the same as a sequential run.
+        async def _delete_jfa_user(notes: list, errors: list) -> None:
+            if jellyfin_username_to_process:
                 logger.info(
-                    f"[remove_invite] Successfully deleted JFA-GO user: '{jellyfin_username_to_process}'."
-                )
-                identification_notes.append(
-                    f"Successfully deleted Jellyfin user '{jellyfin_username_to_process}' from JFA-GO."
+                    "[remove_invite] Attempting to delete JFA-GO user: '%s'.",
+                    jellyfin_username_to_process,
                 )
+                try:
+                    success, message = await bot_instance.run_jfa(
+                        jfa_client.delete_jfa_user_by_username,
+                        jellyfin_username_to_process,
+                    )
+                    if success:
+                        logger.info(
+                            "[remove_invite] Successfully deleted JFA-GO user: '%s'.",
+                            jellyfin_username_to_process,
+                        )
+                        notes.append(
+                            f"Successfully deleted Jellyfin user '{jellyfin_username_to_process}' from JFA-GO."
+                        )
+                    else:
+                        # Common case: User not found in JFA-GO. This is not a critical error for the command's continuation.
+                        logger.warning(
+                            f"[remove_invite] Failed to delete JFA-GO user '{jellyfin_username_to_process}': {message}"
+                        )
+                        notes.append(
+                            f"Attempt to delete Jellyfin user '{jellyfin_username_to_process}' from JFA-GO: {message}."
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"[remove_invite] Error during JFA-GO user deletion for '{jellyfin_username_to_process}': {e}",
+                        exc_info=True,
+                    )
+                    errors.append(
+                        f"Error deleting Jellyfin user '{jellyfin_username_to_process}' from JFA-GO: {str(e)}."
+                    )
+                    notes.append(
+                        f"An error occurred while trying to delete Jellyfin user '{jellyfin_username_to_process}' from JFA-GO."
+                    )
             else:
-                # Common case: User not found in JFA-GO. This is not a critical error for the command's continuation.
-                logger.warning(
-                    f"[remove_invite] Failed to delete JFA-GO user '{jellyfin_username_to_process}': {message}"
-                )
-                identification_notes.append(
-                    f"Attempt to delete Jellyfin user '{jellyfin_username_to_process}' from JFA-GO: {message}."
-                )
-        except Exception as e:
-            logger.error(
-                f"[remove_invite] Error during JFA-GO user deletion for '{jellyfin_username_to_process}': {e}",
-                exc_info=True,
-            )
-            error_messages.append(
-                f"Error deleting Jellyfin user '{jellyfin_username_to_process}' from JFA-GO: {str(e)}."
-            )
-            identification_notes.append(
-                f"An error occurred while trying to delete Jellyfin user '{jellyfin_username_to_process}' from JFA-GO."
-            )
-    else:
-        logger.info(
-            "[remove_invite] No Jellyfin username identified; skipping JFA-GO user deletion step."
-        )
-        identification_notes.append(
-            "No specific Jellyfin username found to attempt JFA-GO user deletion."
-        )
-    # --- End Step 2 ---
-
-    # --- Begin Step 3: Retrieve Local Invite & Attempt JFA-GO Invite Code Deletion ---
-    original_invite_code: Optional[str] = None
-    if discord_user_id_for_db:
-        logger.info(
-            f"[remove_invite] Attempting to retrieve local invite info for Discord ID: {discord_user_id_for_db}"
-        )
-        try:
-            # We need the InviteInfo model here if it's not already imported
-            # from modules.models import InviteInfo (ensure this import is at the top of the file)
-            invite_info_record: Optional[InviteInfo] = await asyncio.to_thread(
-                db.get_invite_info, discord_user_id_for_db
-            )
-            if invite_info_record:
-                original_invite_code = invite_info_record.code
                 logger.info(
-                    f"[remove_invite] Found local invite code '{original_invite_code}' for Discord ID {discord_user_id_for_db}."
+                    "[remove_invite] No Jellyfin username identified; skipping JFA-GO user deletion step."
                 )
-                identification_notes.append(
-                    f"Found JFA-GO invite code '{original_invite_code}' in local DB for the Discord user."
+                notes.append(
+                    "No specific Jellyfin username found to attempt JFA-GO user deletion."
                 )
 
-                # Now attempt to delete this JFA-GO invite code
+        # --- End Step 2 ---
+
+        # --- Begin Step 3: Retrieve Local Invite & Attempt JFA-GO Invite Code Deletion ---
+        async def _delete_jfa_invite_code(notes: list, errors: list) -> None:
+            original_invite_code: Optional[str] = None
+            if discord_user_id_for_db:
                 logger.info(
-                    f"[remove_invite] Attempting to delete JFA-GO invite code: '{original_invite_code}'."
+                    "[remove_invite] Attempting to retrieve local invite info for Discord ID: %s",
+                    discord_user_id_for_db,
                 )
-                success, message = await asyncio.to_thread(
-                    jfa_client.delete_jfa_invite, original_invite_code
-                )
-                if success:
-                    logger.info(
-                        f"[remove_invite] Successfully deleted JFA-GO invite code: '{original_invite_code}'."
+                try:
+                    # We need the InviteInfo model here if it's not already imported
+                    # from modules.models import InviteInfo (ensure this import is at the top of the file)
+                    invite_info_record: Optional[InviteInfo]
+                    invite_info_record = await bot_instance.run_db(
+                        db.get_invite_info, discord_user_id_for_db
                     )
-                    identification_notes.append(
-                        f"Successfully deleted JFA-GO invite code '{original_invite_code}'."
+                    if invite_info_record:
+                        original_invite_code = invite_info_record.code
+                        logger.info(
+                            "[remove_invite] Found local invite code '%s' for Discord ID %s.",
+                            original_invite_code,
+                            discord_user_id_for_db,
+                        )
+                        notes.append(
+                            f"Found JFA-GO invite code '{original_invite_code}' in local DB for the Discord user."
+                        )
+
+                        # Now attempt to delete this JFA-GO invite code
+                        logger.info(
+                            "[remove_invite] Attempting to delete JFA-GO invite code: '%s'.",
+                            original_invite_code,
+                        )
+                        success, message = await bot_instance.run_jfa(
+                            jfa_client.delete_jfa_invite, original_invite_code
+                        )
+                        if success:
+                            logger.info(
+                                "[remove_invite] Successfully deleted JFA-GO invite code: '%s'.",
+                                original_invite_code,
+                            )
+                            notes.append(
+                                f"Successfully deleted JFA-GO invite code '{original_invite_code}'."
+                            )
+                        else:
+                            logger.warning(
+                                f"[remove_invite] Failed to delete JFA-GO invite code '{original_invite_code}': {message}"
+                            )
+                            notes.append(
+                                f"Attempt to delete JFA-GO invite code '{original_invite_code}': {message}."
+                            )
+                    else:
+                        logger.info(
+                            "[remove_invite] No local invite record found for Discord ID %s.",
+                            discord_user_id_for_db,
+                        )
+                        notes.append(
+                            "No active JFA-GO invite code found in local DB for the Discord user (no record to delete from JFA-GO)."
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"[remove_invite] Error during local invite retrieval or JFA-GO invite code deletion for Discord ID {discord_user_id_for_db}: {e}",
+                        exc_info=True,
                     )
-                else:
-                    logger.warning(
-                        f"[remove_invite] Failed to delete JFA-GO invite code '{original_invite_code}': {message}"
+                    errors.append(
+                        f"Error processing local invite/JFA-GO invite code deletion: {str(e)}."
                     )
-                    identification_notes.append(
-                        f"Attempt to delete JFA-GO invite code '{original_invite_code}': {message}."
+                    notes.append(
+                        "An error occurred while retrieving local invite details or deleting the JFA-GO invite code."
                     )
             else:
                 logger.info(
-                    f"[remove_invite] No local invite record found for Discord ID {discord_user_id_for_db}."
+                    "[remove_invite] No Discord ID available for bot-managed JFA-GO invite code processing."
                 )
-                identification_notes.append(
-                    "No active JFA-GO invite code found in local DB for the Discord user (no record to delete from JFA-GO)."
-                )
-        except Exception as e:
-            logger.error(
-                f"[remove_invite] Error during local invite retrieval or JFA-GO invite code deletion for Discord ID {discord_user_id_for_db}: {e}",
-                exc_info=True,
-            )
-            error_messages.append(
-                f"Error processing local invite/JFA-GO invite code deletion: {str(e)}."
-            )
-            identification_notes.append(
-                "An error occurred while retrieving local invite details or deleting the JFA-GO invite code."
-            )
-    else:
-        logger.info(
-            "[remove_invite] No Discord ID available for bot-managed JFA-GO invite code processing."
-        )
-        # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
-        if not (jellyfin_username_to_process and not target_discord_user):
-            identification_notes.append(
-                "Bot-managed JFA-GO invite code actions skipped (no linked Discord User ID for this operation)."
-            )
-    # --- End Step 3 ---
-
-    # --- Begin Step 4: Role Reversion (if Discord User identified) ---
-    role_reversion_summary = []
-    if (
-        target_discord_user and interaction.guild
-    ):  # Ensure we have a guild context for roles
-        try:
-            member = interaction.guild.get_member(
-                target_discord_user.id
-            )  # Fetch as Member object for roles
-            if member:
-                logger.info(
-                    f"[remove_invite] Processing role reversion for member: {member.display_name}"
-                )
-
-                trial_role_name = get_config_value("discord.trial_user_role_name")
-                trial_role_obj = (
-                    discord.utils.get(interaction.guild.roles, name=trial_role_name)
-                    if trial_role_name
-                    else None
-                )
-
-                plan_to_role_map = get_config_value(
-                    "commands.create_user_invite.plan_to_role_map", {}
-                )
-                paid_role_names_or_ids_to_remove = [
-                    str(r) for r in plan_to_role_map.values()
-                ]  # Convert to string for consistent comparison
+                # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
+                if not (jellyfin_username_to_process and not target_discord_user):
+                    notes.append(
+                        "Bot-managed JFA-GO invite code actions skipped (no linked Discord User ID for this operation)."
+                    )
 
-                roles_actually_removed = []
-                roles_failed_to_remove = []
-                trial_role_kept_message = ""
+        # --- End Step 3 ---
 
-                for role in member.roles:
-                    # Check if it's the trial role
-                    if trial_role_obj and role.id == trial_role_obj.id:
-                        role_reversion_summary.append(
-                            get_message(
-                                "admin_remove_invite.role_trial_kept",
-                                role_name=role.name,
-                            )
+        # --- Begin Step 4: Role Reversion (if Discord User identified) ---
+        async def _revert_roles(role_reversion_summary: list) -> None:
+            if (
+                target_discord_user and interaction.guild
+            ):  # Ensure we have a guild context for roles
+                try:
+                    member = interaction.guild.get_member(
+                        target_discord_user.id
+                    )  # Fetch as Member object for roles
+                    if member:
+                        logger.info(
+                            "[remove_invite] Processing role reversion for member: %s",
+                            member.display_name,
                         )
-                        trial_role_kept_message = get_message(
-                            "admin_remove_invite.role_trial_kept", role_name=role.name
+
+                        trial_role_obj = bot_instance.get_role_by_name(
+                            interaction.guild, bot_instance.trial_role_name
                         )
-                        logger.info(
-                            f"[remove_invite] Kept trial role '{role.name}' for {member.display_name}."
+                        # Role names or IDs as strings, for consistent comparison
+                        paid_role_names_or_ids_to_remove = (
+                            bot_instance.managed_paid_role_keys
                         )
-                        continue  # Skip to next role, do not remove trial role
 
-                    # Check if it's a paid plan role that should be removed
-                    if (
-                        str(role.name) in paid_role_names_or_ids_to_remove
-                        or str(role.id) in paid_role_names_or_ids_to_remove
-                    ):
-                        try:
-                            await member.remove_roles(
-                                role,
-                                reason=f"/remove_invite by {interaction.user.display_name}",
-                            )
-                            roles_actually_removed.append(role.name)
-                            role_reversion_summary.append(
-                                get_message(
-                                    "admin_remove_invite.role_paid_removed",
+                        roles_to_remove = []
+                        roles_actually_removed = []
+                        roles_failed_to_remove = []
+                        trial_role_kept_message = ""
+
+                        for role in member.roles:
+                            # Check if it's the trial role
+                            if trial_role_obj and role.id == trial_role_obj.id:
+                                role_reversion_summary.append(
+                                    get_message(
+                                        "admin_remove_invite.role_trial_kept",
+                                        role_name=role.name,
+                                    )
+                                )
+                                trial_role_kept_message = get_message(
+                                    "admin_remove_invite.role_trial_kept",
                                     role_name=role.name,
                                 )
-                            )
-                            logger.info(
-                                f"[remove_invite] Removed paid role '{role.name}' from {member.display_name}."
-                            )
-                        except discord.Forbidden:
-                            roles_failed_to_remove.append(role.name)
+                                logger.info(
+                                    "[remove_invite] Kept trial role '%s' for %s.",
+                                    role.name,
+                                    member.display_name,
+                                )
+                                continue  # Skip to next role, do not remove trial role
+
+                            # Check if it's a paid plan role that should be removed
+                            if (
+                                str(role.name) in paid_role_names_or_ids_to_remove
+                                or str(role.id) in paid_role_names_or_ids_to_remove
+                            ):
+                                roles_to_remove.append(role)
+
+                        # Remove all paid roles with a single member edit instead of one
+                        # request per role; the edit succeeds or fails as a whole
+                        if roles_to_remove:
+                            failure_message_key = None
+                            try:
+                                await member.remove_roles(
+                                    *roles_to_remove,
+                                    reason=f"/remove_invite by {interaction.user.display_name}",
+                                    atomic=False,
+                                )
+                                logger.info(
+                                    "[remove_invite] Removed paid role(s) %s from %s.",
+                                    ", ".join(repr(r.name) for r in roles_to_remove),
+                                    member.display_name,
+                                )
+                            except discord.Forbidden:
+                                failure_message_key = "admin_remove_invite.role_paid_remove_failed_permission"
+                                logger.warning(
+                                    f"[remove_invite] Failed to remove paid role(s) from {member.display_name} due to permissions."
+                                )
+                            except discord.HTTPException as e:
+                                failure_message_key = (
+                                    "admin_remove_invite.role_paid_remove_failed_api"
+                                )
+                                logger.error(
+                                    f"[remove_invite] Failed to remove paid role(s) from {member.display_name} due to API error: {e}"
+                                )
+
+                            for role in roles_to_remove:
+                                if failure_message_key:
+                                    roles_failed_to_remove.append(role.name)
+                                    role_reversion_summary.append(
+                                        get_message(
+                                            failure_message_key, role_name=role.name
+                                        )
+                                    )
+                                else:
+                                    roles_actually_removed.append(role.name)
+                                    role_reversion_summary.append(
+                                        get_message(
+                                            "admin_remove_invite.role_paid_removed",
+                                            role_name=role.name,
+                                        )
+                                    )
+
+                        if (
+                            not roles_actually_removed
+                            and not roles_failed_to_remove
+                            and not trial_role_kept_message
+                        ):
                             role_reversion_summary.append(
-                                get_message(
-                                    "admin_remove_invite.role_paid_remove_failed_permission",
-                                    role_name=role.name,
+                                get_static_message(
+                                    "admin_remove_invite.role_no_relevant_roles_found"
                                 )
                             )
-                            logger.warning(
-                                f"[remove_invite] Failed to remove role '{role.name}' from {member.display_name} due to permissions."
-                            )
-                        except discord.HTTPException as e:
-                            roles_failed_to_remove.append(role.name)
+                        elif (
+                            not roles_actually_removed
+                            and not trial_role_kept_message
+                            and roles_failed_to_remove
+                        ):
                             role_reversion_summary.append(
-                                get_message(
-                                    "admin_remove_invite.role_paid_remove_failed_api",
-                                    role_name=role.name,
+                                get_static_message(
+                                    "admin_remove_invite.role_paid_none_removed_only_failures"
                                 )
                             )
-                            logger.error(
-                                f"[remove_invite] Failed to remove role '{role.name}' from {member.display_name} due to API error: {e}"
-                            )
 
-                if (
-                    not roles_actually_removed
-                    and not roles_failed_to_remove
-                    and not trial_role_kept_message
-                ):
-                    role_reversion_summary.append(
-                        get_message("admin_remove_invite.role_no_relevant_roles_found")
+                    else:
+                        logger.warning(
+                            f"[remove_invite] Could not fetch member object for {target_discord_user.display_name} ({target_discord_user.id}) in guild {interaction.guild.name}. Skipping role reversion."
+                        )
+                        role_reversion_summary.append(
+                            get_static_message(
+                                "admin_remove_invite.role_reversion_skipped_no_member"
+                            )
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"[remove_invite] Error during role reversion for {target_discord_user.name if target_discord_user else 'Unknown User'}: {e}",
+                        exc_info=True,
                     )
-                elif (
-                    not roles_actually_removed
-                    and not trial_role_kept_message
-                    and roles_failed_to_remove
-                ):
                     role_reversion_summary.append(
                         get_message(
-                            "admin_remove_invite.role_paid_none_removed_only_failures"
+                            "admin_remove_invite.role_reversion_error",
+                            error_message=str(e),
                         )
                     )
-
-            else:
-                logger.warning(
-                    f"[remove_invite] Could not fetch member object for {target_discord_user.display_name} ({target_discord_user.id}) in guild {interaction.guild.name}. Skipping role reversion."
-                )
+            elif not target_discord_user:
                 role_reversion_summary.append(
-                    get_message("admin_remove_invite.role_reversion_skipped_no_member")
-                )
-        except Exception as e:
-            logger.error(
-                f"[remove_invite] Error during role reversion for {target_discord_user.name if target_discord_user else 'Unknown User'}: {e}",
-                exc_info=True,
-            )
-            role_reversion_summary.append(
-                get_message(
-                    "admin_remove_invite.role_reversion_error", error_message=str(e)
+                    get_static_message(
+                        "admin_remove_invite.role_reversion_skipped_no_discord_user"
+                    )
                 )
-            )
-    elif not target_discord_user:
-        role_reversion_summary.append(
-            get_message("admin_remove_invite.role_reversion_skipped_no_discord_user")
-        )
 
-    if role_reversion_summary:
-        identification_notes.append("**Role Reversion Actions:**")  # Add a sub-header
-        identification_notes.extend(
-            [f"  - {rs}" for rs in role_reversion_summary]
-        )  # Indent summary items
-
-    # --- Begin Step 5: Update Local DB Status, Log, and Confirm ---
-    status_updated_in_db = False
-    if discord_user_id_for_db:
-        logger.info(
-            f"[remove_invite] Attempting to update status to 'disabled' for Discord ID: {discord_user_id_for_db} in local DB."
+        jfa_user_notes: list = []
+        jfa_user_errors: list = []
+        invite_code_notes: list = []
+        invite_code_errors: list = []
+        role_reversion_summary: list = []
+        await asyncio.gather(
+            _delete_jfa_user(jfa_user_notes, jfa_user_errors),
+            _delete_jfa_invite_code(invite_code_notes, invite_code_errors),
+            _revert_roles(role_reversion_summary),
         )
-        try:
-            status_updated_in_db = await asyncio.to_thread(
-                db.update_user_invite_status, discord_user_id_for_db, "disabled"
+        identification_notes.extend(jfa_user_notes)
+        identification_notes.extend(invite_code_notes)
+        error_messages.extend(jfa_user_errors)
+        error_messages.extend(invite_code_errors)
+        # --- End Step 4 ---
+
+        if role_reversion_summary:
+            identification_notes.append(
+                "**Role Reversion Actions:**"
+            )  # Add a sub-header
+            identification_notes.extend(
+                [f"  - {rs}" for rs in role_reversion_summary]
+            )  # Indent summary items
+
+        # --- Begin Step 5: Update Local DB Status, Log, and Confirm ---
+        status_updated_in_db = False
+        if discord_user_id_for_db:
+            logger.info(
+                "[remove_invite] Attempting to update status to 'disabled' for Discord ID: %s in local DB.",
+                discord_user_id_for_db,
             )
-            if status_updated_in_db:
-                logger.info(
-                    f"[remove_invite] Successfully updated status to 'disabled' for Discord ID {discord_user_id_for_db}."
+            try:
+                status_updated_in_db = await bot_instance.run_db(
+                    db.update_user_invite_status, discord_user_id_for_db, "disabled"
                 )
-                identification_notes.append(
-                    "Successfully set user status to 'disabled' in the local database."
+                if status_updated_in_db:
+                    logger.info(
+                        "[remove_invite] Successfully updated status to 'disabled' for Discord ID %s.",
+                        discord_user_id_for_db,
+                    )
+                    identification_notes.append(
+                        "Successfully set user status to 'disabled' in the local database."
+                    )
+                else:
+                    # This might happen if the user never had an invite record or another DB issue.
+                    logger.warning(
+                        f"[remove_invite] Could not update status to 'disabled' for Discord ID {discord_user_id_for_db} (no record or DB error)."
+                    )
+                    identification_notes.append(
+                        "Could not update user status to 'disabled' in local DB (no existing record or a database error occurred)."
+                    )
+            except Exception as e:
+                logger.error(
+                    f"[remove_invite] Error updating local DB status for Discord ID {discord_user_id_for_db}: {e}",
+                    exc_info=True,
                 )
-            else:
-                # This might happen if the user never had an invite record or another DB issue.
-                logger.warning(
-                    f"[remove_invite] Could not update status to 'disabled' for Discord ID {discord_user_id_for_db} (no record or DB error)."
+                error_messages.append(
+                    f"Error updating user status in local DB: {str(e)}."
                 )
                 identification_notes.append(
-                    "Could not update user status to 'disabled' in local DB (no existing record or a database error occurred)."
+                    "An error occurred while updating user status in the local database."
                 )
-        except Exception as e:
-            logger.error(
-                f"[remove_invite] Error updating local DB status for Discord ID {discord_user_id_for_db}: {e}",
-                exc_info=True,
-            )
-            error_messages.append(f"Error updating user status in local DB: {str(e)}.")
-            identification_notes.append(
-                "An error occurred while updating user status in the local database."
-            )
-    else:  # discord_user_id_for_db is None
-        logger.info(
-            "[remove_invite] No Discord ID available for local database status update."
-        )
-
-        # If we have a jellyfin_username but no Discord ID, try to find the Discord ID from user_invites
-        if jellyfin_username_to_process:
+        else:  # discord_user_id_for_db is None
             logger.info(
-                f"[remove_invite] Trying to find Discord ID for Jellyfin username '{jellyfin_username_to_process}' in user_invites table."
+                "[remove_invite] No Discord ID available for local database status update."
             )
-            try:
-                # Try to find by username in the user_invites table
-                user_invite_record = await asyncio.to_thread(
-                    db.get_invite_by_username, jellyfin_username_to_process
-                )
 
-                if user_invite_record:
-                    found_discord_id = user_invite_record["user_id"]
-                    logger.info(
-                        f"[remove_invite] Found Discord ID '{found_discord_id}' for Jellyfin username '{jellyfin_username_to_process}' in user_invites table."
+            # If we have a jellyfin_username but no Discord ID, try to find the Discord ID from user_invites
+            if jellyfin_username_to_process:
+                logger.info(
+                    "[remove_invite] Trying to find Discord ID for Jellyfin username '%s' in user_invites table.",
+                    jellyfin_username_to_process,
+                )
+                try:
+                    # Exact username match first, then pattern matching, then the
+                    # status update, all in one database transaction
+                    (
+                        found_discord_id,
+                        match_type,
+                        status_updated_in_db,
+                    ) = await bot_instance.run_db(
+                        db.disable_invite_by_username, jellyfin_username_to_process
                     )
-
-                    # Update the status
-                    status_updated_in_db = await asyncio.to_thread(
-                        db.update_user_invite_status, found_discord_id, "disabled"
+                    match_description = (
+                        "in user_invites"
+                        if match_type == "exact"
+                        else "via pattern matching"
                     )
 
-                    if status_updated_in_db:
+                    if found_discord_id is None:
                         logger.info(
-                            f"[remove_invite] Successfully updated status to 'disabled' for Discord ID {found_discord_id} found via Jellyfin username."
+                            "[remove_invite] No Discord ID found for Jellyfin username '%s' in user_invites table.",
+                            jellyfin_username_to_process,
                         )
+                        # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
                         identification_notes.append(
-                            f"Found Discord ID in user_invites and set status to 'disabled' for Jellyfin username '{jellyfin_username_to_process}'."
+                            f"Could not find any Discord ID for Jellyfin username '{jellyfin_username_to_process}' in local database."
+                        )
+                    elif status_updated_in_db:
+                        logger.info(
+                            "[remove_invite] Successfully updated status to 'disabled' for Discord ID %s found %s for Jellyfin username '%s'.",
+                            found_discord_id,
+                            match_description,
+                            jellyfin_username_to_process,
+                        )
+                        identification_notes.append(
+                            f"Found Discord ID {match_description} and set status to 'disabled' for Jellyfin username '{jellyfin_username_to_process}'."
                         )
                     else:
                         logger.warning(
-                            f"[remove_invite] Found Discord ID '{found_discord_id}' but failed to update status."
+                            f"[remove_invite] Found Discord ID '{found_discord_id}' {match_description} but failed to update status."
                         )
                         identification_notes.append(
-                            f"Found Discord ID in user_invites but failed to update status for Jellyfin username '{jellyfin_username_to_process}'."
+                            f"Found Discord ID {match_description} but failed to update status for Jellyfin username '{jellyfin_username_to_process}'."
                         )
-                else:
-                    logger.info(
-                        f"[remove_invite] No Discord ID found for Jellyfin username '{jellyfin_username_to_process}' in user_invites table."
+                except Exception as e:
+                    logger.error(
+                        f"[remove_invite] Error trying to find and update status for Jellyfin username '{jellyfin_username_to_process}': {e}",
+                        exc_info=True,
                     )
-
-                    # Try a reverse lookup - find any user record with this invite code
-                    logger.info(
-                        f"[remove_invite] Trying to find invite records by username pattern matching '{jellyfin_username_to_process}'."
+                    identification_notes.append(
+                        f"Error trying to find and update status for Jellyfin username '{jellyfin_username_to_process}' in local database."
                     )
-                    user_invites = await asyncio.to_thread(
-                        db.find_invites_by_username_pattern,
-                        jellyfin_username_to_process,
+            else:
+                # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
+                if not (jellyfin_username_to_process and not target_discord_user):
+                    identification_notes.append(
+                        "Local database status update skipped (no linked Discord User ID for this operation)."
                     )
 
-                    if user_invites and len(user_invites) > 0:
-                        found_discord_id = user_invites[0]["user_id"]
-                        logger.info(
-                            f"[remove_invite] Found Discord ID '{found_discord_id}' via pattern matching for '{jellyfin_username_to_process}'."
-                        )
-
-                        # Update the status
-                        status_updated_in_db = await asyncio.to_thread(
-                            db.update_user_invite_status, found_discord_id, "disabled"
-                        )
-
-                        if status_updated_in_db:
-                            logger.info(
-                                f"[remove_invite] Successfully updated status to 'disabled' for Discord ID {found_discord_id} found via pattern matching."
-                            )
-                            identification_notes.append(
-                                f"Found Discord ID via pattern matching and set status to 'disabled' for Jellyfin username '{jellyfin_username_to_process}'."
-                            )
-                        else:
-                            logger.warning(
-                                f"[remove_invite] Found Discord ID '{found_discord_id}' via pattern matching but failed to update status."
-                            )
-                            identification_notes.append(
-                                f"Found Discord ID via pattern matching but failed to update status for Jellyfin username '{jellyfin_username_to_process}'."
-                            )
-                    else:
-                        # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
-                        identification_notes.append(
-                            f"Could not find any Discord ID for Jellyfin username '{jellyfin_username_to_process}' in local database."
-                        )
-            except Exception as e:
-                logger.error(
-                    f"[remove_invite] Error trying to find and update status for Jellyfin username '{jellyfin_username_to_process}': {e}",
-                    exc_info=True,
-                )
-                identification_notes.append(
-                    f"Error trying to find and update status for Jellyfin username '{jellyfin_username_to_process}' in local database."
-                )
-        else:
-            # Add to summary only if we didn't primarily act based on a Jellyfin username without a linked Discord user
-            if not (jellyfin_username_to_process and not target_discord_user):
-                identification_notes.append(
-                    "Local database status update skipped (no linked Discord User ID for this operation)."
-                )
+        # Log Admin Action
+        admin_user = interaction.user
+        # Determine the most relevant username and ID for logging based on what was identified
+        log_target_username_display = user_identifier  # Default to the input identifier
+        if target_discord_user:
+            log_target_username_display = target_discord_user.name
+        elif (
+            jellyfin_username_to_process
+        ):  # If no discord user, use Jellyfin username if available
+            log_target_username_display = jellyfin_username_to_process
+
+        log_target_id_display = (
+            discord_user_id_for_db
+            if discord_user_id_for_db
+            else (jellyfin_username_to_process or "N/A")
+        )
 
-    # Log Admin Action
-    admin_user = interaction.user
-    # Determine the most relevant username and ID for logging based on what was identified
-    log_target_username_display = user_identifier  # Default to the input identifier
-    if target_discord_user:
-        log_target_username_display = target_discord_user.name
-    elif (
-        jellyfin_username_to_process
-    ):  # If no discord user, use Jellyfin username if available
-        log_target_username_display = jellyfin_username_to_process
-
-    log_target_id_display = (
-        discord_user_id_for_db
-        if discord_user_id_for_db
-        else (jellyfin_username_to_process or "N/A")
-    )
+        # Create a detailed summary for the log
+        # Notes, then issues if any, materialized with a single outer join
+        log_details_parts = ["; ".join(identification_notes)]
+        if error_messages:
+            log_details_parts.append("; ".join(error_messages))
+        log_details_summary = ". Issues: ".join(log_details_parts)
 
-    # Create a detailed summary for the log
-    log_details_summary = "; ".join(identification_notes)
-    if error_messages:
-        log_details_summary += f". Issues: {'; '.join(error_messages)}"
-
-    if (
-        len(log_details_summary) > 1000
-    ):  # Cap log details to avoid overly long DB entries
-        log_details_summary = log_details_summary[:997] + "..."
-
-    admin_action_log_entry = AdminAction(
-        admin_id=str(admin_user.id),
-        admin_username=admin_user.name,
-        action_type="remove_invite_process",  # More descriptive action type
-        target_user_id=log_target_id_display,
-        target_username=log_target_username_display,
-        details=f"Input: '{user_identifier}'. Actions: {log_details_summary}",
-        performed_at=int(datetime.datetime.now(datetime.timezone.utc).timestamp()),
-    )
-    try:
-        await asyncio.to_thread(db.record_admin_action, admin_action_log_entry)
-        await bot_instance.log_admin_action(
-            admin_action_log_entry
-        )  # Also send to Discord log channel
-        logger.info(f"[remove_invite] Admin action logged for '{user_identifier}'.")
-    except Exception as e:
-        logger.error(
-            f"[remove_invite] Failed to log admin action for '{user_identifier}': {e}",
-            exc_info=True,
+        if (
+            len(log_details_summary) > 1000
+        ):  # Cap log details to avoid overly long DB entries
+            log_details_summary = log_details_summary[:997] + "..."
+
+        # One "now" for the admin action log and the confirmation embed
+        now_utc = discord.utils.utcnow()
+        admin_action_log_entry = AdminAction(
+            admin_id=str(admin_user.id),
+            admin_username=admin_user.name,
+            action_type="remove_invite_process",  # More descriptive action type
+            target_user_id=log_target_id_display,
+            target_username=log_target_username_display,
+            details=f"Input: '{user_identifier}'. Actions: {log_details_summary}",
+            performed_at=int(now_utc.timestamp()),
         )
-        # Non-critical for the user-facing part of the command, but good to note.
+        try:
+            bot_instance.queue_admin_action(admin_action_log_entry)
+            # Also send to Discord log channel
+            bot_instance.log_admin_action_in_background(admin_action_log_entry)
+            logger.info(
+                "[remove_invite] Admin action logged for '%s'.", user_identifier
+            )
+        except Exception as e:
+            logger.error(
+                f"[remove_invite] Failed to log admin action for '{user_identifier}': {e}",
+                exc_info=True,
+            )
+            # Non-critical for the user-facing part of the command, but good to note.
 
-    # Send Confirmation Embed
-    final_summary_for_embed = "**Summary of Actions Taken:**\n" + "\n".join(
-        [f"🔷 {note.strip()}" for note in identification_notes]
-    )
-    if error_messages:
-        final_summary_for_embed += "\n\n**Issues Encountered:**\n" + "\n".join(
-            [f"⚠️ {err.strip()}" for err in error_messages]
+        # Send Confirmation Embed
+        # Determine overall success for embed color - success if no errors, warning otherwise.
+        # Could be more nuanced, e.g. if JFA-GO user deletion failed but local status update worked.
+        embed_color_type = "success" if not error_messages else "warning"
+        if (
+            not status_updated_in_db and not error_messages and discord_user_id_for_db
+        ):  # If main goal of status update failed without other errors
+            embed_color_type = "warning"
+
+        # Standardize the message format for a more consistent display
+        standardized_title = get_static_message("remove_invite.confirmation_title")
+        standardized_description = get_message(
+            "remove_invite.confirmation_description",
+            target_display=log_target_username_display,
         )
 
-    # Determine overall success for embed color - success if no errors, warning otherwise.
-    # Could be more nuanced, e.g. if JFA-GO user deletion failed but local status update worked.
-    embed_color_type = "success" if not error_messages else "warning"
-    if (
-        not status_updated_in_db and not error_messages and discord_user_id_for_db
-    ):  # If main goal of status update failed without other errors
-        embed_color_type = "warning"
-
-    # Standardize the message format for a more consistent display
-    standardized_title = get_message("remove_invite.confirmation_title")
-    standardized_description = get_message(
-        "remove_invite.confirmation_description",
-        target_display=log_target_username_display,
-    )
-
-    # Add standardized action sections with clear outcomes
-    jfa_action_status = "❌ " + get_message(
-        "remove_invite.status_not_attempted"
-    )  # Default
-    for note in identification_notes:
-        if "deleted JFA-GO user" in note:
-            jfa_action_status = "✅ " + get_message("remove_invite.status_success_jfa")
-            break
-        elif "Attempt to delete Jellyfin user" in note:
-            # Check if it failed or was just an attempt that didn't find the user
-            if any(
-                "Failed to delete JFA-GO user" in err for err in error_messages
-            ) or any("User not found in JFA-GO" in err for err in error_messages):
-                jfa_action_status = "❌ " + get_message(
-                    "remove_invite.status_failed_jfa"
-                )
-            else:
-                jfa_action_status = "⚠️ " + get_message(
-                    "remove_invite.status_attempted_not_found_jfa"
+        # Add standardized action sections with clear outcomes
+        jfa_action_status = "❌ " + get_static_message(
+            "remove_invite.status_not_attempted"
+        )  # Default
+        for note in identification_notes:
+            if "deleted JFA-GO user" in note:
+                jfa_action_status = "✅ " + get_static_message(
+                    "remove_invite.status_success_jfa"
                 )
+                break
+            elif "Attempt to delete Jellyfin user" in note:
+                # Check if it failed or was just an attempt that didn't find the user
+                if any(
+                    "Failed to delete JFA-GO user" in err for err in error_messages
+                ) or any("User not found in JFA-GO" in err for err in error_messages):
+                    jfa_action_status = "❌ " + get_static_message(
+                        "remove_invite.status_failed_jfa"
+                    )
+                else:
+                    jfa_action_status = "⚠️ " + get_static_message(
+                        "remove_invite.status_attempted_not_found_jfa"
+                    )
 
-    # Check if local DB status update was attempted
-    db_action_status = "❌ " + get_message(
-        "remove_invite.status_not_attempted"
-    )  # Default
-    if status_updated_in_db:
-        db_action_status = "✅ " + get_message("remove_invite.status_success_db")
-    elif discord_user_id_for_db or any(
-        "Found Discord ID for DB update" in note for note in identification_notes
-    ):
-        # If an attempt was made but failed (status_updated_in_db is False)
-        db_action_status = "❌ " + get_message("remove_invite.status_failed_db")
-    elif not discord_user_id_for_db:
-        db_action_status = "ℹ️ " + get_message(
-            "remove_invite.status_skipped_no_discord_id"
-        )
-
-    standardized_sections = [
-        f"**{get_message('remove_invite.section_jfa_user_removal')}** {jfa_action_status}",
-        f"**{get_message('remove_invite.section_local_db_update')}** {db_action_status}",
-    ]
-
-    # Add extra context from the full action summary
-    standardized_sections.append(f"**{get_message('remove_invite.section_details')}**")
-    standardized_sections.append(final_summary_for_embed)
-
-    confirmation_embed = create_direct_embed(
-        title=standardized_title,
-        description=standardized_description
-        + "\n\n"
-        + "\n".join(standardized_sections),
-        color_type=embed_color_type,
-        timestamp=datetime.datetime.now(datetime.timezone.utc),
-    )
+        # Check if local DB status update was attempted
+        db_action_status = "❌ " + get_static_message(
+            "remove_invite.status_not_attempted"
+        )  # Default
+        if status_updated_in_db:
+            db_action_status = "✅ " + get_static_message(
+                "remove_invite.status_success_db"
+            )
+        elif discord_user_id_for_db or any(
+            "Found Discord ID for DB update" in note for note in identification_notes
+        ):
+            # If an attempt was made but failed (status_updated_in_db is False)
+            db_action_status = "❌ " + get_static_message(
+                "remove_invite.status_failed_db"
+            )
+        elif not discord_user_id_for_db:
+            db_action_status = "ℹ️ " + get_static_message(
+                "remove_invite.status_skipped_no_discord_id"
+            )
 
-    if (
-        len(confirmation_embed.description) > 4000
-    ):  # Discord embed description limit is 4096
-        confirmation_embed.description = confirmation_embed.description[
-            :4000
-        ] + get_message("general.details_truncated_suffix")
+        # Every line of the description is collected here and joined once
+        description_lines = [
+            standardized_description,
+            "",
+            f"**{get_static_message('remove_invite.section_jfa_user_removal')}** {jfa_action_status}",
+            f"**{get_static_message('remove_invite.section_local_db_update')}** {db_action_status}",
+            # Add extra context from the full action summary
+            f"**{get_static_message('remove_invite.section_details')}**",
+            "**Summary of Actions Taken:**",
+        ]
+        description_lines.extend(f"🔷 {note.strip()}" for note in identification_notes)
+        if error_messages:
+            description_lines.append("")
+            description_lines.append("**Issues Encountered:**")
+            description_lines.extend(f"⚠️ {err.strip()}" for err in error_messages)
+
+        confirmation_embed = create_direct_embed(
+            title=standardized_title,
+            description=_join_lines_within_limit(
+                description_lines,
+                REMOVE_INVITE_DESCRIPTION_BUDGET,
+                get_static_message("general.details_truncated_suffix"),
+            ),
+            color_type=embed_color_type,
+            timestamp=now_utc,
+        )
 
-    await interaction.edit_original_response(embed=confirmation_embed)
-    # --- End Step 5 ---
+        await interaction.edit_original_response(
+            embed=confirmation_embed, allowed_mentions=NO_MENTIONS
+        )
+        # --- End Step 5 ---
 
 
 async def remove_invite_error(
     interaction: discord.Interaction, error: app_commands.AppCommandError
 ):
     """Error handler for the remove_invite command."""
-    err_logger = logger.getChild("remove_invite.error")
-    err_logger.debug(
-        f"Error handler invoked for user {interaction.user} with error type {type(error)}"
+    _remove_invite_err_logger.debug(
+        "Error handler invoked for user %s with error type %s",
+        interaction.user,
+        type(error),
     )
     try:
         if isinstance(error, app_commands.errors.CheckFailure):
-            err_logger.warning(
+            _remove_invite_err_logger.warning(
                 f"CheckFailure suppressed for user {interaction.user}: {error}"
             )
             pass  # Handled by check
         elif isinstance(error, app_commands.errors.CommandInvokeError):
-            err_logger.error(
+            _remove_invite_err_logger.error(
                 f"CommandInvokeError caught (error logged previously): {error.original}"
             )
             if not interaction.response.is_done():
                 await interaction.response.send_message(
-                    "An error occurred while executing the command.", ephemeral=True
+                    "An error occurred while executing the command.",
+                    ephemeral=True,
+                    allowed_mentions=NO_MENTIONS,
                 )
         else:
-            err_logger.error(
+            _remove_invite_err_logger.error(
                 f"Unhandled AppCommandError in remove_invite: {type(error).__name__} - {str(error)}",
                 exc_info=True,
             )
             if not interaction.response.is_done():
                 await interaction.response.send_message(
-                    "An unexpected application command error occurred.", ephemeral=True
+                    "An unexpected application command error occurred.",
+                    ephemeral=True,
+                    allowed_mentions=NO_MENTIONS,
                 )
     except Exception as e:
-        err_logger.critical(
+        _remove_invite_err_logger.critical(
             f"CRITICAL: Error within remove_invite_error handler: {str(e)}",
             exc_info=True,
         )
@@ -924,277 +1063,280 @@ def setup_commands(bot):
         reason: Optional[str] = None,
         notify: bool = True,
     ):
-        cmd_logger = logger.getChild("extend_plan")
-        cmd_logger.info(
+        _extend_plan_logger.info(
             f"Command initiated by {interaction.user} for Discord user {user.display_name} (ID: {user.id}) / JFA user '{jfa_username}' "
             f"(M={months}, D={days}, h={hours}, m={minutes}, Reason='{reason}', Notify={notify})"
         )
         await interaction.response.defer(thinking=True)
 
-        # Default None duration components to 0 for comparison and calculation
-        months = months or 0
-        days = days or 0
-        hours = hours or 0
-        minutes = minutes or 0
+        # Duration components in EXTEND_PLAN_DURATION_UNITS order, None meaning 0
+        duration_values = tuple(value or 0 for value in (months, days, hours, minutes))
 
-        try:
-            bot = interaction.client
+        # Serialize commands acting on the same Discord user; other users proceed concurrently
+        async with interaction.client.target_lock(f"discord:{user.id}"):
+            try:
+                bot = interaction.client
 
-            # Validate that the user exists in JFA-GO
-            jfa_user_details = await asyncio.to_thread(
-                bot.jfa_client.get_jfa_user_details_by_username, jfa_username
-            )
-            if not jfa_user_details:
-                cmd_logger.warning(f"JFA-GO user {jfa_username} not found.")
-                await interaction.followup.send(
-                    get_message(
-                        "admin_extend_plan.error_user_not_found_jfa",
-                        jfa_username=jfa_username,
-                        user_mention=user.mention,
-                    ),
-                    ephemeral=True,
-                )
-                return
+                # Validate and total the duration in one pass before any JFA-GO request
+                if any(value < 0 for value in duration_values):
+                    _extend_plan_logger.warning(
+                        "Negative duration specified for extension."
+                    )
+                    await interaction.followup.send(
+                        get_static_message("admin_extend_plan.error_duration_negative"),
+                        ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
+                    )
+                    return
 
-            current_expiry_ts = jfa_user_details.get("expires")  # Timestamp or None
-            # Convert current_expiry_ts to datetime object if it exists, make it UTC aware
-            current_expiry_dt = (
-                datetime.datetime.fromtimestamp(
-                    current_expiry_ts, datetime.timezone.utc
-                )
-                if current_expiry_ts
-                else datetime.datetime.now(datetime.timezone.utc)
-            )
+                total_seconds_to_add = 0
+                duration_parts = []
+                for value, (unit_label, unit_seconds) in zip(
+                    duration_values, EXTEND_PLAN_DURATION_UNITS
+                ):
+                    if value > 0:
+                        total_seconds_to_add += value * unit_seconds
+                        duration_parts.append(f"{value} {unit_label}")
 
-            total_seconds_to_add = 0
-            duration_parts = []
-
-            if months and months > 0:
-                total_seconds_to_add += months * 30 * 86400  # Approx month
-                duration_parts.append(f"{months} month(s)")
-            if days and days > 0:
-                total_seconds_to_add += days * 86400
-                duration_parts.append(f"{days} day(s)")
-            if hours and hours > 0:
-                total_seconds_to_add += hours * 3600
-                duration_parts.append(f"{hours} hour(s)")
-            if minutes and minutes > 0:
-                total_seconds_to_add += minutes * 60
-                duration_parts.append(f"{minutes} minute(s)")
-
-            if total_seconds_to_add == 0:
-                cmd_logger.warning("No duration specified for extension.")
-                await interaction.followup.send(
-                    get_message("admin_extend_plan.error_duration_not_specified"),
-                    ephemeral=True,
+                if total_seconds_to_add == 0:
+                    _extend_plan_logger.warning("No duration specified for extension.")
+                    await interaction.followup.send(
+                        get_static_message(
+                            "admin_extend_plan.error_duration_not_specified"
+                        ),
+                        ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
+                    )
+                    return
+
+                # One "now" for the whole command: expiry maths, admin log and embed
+                now_utc = discord.utils.utcnow()
+
+                # Validate that the user exists in JFA-GO
+                jfa_user_details = await bot.run_jfa(
+                    bot.jfa_client.get_jfa_user_details_by_username, jfa_username
                 )
-                return
+                if not jfa_user_details:
+                    _extend_plan_logger.warning(
+                        f"JFA-GO user {jfa_username} not found."
+                    )
+                    await interaction.followup.send(
+                        get_message(
+                            "admin_extend_plan.error_user_not_found_jfa",
+                            jfa_username=jfa_username,
+                            user_mention=user.mention,
+                        ),
+                        ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
+                    )
+                    return
 
-            if (
-                months < 0 or days < 0 or hours < 0 or minutes < 0
-            ):  # Simpler check for any negative
-                cmd_logger.warning("Negative duration specified for extension.")
-                await interaction.followup.send(
-                    get_message("admin_extend_plan.error_duration_negative"),
-                    ephemeral=True,
+                current_expiry_ts = jfa_user_details.get("expires")  # Timestamp or None
+
+                duration_str = ", ".join(duration_parts) if duration_parts else "None"
+
+                # Calculate new expiry from current expiry or now if not set, in plain
+                # integer seconds; the datetime is only needed for display
+                new_expiry_ts = (
+                    int(current_expiry_ts)
+                    if current_expiry_ts
+                    else int(now_utc.timestamp())
+                ) + total_seconds_to_add
+                new_expiry_dt = datetime.datetime.fromtimestamp(
+                    new_expiry_ts, datetime.timezone.utc
                 )
-                return
 
-            duration_str = ", ".join(duration_parts) if duration_parts else "None"
+                success, message = await bot.run_jfa(
+                    bot.jfa_client.extend_user_expiry,
+                    jfa_username=jfa_username,
+                    exact_timestamp=new_expiry_ts,
+                    notify=notify,
+                )
+                jfa_notify_success = notify if success else False
 
-            # Calculate new expiry from current expiry or now if not set
-            new_expiry_dt = current_expiry_dt + datetime.timedelta(
-                seconds=total_seconds_to_add
-            )
-            new_expiry_ts = int(new_expiry_dt.timestamp())
+                if not success:
+                    _extend_plan_logger.error(
+                        f"JFA-GO failed to extend plan for {jfa_username}: {message}"
+                    )
+                    await interaction.followup.send(
+                        get_message(
+                            "admin_extend_plan.error_jfa_extend_failed",
+                            jfa_username=jfa_username,
+                            user_mention=user.mention,
+                            error_message=message,
+                        ),
+                        ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
+                    )
+                    return
 
-            success, message = await asyncio.to_thread(
-                bot.jfa_client.extend_user_expiry,
-                jfa_username=jfa_username,
-                exact_timestamp=new_expiry_ts,
-                notify=notify,
-            )
-            jfa_notify_success = notify if success else False
+                new_expiry_str = new_expiry_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
 
-            if not success:
-                cmd_logger.error(
-                    f"JFA-GO failed to extend plan for {jfa_username}: {message}"
+                # Log admin action
+                admin_action_details = (
+                    f"Extended plan for JFA-GO user: {jfa_username} (Discord: {user.display_name}). "
+                    f"Added: {duration_str}. New Expiry: {new_expiry_str}. "
+                    f"Reason: {reason if reason else 'N/A'}. JFA Notified: {jfa_notify_success}"
                 )
-                await interaction.followup.send(
-                    get_message(
-                        "admin_extend_plan.error_jfa_extend_failed",
-                        jfa_username=jfa_username,
-                        user_mention=user.mention,
-                        error_message=message,
-                    ),
-                    ephemeral=True,
+                action = AdminAction(
+                    admin_id=str(interaction.user.id),
+                    admin_username=interaction.user.display_name,
+                    action_type="EXTEND_PLAN",
+                    target_user_id=str(user.id),  # Discord user ID
+                    target_username=jfa_username,  # JFA-GO username as primary target id for this action
+                    details=admin_action_details,
+                    performed_at=int(now_utc.timestamp()),  # UTC
                 )
-                return
-
-            # Log admin action
-            admin_action_details = (
-                f"Extended plan for JFA-GO user: {jfa_username} (Discord: {user.display_name}). "
-                f"Added: {duration_str}. New Expiry: {new_expiry_dt.strftime('%Y-%m-%d %H:%M:%S %Z')}. "
-                f"Reason: {reason if reason else 'N/A'}. JFA Notified: {jfa_notify_success}"
-            )
-            action = AdminAction(
-                admin_id=str(interaction.user.id),
-                admin_username=interaction.user.display_name,
-                action_type="EXTEND_PLAN",
-                target_user_id=str(user.id),  # Discord user ID
-                target_username=jfa_username,  # JFA-GO username as primary target id for this action
-                details=admin_action_details,
-                performed_at=int(
-                    datetime.datetime.now(datetime.timezone.utc).timestamp()
-                ),  # UTC
-            )
-            bot.db.record_admin_action(action)
-            await bot.log_admin_action(action)
-
-            # Send confirmation
-            # Human readable new expiry (e.g., "in 2 months and 3 days") - placeholder for now
-            # For a more precise human-readable relative time, a library like `humanize` would be good, or a simpler custom formatter.
-            # Simple version:
-            time_diff = new_expiry_dt - datetime.datetime.now(datetime.timezone.utc)
-            human_readable_new_expiry = (
-                f"in approx. {time_diff.days} days"
-                if time_diff.days > 0
-                else "Expired or very soon"
-            )
-            if time_diff.days < 0:
-                human_readable_new_expiry = "already passed"
-
-            embed = create_embed(
-                title_key="admin_extend_plan.embed_success_title",
-                description_key="admin_extend_plan.embed_success_description",
-                description_kwargs={
-                    "jfa_username": jfa_username,
-                    "user_mention": user.mention,
-                },
-                color_type="success",
-                timestamp=datetime.datetime.now(datetime.timezone.utc),  # UTC
-            )
-            embed.add_field(
-                name=get_message("admin_extend_plan.field_jfa_user_name"),
-                value=get_message(
-                    "admin_extend_plan.field_jfa_user_value", jfa_username=jfa_username
-                ),
-                inline=True,
-            )
-            embed.add_field(
-                name=get_message("admin_extend_plan.field_discord_user_name"),
-                value=get_message(
-                    "admin_extend_plan.field_discord_user_value",
-                    user_mention=user.mention,
-                ),
-                inline=True,
-            )
-            embed.add_field(
-                name=get_message("admin_extend_plan.field_duration_added_name"),
-                value=get_message(
-                    "admin_extend_plan.field_duration_added_value",
-                    duration_string=duration_str,
-                ),
-                inline=False,
-            )
-            embed.add_field(
-                name=get_message("admin_extend_plan.field_new_expiry_name"),
-                value=get_message(
-                    "admin_extend_plan.field_new_expiry_value",
-                    new_expiry_string=new_expiry_dt.strftime("%Y-%m-%d %H:%M:%S %Z"),
-                    new_expiry_human=human_readable_new_expiry,
-                ),
-                inline=False,
-            )
-            if reason:
-                embed.add_field(
-                    name=get_message("admin_extend_plan.field_reason_name"),
-                    value=get_message(
-                        "admin_extend_plan.field_reason_value", reason=reason
-                    ),
-                    inline=False,
+                bot.queue_admin_action(action)
+                bot.log_admin_action_in_background(action)
+
+                # Send confirmation
+                # Discord renders the relative new expiry (e.g. "in 2 months") itself,
+                # in each viewer's locale, and keeps it up to date
+                human_readable_new_expiry = f"<t:{new_expiry_ts}:R>"
+
+                notified_value_key = (
+                    "admin_extend_plan.field_jfa_notified_yes"
+                    if jfa_notify_success
+                    else "admin_extend_plan.field_jfa_notified_no_unknown"
+                )
+                # Describe all fields up front and let create_embed build the embed in one go
+                fields = [
+                    {
+                        "name_key": "admin_extend_plan.field_jfa_user_name",
+                        "value_key": "admin_extend_plan.field_jfa_user_value",
+                        "value_kwargs": {"jfa_username": jfa_username},
+                        "inline": True,
+                    },
+                    {
+                        "name_key": "admin_extend_plan.field_discord_user_name",
+                        "value_key": "admin_extend_plan.field_discord_user_value",
+                        "value_kwargs": {"user_mention": user.mention},
+                        "inline": True,
+                    },
+                    {
+                        "name_key": "admin_extend_plan.field_duration_added_name",
+                        "value_key": "admin_extend_plan.field_duration_added_value",
+                        "value_kwargs": {"duration_string": duration_str},
+                        "inline": False,
+                    },
+                    {
+                        "name_key": "admin_extend_plan.field_new_expiry_name",
+                        "value_key": "admin_extend_plan.field_new_expiry_value",
+                        "value_kwargs": {
+                            "new_expiry_string": new_expiry_str,
+                            "new_expiry_human": human_readable_new_expiry,
+                        },
+                        "inline": False,
+                    },
+                ]
+                if reason:
+                    fields.append(
+                        {
+                            "name_key": "admin_extend_plan.field_reason_name",
+                            "value_key": "admin_extend_plan.field_reason_value",
+                            "value_kwargs": {"reason": reason},
+                            "inline": False,
+                        }
+                    )
+                fields.append(
+                    {
+                        "name_key": "admin_extend_plan.field_jfa_notified_name",
+                        "value": get_static_message(notified_value_key),
+                        "inline": True,
+                    }
                 )
 
-            notified_value_key = (
-                "admin_extend_plan.field_jfa_notified_yes"
-                if jfa_notify_success
-                else "admin_extend_plan.field_jfa_notified_no_unknown"
-            )
-            embed.add_field(
-                name=get_message("admin_extend_plan.field_jfa_notified_name"),
-                value=get_message(notified_value_key),
-                inline=True,
-            )
+                embed = create_embed(
+                    title_key="admin_extend_plan.embed_success_title",
+                    description_key="admin_extend_plan.embed_success_description",
+                    description_kwargs={
+                        "jfa_username": jfa_username,
+                        "user_mention": user.mention,
+                    },
+                    color_type="success",
+                    timestamp=now_utc,  # UTC
+                    fields=fields,
+                )
 
-            embed.set_footer(
-                text=get_message(
-                    "admin_extend_plan.embed_footer",
-                    admin_user_name=interaction.user.display_name,
+                embed.set_footer(
+                    text=get_message(
+                        "admin_extend_plan.embed_footer",
+                        admin_user_name=interaction.user.display_name,
+                    )
+                )
+                await interaction.followup.send(
+                    embed=embed, allowed_mentions=NO_MENTIONS
                 )
-            )
-            await interaction.followup.send(embed=embed)
 
-        except Exception as e:
-            cmd_logger.error(
-                f"Unhandled error in extend_plan_command: {str(e)}", exc_info=True
-            )
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    get_message("admin_extend_plan.generic_error_command_processing"),
-                    ephemeral=True,
+            except Exception as e:
+                _extend_plan_logger.error(
+                    f"Unhandled error in extend_plan_command: {str(e)}", exc_info=True
                 )
-            else:
-                try:
-                    await interaction.followup.send(
-                        get_message(
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        get_static_message(
                             "admin_extend_plan.generic_error_command_processing"
                         ),
                         ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
                     )
-                except discord.HTTPException:
-                    cmd_logger.error(
-                        "Failed to send error followup for extend_plan_command."
-                    )
+                else:
+                    try:
+                        await interaction.followup.send(
+                            get_static_message(
+                                "admin_extend_plan.generic_error_command_processing"
+                            ),
+                            ephemeral=True,
+                            allowed_mentions=NO_MENTIONS,
+                        )
+                    except discord.HTTPException:
+                        _extend_plan_logger.error(
+                            "Failed to send error followup for extend_plan_command."
+                        )
 
     async def extend_plan_error(
         interaction: discord.Interaction, error: app_commands.AppCommandError
     ):
         """Error handler for the extend_plan command."""
-        err_logger = logger.getChild(
-            "extend-plan.error"
-        )  # Consistent naming for child logger
-        err_logger.debug(
-            f"Error handler invoked for user {interaction.user} with error type {type(error)}"
+        _extend_plan_err_logger.debug(
+            "Error handler invoked for user %s with error type %s",
+            interaction.user,
+            type(error),
         )
         try:
             if isinstance(error, app_commands.errors.CheckFailure):
-                err_logger.warning(
+                _extend_plan_err_logger.warning(
                     f"CheckFailure suppressed for user {interaction.user}: {error}"
                 )
                 pass  # Auth check should handle its own response
             elif isinstance(error, app_commands.errors.CommandInvokeError):
-                err_logger.error(
+                _extend_plan_err_logger.error(
                     f"CommandInvokeError caught (error logged previously by command): {error.original}"
                 )
                 if not interaction.response.is_done():
                     await interaction.response.send_message(
-                        get_message("admin_extend_plan.error_invoke_error_if_not_done"),
+                        get_static_message(
+                            "admin_extend_plan.error_invoke_error_if_not_done"
+                        ),
                         ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
                     )
             else:
-                err_logger.error(
+                _extend_plan_err_logger.error(
                     f"Unhandled AppCommandError in extend_plan: {type(error).__name__} - {str(error)}",
                     exc_info=True,
                 )
                 if not interaction.response.is_done():
                     await interaction.response.send_message(
-                        get_message(
+                        get_static_message(
                             "admin_extend_plan.error_app_command_error_if_not_done"
                         ),
                         ephemeral=True,
+                        allowed_mentions=NO_MENTIONS,
                     )
         except Exception as e:
-            err_logger.critical(
+            _extend_plan_err_logger.critical(
                 f"CRITICAL: Error within extend_plan_error handler: {str(e)}",
                 exc_info=True,
             )
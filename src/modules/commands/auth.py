@@ -5,7 +5,6 @@ import logging
 import discord
 from discord import app_commands
 
-from modules.config import get_config_value
 from modules.messaging import get_message  # create_embed will be used later
 
 logger = logging.getLogger(__name__)
@@ -19,7 +18,10 @@ def is_in_support_and_authorized():
         check_logger = logger
         try:
             check_logger.debug(
-                f"Running authorization check for command '{interaction.command.name if interaction.command else 'Unknown'}' by user {interaction.user} in channel {interaction.channel}"
+                "Running authorization check for command '%s' by user %s in channel %s",
+                interaction.command.name if interaction.command else "Unknown",
+                interaction.user,
+                interaction.channel,
             )
             # Ensure channel object exists before checking category
             if not interaction.channel:
@@ -56,11 +58,10 @@ def is_in_support_and_authorized():
                 return False
 
             # Role check
-            # Get allowed roles from the new config structure
-            allowed_role_names_or_ids = get_config_value(
-                "discord.command_authorized_roles", []
-            )
-            if not allowed_role_names_or_ids:
+            # Allowed role names and IDs are cached by the bot in load_cached_config
+            allowed_role_names = bot.authorized_role_names
+            allowed_role_ids = bot.authorized_role_ids
+            if not allowed_role_names:
                 logger.warning(
                     "Authorization check: No 'command_authorized_roles' configured. Denying command access."
                 )
@@ -70,16 +71,14 @@ def is_in_support_and_authorized():
                 )
                 return False
 
-            user_roles = interaction.user.roles
             authorized = any(
-                role.name in allowed_role_names_or_ids
-                or str(role.id) in allowed_role_names_or_ids
-                for role in user_roles
+                role.id in allowed_role_ids or role.name in allowed_role_names
+                for role in interaction.user.roles
             )
 
             if not authorized:
                 check_logger.warning(
-                    f"Auth check failed for user {interaction.user}: User lacks required roles ({', '.join(allowed_role_names_or_ids)})"
+                    f"Auth check failed for user {interaction.user}: User lacks required roles ({', '.join(sorted(allowed_role_names))})"
                 )
                 await interaction.response.send_message(
                     get_message("errors.not_authorized_command"),  # Use new system
@@ -88,7 +87,9 @@ def is_in_support_and_authorized():
                 return False
 
             check_logger.debug(
-                f"Authorization check passed for user {interaction.user} for command '{interaction.command.name if interaction.command else 'Unknown'}'."
+                "Authorization check passed for user %s for command '%s'.",
+                interaction.user,
+                interaction.command.name if interaction.command else "Unknown",
             )
             return True
         except Exception as e:
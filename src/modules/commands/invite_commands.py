@@ -1,6 +1,5 @@
 """Command handlers for invite-related commands."""
 
-import asyncio
 import datetime
 import logging
 
@@ -16,13 +15,16 @@ from modules.models import AdminAction
 
 logger = logging.getLogger(__name__)
 
+# Per-command child loggers, created once at import
+_create_trial_invite_logger = logger.getChild("create_trial_invite")
+_create_trial_invite_err_logger = logger.getChild("create_trial_invite.error")
+
 
 async def create_trial_invite_command(
     interaction: discord.Interaction, user: discord.Member
 ):
     """Create a trial invite for a specified user."""
-    cmd_logger = logger.getChild("create_trial_invite")
-    cmd_logger.info(
+    _create_trial_invite_logger.info(
         f"Command initiated by {interaction.user} (ID: {interaction.user.id}) for target user {user.display_name} (ID: {user.id}) in channel {interaction.channel.name} ({interaction.channel.id})"
     )
 
@@ -40,14 +42,14 @@ async def create_trial_invite_command(
 
     try:
         # --- Check Existing Invite ---
-        cmd_logger.debug(
-            f"Checking database for existing invite for user {target_user.id}"
+        _create_trial_invite_logger.debug(
+            "Checking database for existing invite for user %s", target_user.id
         )
-        existing_invite = bot.db.get_invite_info(str(target_user.id))
+        existing_invite = await bot.run_db(bot.db.get_invite_info, str(target_user.id))
         if existing_invite and not existing_invite.claimed:
             # Check if the invite is disabled - if so, allow creating a new one
             if existing_invite.status != "disabled":
-                cmd_logger.warning(
+                _create_trial_invite_logger.warning(
                     f"User {target_user.display_name} already has an active invite code: {existing_invite.code}"
                 )
                 error_embed = create_embed(
@@ -62,18 +64,18 @@ async def create_trial_invite_command(
                 await interaction.edit_original_response(embed=error_embed)
                 return
             else:
-                cmd_logger.info(
+                _create_trial_invite_logger.info(
                     f"User {target_user.display_name} has a disabled invite. Creating a new one."
                 )
 
         # --- Get Configuration ---
-        cmd_logger.debug("Fetching invite configuration settings.")
+        _create_trial_invite_logger.debug("Fetching invite configuration settings.")
         link_days = get_config_value("invite_settings.link_validity_days", 1)
         user_days = get_config_value("invite_settings.trial_account_duration_days", 3)
         jfa_profile = get_config_value(
             "jfa_go.default_trial_profile", "Default Profile"
         )
-        trial_role_name = get_config_value("discord.trial_user_role_name", "Trial")
+        trial_role_name = bot.trial_role_name  # Cached in load_cached_config
         base_url = get_config_value("jfa_go.base_url")
         invite_label_format = get_config_value(
             "invite_settings.trial_invite_label_format",
@@ -81,7 +83,7 @@ async def create_trial_invite_command(
         )
 
         if not base_url:
-            cmd_logger.error("JFA-GO base URL not configured.")
+            _create_trial_invite_logger.error("JFA-GO base URL not configured.")
             error_embed = create_embed(
                 title_key="trial_invite.error_config_missing_title",
                 description_key="trial_invite.error_config_missing_desc_base_url",
@@ -97,7 +99,9 @@ async def create_trial_invite_command(
                 date=datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d"),
             )
         except KeyError as e:
-            cmd_logger.error(f"Invalid placeholder in invite_label_format: {e}")
+            _create_trial_invite_logger.error(
+                f"Invalid placeholder in invite_label_format: {e}"
+            )
             error_embed = create_embed(
                 title_key="trial_invite.error_config_label_format_title",
                 description_key="trial_invite.error_config_label_format_desc",
@@ -108,8 +112,10 @@ async def create_trial_invite_command(
             return
 
         # --- Create JFA-GO Invite ---
-        cmd_logger.debug("Attempting to create invite via JFA-GO client...")
-        success, message = await asyncio.to_thread(
+        _create_trial_invite_logger.debug(
+            "Attempting to create invite via JFA-GO client..."
+        )
+        success, message = await bot.run_jfa(
             bot.jfa_client.create_invite,
             label=invite_label,
             profile_name=jfa_profile,
@@ -120,7 +126,9 @@ async def create_trial_invite_command(
         )
 
         if not success:
-            cmd_logger.error(f"Failed to create JFA-GO invite: {message}")
+            _create_trial_invite_logger.error(
+                f"Failed to create JFA-GO invite: {message}"
+            )
             error_embed = create_embed(
                 title_key="trial_invite.error_jfa_create_failed_title",
                 description_key="trial_invite.error_jfa_create_failed_desc",
@@ -131,13 +139,17 @@ async def create_trial_invite_command(
             return
 
         # --- Get Invite Code ---
-        cmd_logger.debug("Attempting to retrieve invite code from JFA-GO...")
-        invite_code, message = await asyncio.to_thread(
+        _create_trial_invite_logger.debug(
+            "Attempting to retrieve invite code from JFA-GO..."
+        )
+        invite_code, message = await bot.run_jfa(
             bot.jfa_client.get_invite_code, invite_label
         )
 
         if not invite_code:
-            cmd_logger.error(f"Failed to get invite code after creation: {message}")
+            _create_trial_invite_logger.error(
+                f"Failed to get invite code after creation: {message}"
+            )
             error_embed = create_embed(
                 title_key="trial_invite.error_jfa_get_code_failed_title",
                 description_key="trial_invite.error_jfa_get_code_failed_desc",
@@ -147,25 +159,29 @@ async def create_trial_invite_command(
             # Invite might exist in JFA-GO but bot failed to get code/record it
             await interaction.edit_original_response(embed=error_embed)
             return
-        cmd_logger.info(f"Successfully retrieved invite code: {invite_code}")
+        _create_trial_invite_logger.info(
+            f"Successfully retrieved invite code: {invite_code}"
+        )
+
+        # One timestamp for the account expiry, the admin action and the embed
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
+        now_ts = int(now_utc.timestamp())
 
         # --- Record Invite in DB ---
-        cmd_logger.debug("Recording invite in local database...")
+        _create_trial_invite_logger.debug("Recording invite in local database...")
         try:
-            bot.db.record_invite(
+            await bot.run_db(
+                bot.db.record_invite,
                 user_id=str(target_user.id),
                 username=target_user.display_name,
                 invite_code=invite_code,
                 plan_type="Trial",  # Indicate this is a trial invite
-                account_expires_at=int(
-                    (
-                        datetime.datetime.now(datetime.timezone.utc)
-                        + datetime.timedelta(days=user_days)
-                    ).timestamp()
-                ),
+                account_expires_at=now_ts + int(user_days * 86400),
             )
         except Exception as e:
-            cmd_logger.error(f"Failed to record invite in DB: {e}", exc_info=True)
+            _create_trial_invite_logger.error(
+                f"Failed to record invite in DB: {e}", exc_info=True
+            )
             # Critical: Invite exists in JFA-GO but not in local DB
             error_embed = create_embed(
                 title_key="trial_invite.error_db_record_failed_title",
@@ -176,10 +192,10 @@ async def create_trial_invite_command(
             await interaction.edit_original_response(embed=error_embed)
             # Consider attempting to delete the JFA-GO invite here if DB record fails?
             return
-        cmd_logger.info("Successfully recorded invite in database.")
+        _create_trial_invite_logger.info("Successfully recorded invite in database.")
 
         # --- Log Admin Action ---
-        cmd_logger.debug("Recording admin action...")
+        _create_trial_invite_logger.debug("Recording admin action...")
         action = AdminAction(
             admin_id=str(interaction.user.id),
             admin_username=interaction.user.display_name,
@@ -187,21 +203,19 @@ async def create_trial_invite_command(
             target_user_id=str(target_user.id),
             target_username=target_user.display_name,
             details=f"Created trial invite. Code: {invite_code}, Profile: {jfa_profile}, Account Duration: {user_days} days, Link Duration: {link_days} days.",
-            performed_at=int(datetime.datetime.now(datetime.timezone.utc).timestamp()),
+            performed_at=now_ts,
         )
-        bot.db.record_admin_action(action)
-        await bot.log_admin_action(action)
-        cmd_logger.info("Admin action recorded.")
+        bot.queue_admin_action(action)
+        bot.log_admin_action_in_background(action)
+        _create_trial_invite_logger.info("Admin action recorded.")
 
         # --- Assign Trial Role (Optional) ---
         role_assign_message = None
         if trial_role_name:
-            cmd_logger.info(
+            _create_trial_invite_logger.info(
                 f"Attempting to assign configured trial role: '{trial_role_name}'"
             )
-            trial_role = discord.utils.get(
-                interaction.guild.roles, name=trial_role_name
-            )
+            trial_role = bot.get_role_by_name(interaction.guild, trial_role_name)
             if trial_role:
                 if trial_role not in target_user.roles:
                     try:
@@ -209,11 +223,11 @@ async def create_trial_invite_command(
                             trial_role,
                             reason=f"Trial Invite created by {interaction.user.display_name}",
                         )
-                        cmd_logger.info(
+                        _create_trial_invite_logger.info(
                             f"Successfully assigned role '{trial_role_name}' to {target_user.display_name}"
                         )
                     except discord.Forbidden:
-                        cmd_logger.error(
+                        _create_trial_invite_logger.error(
                             f"Failed to assign role '{trial_role_name}' to {target_user.display_name}: Bot lacks permissions."
                         )
                         role_assign_message = get_message(
@@ -223,7 +237,7 @@ async def create_trial_invite_command(
                             invite_code=invite_code,
                         )
                     except discord.HTTPException as e:
-                        cmd_logger.error(
+                        _create_trial_invite_logger.error(
                             f"Failed to assign role '{trial_role_name}' to {target_user.display_name} due to API error: {e}"
                         )
                         role_assign_message = get_message(
@@ -233,11 +247,13 @@ async def create_trial_invite_command(
                             invite_code=invite_code,
                         )
                 else:
-                    cmd_logger.debug(
-                        f"User {target_user.display_name} already has role '{trial_role_name}'."
+                    _create_trial_invite_logger.debug(
+                        "User %s already has role '%s'.",
+                        target_user.display_name,
+                        trial_role_name,
                     )
             else:
-                cmd_logger.warning(
+                _create_trial_invite_logger.warning(
                     f"Configured trial role '{trial_role_name}' not found in server."
                 )
                 role_assign_message = get_message(
@@ -247,18 +263,20 @@ async def create_trial_invite_command(
                     invite_code=invite_code,
                 )
         else:
-            cmd_logger.debug("No trial role configured to assign.")
+            _create_trial_invite_logger.debug("No trial role configured to assign.")
 
         # --- Send Final Confirmation ---
         invite_url = f"{base_url.rstrip('/')}/{invite_code}"
-        cmd_logger.info(f"Sending success confirmation for invite {invite_code}")
+        _create_trial_invite_logger.info(
+            f"Sending success confirmation for invite {invite_code}"
+        )
 
         success_embed = create_embed(
             title_key="trial_invite.success_title",
             description_key="trial_invite.success_description",
             description_kwargs={"user_mention": target_user.mention},
             color_type="success",
-            timestamp=datetime.datetime.now(datetime.timezone.utc),
+            timestamp=now_utc,
         )
         success_embed.add_field(
             name=get_message("trial_invite.field_invite_link"),
@@ -296,14 +314,16 @@ async def create_trial_invite_command(
             await interaction.delete_original_response()
         except discord.HTTPException as e:
             # Log if deletion fails, but don't halt the process
-            cmd_logger.warning(f"Could not delete original ephemeral response: {e}")
+            _create_trial_invite_logger.warning(
+                f"Could not delete original ephemeral response: {e}"
+            )
 
-        cmd_logger.info(
+        _create_trial_invite_logger.info(
             f"Trial invite process completed successfully for {target_user.display_name}."
         )
 
     except Exception as e:
-        cmd_logger.error(
+        _create_trial_invite_logger.error(
             f"Unhandled error in create_trial_invite: {str(e)}", exc_info=True
         )
         # Send generic error message if possible
@@ -323,15 +343,16 @@ async def create_trial_invite_command(
                     content=None, embed=error_embed
                 )
             except discord.HTTPException:
-                cmd_logger.error("Failed to send final error message update.")
+                _create_trial_invite_logger.error(
+                    "Failed to send final error message update."
+                )
 
 
 async def create_trial_invite_error(
     interaction: discord.Interaction, error: app_commands.AppCommandError
 ):
     """Generic error handler for the trial invite command."""
-    err_logger = logger.getChild("create_trial_invite.error")
-    err_logger.error(
+    _create_trial_invite_err_logger.error(
         f"Error handled by create_trial_invite_error: {type(error).__name__} - {error}",
         exc_info=True,
     )
@@ -340,7 +361,7 @@ async def create_trial_invite_error(
     error_message = get_message("errors.generic_command_error")
 
     if isinstance(error, app_commands.errors.CheckFailure):
-        err_logger.warning(
+        _create_trial_invite_err_logger.warning(
             f"CheckFailure suppressed for user {interaction.user}: {error}"
         )
         # Auth check should have already sent a specific message
@@ -351,7 +372,9 @@ async def create_trial_invite_error(
         try:
             await interaction.followup.send(error_message, ephemeral=True)
         except discord.HTTPException:
-            err_logger.error("Failed to send error followup message.")
+            _create_trial_invite_err_logger.error(
+                "Failed to send error followup message."
+            )
 
 
 def setup_commands(bot):
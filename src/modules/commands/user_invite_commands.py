@@ -3,6 +3,7 @@
 import asyncio
 import datetime
 import logging
+import time
 from typing import List, Optional
 
 import discord
@@ -15,32 +16,58 @@ from modules.messaging import get_message, create_embed
 
 logger = logging.getLogger(__name__)
 
+# Message keys for the outcome of each kind of role change made by create-user-invite,
+# keyed by (operation, outcome)
+ROLE_CHANGE_MESSAGE_KEYS = {
+    ("remove", "ok"): "user_invite.role_removed_log",
+    ("remove", "permission"): "user_invite.warning_old_role_remove_failed_permission",
+    ("remove", "api"): "user_invite.warning_old_role_remove_failed_api",
+    ("assign", "ok"): "user_invite.role_assigned_log",
+    ("assign", "permission"): "user_invite.warning_new_role_assign_failed_permission",
+    ("assign", "api"): "user_invite.warning_new_role_assign_failed_api",
+    ("trial", "ok"): "user_invite.trial_role_assigned_log",
+    ("trial", "permission"): "user_invite.warning_trial_role_assign_failed_permission",
+    ("trial", "api"): "user_invite.warning_trial_role_assign_failed_api",
+}
+
+# Per-command child loggers, created once at import
+_plan_type_autocomplete_logger = logger.getChild("plan_type_autocomplete")
+_create_user_invite_logger = logger.getChild("create-user-invite")
+_create_user_invite_err_logger = logger.getChild("create-user-invite.error")
+
 
 async def plan_type_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocompletes plan types by fetching from JFA-GO."""
-    ac_logger = logger.getChild("plan_type_autocomplete")
-    ac_logger.debug(
-        f"Autocomplete triggered by user {interaction.user} with current value: '{current}'"
+    _plan_type_autocomplete_logger.debug(
+        "Autocomplete triggered by user %s with current value: '%s'",
+        interaction.user,
+        current,
     )
 
     # Get the bot instance
     bot = interaction.client
 
-    profiles, error_msg = await asyncio.to_thread(bot.jfa_client.get_profiles)
+    profiles, error_msg = await bot.run_jfa(bot.jfa_client.get_profiles)
     if profiles is None:
-        ac_logger.error(f"Autocomplete failed to fetch profiles: {error_msg}")
+        _plan_type_autocomplete_logger.error(
+            f"Autocomplete failed to fetch profiles: {error_msg}"
+        )
         return []  # Return empty list on error
 
-    ac_logger.debug(f"Fetched {len(profiles)} profiles. Filtering with '{current}'")
+    _plan_type_autocomplete_logger.debug(
+        "Fetched %s profiles. Filtering with '%s'", len(profiles), current
+    )
 
     choices = [
         app_commands.Choice(name=profile, value=profile)
         for profile in profiles
         if current.lower() in profile.lower()
     ]
-    ac_logger.debug(f"Returning {len(choices)} choices for autocomplete.")
+    _plan_type_autocomplete_logger.debug(
+        "Returning %s choices for autocomplete.", len(choices)
+    )
     return choices[:25]  # Discord limits choices to 25
 
 
@@ -52,8 +79,7 @@ async def create_user_invite_command(
     days: Optional[int] = None,
 ):
     """Create a user invite for a user with specified plan and duration."""
-    cmd_logger = logger.getChild("create-user-invite")
-    cmd_logger.info(
+    _create_user_invite_logger.info(
         f"Command initiated by {interaction.user} for target {user.display_name} (Plan: {plan_type}, Months: {months}, Days: {days})"
     )
     await interaction.response.defer(thinking=True)
@@ -64,7 +90,9 @@ async def create_user_invite_command(
 
         # --- Validation ---
         if months is None and days is None:
-            cmd_logger.warning("Validation failed: Both months and days are None.")
+            _create_user_invite_logger.warning(
+                "Validation failed: Both months and days are None."
+            )
             await interaction.followup.send(
                 get_message("user_invite.validation_duration_missing"),
                 ephemeral=True,
@@ -72,7 +100,7 @@ async def create_user_invite_command(
             return
 
         if (months is not None and months < 0) or (days is not None and days < 0):
-            cmd_logger.warning(
+            _create_user_invite_logger.warning(
                 f"Validation failed: Negative duration provided (Months: {months}, Days: {days})."
             )
             await interaction.followup.send(
@@ -82,10 +110,10 @@ async def create_user_invite_command(
             return
 
         # Validate plan_type against available profiles
-        cmd_logger.debug(f"Validating selected plan type: {plan_type}")
-        valid_profiles, fetch_msg = await asyncio.to_thread(bot.jfa_client.get_profiles)
+        _create_user_invite_logger.debug("Validating selected plan type: %s", plan_type)
+        valid_profiles, fetch_msg = await bot.run_jfa(bot.jfa_client.get_profiles)
         if valid_profiles is None:
-            cmd_logger.error(
+            _create_user_invite_logger.error(
                 f"Could not validate plan type because profile fetch failed: {fetch_msg}"
             )
             await interaction.followup.send(
@@ -98,7 +126,7 @@ async def create_user_invite_command(
             return
 
         if plan_type not in valid_profiles:
-            cmd_logger.warning(
+            _create_user_invite_logger.warning(
                 f"Validation failed: Invalid plan type '{plan_type}' selected. Available: {valid_profiles}"
             )
             profile_list_str = (
@@ -118,7 +146,7 @@ async def create_user_invite_command(
             )
             return
 
-        cmd_logger.debug(f"Plan type '{plan_type}' is valid.")
+        _create_user_invite_logger.debug("Plan type '%s' is valid.", plan_type)
 
         # --- Calculate Duration ---
         total_user_days = 0
@@ -133,7 +161,7 @@ async def create_user_invite_command(
 
         if total_user_days <= 0:
             # This case might happen if user enters 0 for both, handle defensively
-            cmd_logger.warning(
+            _create_user_invite_logger.warning(
                 f"Validation failed: Calculated total duration is not positive ({total_user_days} days)."
             )
             await interaction.followup.send(
@@ -150,12 +178,14 @@ async def create_user_invite_command(
         # --- Check Existing Invite ---
         existing_invite_info_key = None
         existing_invite_info_params = {}
-        cmd_logger.debug(
-            f"Checking database for existing invite for user {user.display_name} (ID: {user.id})"
+        _create_user_invite_logger.debug(
+            "Checking database for existing invite for user %s (ID: %s)",
+            user.display_name,
+            user.id,
         )
-        existing_invite = bot.db.get_invite_info(str(user.id))
+        existing_invite = await bot.run_db(bot.db.get_invite_info, str(user.id))
         if existing_invite:
-            current_time = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            current_time = int(time.time())
             expiry_dt = datetime.datetime.fromtimestamp(
                 existing_invite.expires_at, tz=datetime.timezone.utc
             )
@@ -188,7 +218,9 @@ async def create_user_invite_command(
                     "expiry_date_time": expiry_dt.strftime("%Y-%m-%d %H:%M %Z")
                 }
 
-            cmd_logger.info(log_message)  # Log the detailed check result
+            _create_user_invite_logger.info(
+                log_message
+            )  # Log the detailed check result
             # No need to explicitly block, record_invite will update the record.
         else:
             existing_invite_info_key = None
@@ -209,18 +241,20 @@ async def create_user_invite_command(
                 date=datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d"),
             )
         except KeyError as e:
-            cmd_logger.error(f"Invalid placeholder in paid invite label format: {e}")
+            _create_user_invite_logger.error(
+                f"Invalid placeholder in paid invite label format: {e}"
+            )
             await interaction.followup.send(
                 f"❌ Configuration Error: Invalid placeholder in paid invite label format: {e}. Please check `invite_settings.paid_invite_label_format` in config.",
                 ephemeral=True,
             )
             return
 
-        cmd_logger.info(
+        _create_user_invite_logger.info(
             f"Attempting to create user invite via JFA-GO with label: {label}, plan: {plan_type}, user_days: {total_user_days}, invite_days: {invite_duration_days}"
         )
 
-        success, message = await asyncio.to_thread(
+        success, message = await bot.run_jfa(
             bot.jfa_client.create_invite,
             label=label,
             profile_name=plan_type,
@@ -230,7 +264,9 @@ async def create_user_invite_command(
         )
 
         if not success:
-            cmd_logger.error(f"JFA-GO failed to create user invite: {message}")
+            _create_user_invite_logger.error(
+                f"JFA-GO failed to create user invite: {message}"
+            )
             await interaction.followup.send(
                 get_message(
                     "user_invite.error_jfa_create_failed", error_message=message
@@ -240,21 +276,19 @@ async def create_user_invite_command(
             return
 
         # --- Get Invite Code ---
-        invite_code, message = await asyncio.to_thread(
-            bot.jfa_client.get_invite_code, label
-        )
+        invite_code, message = await bot.run_jfa(bot.jfa_client.get_invite_code, label)
         if not invite_code:
             # Attempt to fetch again with slight delay in case of race condition
-            cmd_logger.warning(
+            _create_user_invite_logger.warning(
                 f"Initial fetch failed for invite code '{label}', retrying after delay... Error: {message}"
             )
             await asyncio.sleep(1)
-            invite_code, message = await asyncio.to_thread(
+            invite_code, message = await bot.run_jfa(
                 bot.jfa_client.get_invite_code, label
             )
 
             if not invite_code:
-                cmd_logger.error(
+                _create_user_invite_logger.error(
                     f"Failed to retrieve user invite code from JFA-GO after retry: {message}"
                 )
                 await interaction.followup.send(
@@ -278,14 +312,17 @@ async def create_user_invite_command(
         invite_base_url = get_config_value("invite_settings.invite_link_base_url")
         if not invite_base_url:
             # Fallback or error if not configured - for now, log and use a sensible default or raise error
-            cmd_logger.error("invite_settings.invite_link_base_url is not configured!")
+            _create_user_invite_logger.error(
+                "invite_settings.invite_link_base_url is not configured!"
+            )
             # Depending on strictness, either use a placeholder, a default, or stop
             await interaction.followup.send(
                 get_message("errors.config_missing_invite_base_url"), ephemeral=True
             )
             return
 
-        bot.db.record_invite(
+        await bot.run_db(
+            bot.db.record_invite,
             user_id=str(user.id),
             username=user.display_name,
             invite_code=invite_code,
@@ -294,7 +331,7 @@ async def create_user_invite_command(
         )
         invite_url = f"{invite_base_url}{invite_code}"
 
-        cmd_logger.info(
+        _create_user_invite_logger.info(
             f"User invite recorded for {user.display_name}. Attempting to assign role for plan: {plan_type}."
         )
 
@@ -314,21 +351,17 @@ async def create_user_invite_command(
         removed_roles_messages = []
 
         # Get configured trial role name
-        trial_role_name_config = get_config_value("discord.trial_user_role_name")
-        trial_role_obj = None
-        if trial_role_name_config:
-            trial_role_obj = discord.utils.get(
-                interaction.guild.roles, name=trial_role_name_config
-            )
+        trial_role_name_config = bot.trial_role_name
+        trial_role_obj = bot.get_role_by_name(interaction.guild, trial_role_name_config)
 
         # Remove previous mapped roles and old trial role (if different from new trial role)
         roles_to_remove_from_user = []
         plan_role_map = get_config_value(
             "commands.create_user_invite.plan_to_role_map", {}
         )
-        all_mapped_roles_names_or_ids = [
-            str(r_name_or_id) for r_name_or_id in plan_role_map.values()
-        ]
+        # Cached frozenset of the mapped role names/IDs as strings, so each of the
+        # user's roles is matched with a hash lookup instead of a list scan
+        all_mapped_roles_names_or_ids = bot.managed_paid_role_keys
 
         # Add the configured trial role to the list of roles that could potentially be removed
         # if it's different from the current trial role being assigned or checked.
@@ -353,152 +386,147 @@ async def create_user_invite_command(
             ):  # remove old trial role if name changed
                 roles_to_remove_from_user.append(role)
 
-        if roles_to_remove_from_user:
-            removed_role_names = []
-            for role_to_remove in roles_to_remove_from_user:
-                try:
-                    await user.remove_roles(
-                        role_to_remove,
-                        reason=f"User invite created by {interaction.user.display_name} - removing old plan role.",
-                    )
-                    removed_roles_messages.append(
-                        get_message(
-                            "user_invite.role_removed_log",
-                            role_name=role_to_remove.name,
-                        )
-                    )
-                    removed_role_names.append(role_to_remove.name)
-                except discord.Forbidden:
-                    removed_roles_messages.append(
-                        get_message(
-                            "user_invite.warning_old_role_remove_failed_permission",
-                            role_name=role_to_remove.name,
-                        )
-                    )
-                except discord.HTTPException:
-                    removed_roles_messages.append(
-                        get_message(
-                            "user_invite.warning_old_role_remove_failed_api",
-                            role_name=role_to_remove.name,
-                        )
-                    )
-            if removed_role_names:
-                action_details_parts.append(
-                    f"Removed old roles: {', '.join(removed_role_names)}."
-                )
-
-        # Assign new role based on plan_to_role_map
+        # Resolve the plan role to assign based on plan_to_role_map
+        new_role = None
         new_role_name_or_id = plan_role_map.get(plan_type)
         if new_role_name_or_id:
-            new_role = discord.utils.get(
-                interaction.guild.roles, name=str(new_role_name_or_id)
-            )
+            new_role = bot.get_role_by_name(interaction.guild, str(new_role_name_or_id))
             if not new_role:  # Try by ID if name failed
                 try:
                     new_role = interaction.guild.get_role(int(new_role_name_or_id))
                 except ValueError:
                     pass  # new_role_name_or_id was not an int
-
+        # Keep the plan role if the user already has it rather than removing it
+        if new_role in roles_to_remove_from_user:
+            roles_to_remove_from_user.remove(new_role)
+
+        # Work out every role change first and apply them all with one member edit.
+        # Entries are either (operation, role) pairs, whose message depends on the
+        # outcome of the edit, or (message, action detail) pairs that are already final.
+        roles_to_add = []
+        role_message_entries = []
+        if new_role_name_or_id:
             if new_role:
                 if new_role not in user.roles:
-                    try:
-                        await user.add_roles(
-                            new_role,
-                            reason=f"User invite created by {interaction.user.display_name} - plan: {plan_type}",
-                        )
-                        assigned_roles_messages.append(
-                            get_message(
-                                "user_invite.role_assigned_log", role_name=new_role.name
-                            )
-                        )
-                        action_details_parts.append(
-                            f"Assigned plan role: {new_role.name}."
-                        )
-                    except discord.Forbidden:
-                        assigned_roles_messages.append(
-                            get_message(
-                                "user_invite.warning_new_role_assign_failed_permission",
-                                role_name=new_role.name,
-                            )
-                        )
-                    except discord.HTTPException:
-                        assigned_roles_messages.append(
+                    roles_to_add.append(new_role)
+                    role_message_entries.append(("assign", new_role))
+                else:
+                    role_message_entries.append(
+                        (
                             get_message(
-                                "user_invite.warning_new_role_assign_failed_api",
+                                "user_invite.role_already_had_log",
                                 role_name=new_role.name,
-                            )
-                        )
-                else:
-                    assigned_roles_messages.append(
-                        get_message(
-                            "user_invite.role_already_had_log", role_name=new_role.name
+                            ),
+                            f"User already had plan role: {new_role.name}.",
                         )
                     )
-                    action_details_parts.append(
-                        f"User already had plan role: {new_role.name}."
-                    )
             else:
-                assigned_roles_messages.append(
-                    get_message(
-                        "user_invite.warning_new_role_not_found",
-                        role_name=new_role_name_or_id,
+                role_message_entries.append(
+                    (
+                        get_message(
+                            "user_invite.warning_new_role_not_found",
+                            role_name=new_role_name_or_id,
+                        ),
+                        None,
                     )
                 )
         else:
-            assigned_roles_messages.append(
-                get_message(
-                    "user_invite.info_new_role_mapping_not_found", plan_type=plan_type
+            role_message_entries.append(
+                (
+                    get_message(
+                        "user_invite.info_new_role_mapping_not_found",
+                        plan_type=plan_type,
+                    ),
+                    None,
                 )
             )
 
         # Assign Trial Role if not already present
         if trial_role_obj:
             if trial_role_obj not in user.roles:
-                try:
-                    await user.add_roles(
-                        trial_role_obj,
-                        reason=f"User invite (paid plan) created by {interaction.user.display_name} - ensuring trial role presence.",
-                    )
-                    assigned_roles_messages.append(
-                        get_message(
-                            "user_invite.trial_role_assigned_log",
-                            role_name=trial_role_obj.name,
-                        )
-                    )
-                    action_details_parts.append(
-                        f"Assigned trial role: {trial_role_obj.name}."
-                    )
-                except discord.Forbidden:
-                    assigned_roles_messages.append(
-                        get_message(
-                            "user_invite.warning_trial_role_assign_failed_permission",
-                            role_name=trial_role_obj.name,
-                        )
-                    )
-                except discord.HTTPException:
-                    assigned_roles_messages.append(
+                roles_to_add.append(trial_role_obj)
+                role_message_entries.append(("trial", trial_role_obj))
+            else:
+                role_message_entries.append(
+                    (
                         get_message(
-                            "user_invite.warning_trial_role_assign_failed_api",
+                            "user_invite.trial_role_already_had_log",
                             role_name=trial_role_obj.name,
-                        )
+                        ),
+                        f"User already had trial role: {trial_role_obj.name}.",
                     )
-            else:
-                assigned_roles_messages.append(
+                )
+        elif trial_role_name_config:  # Configured but not found
+            role_message_entries.append(
+                (
                     get_message(
-                        "user_invite.trial_role_already_had_log",
-                        role_name=trial_role_obj.name,
-                    )
+                        "user_invite.warning_trial_role_not_found",
+                        role_name=trial_role_name_config,
+                    ),
+                    None,
                 )
-                action_details_parts.append(
-                    f"User already had trial role: {trial_role_obj.name}."
+            )
+
+        role_edit_outcome = "ok"
+        if roles_to_remove_from_user or roles_to_add:
+            # Leave out @everyone, as discord.py's own add_roles/remove_roles do
+            final_roles = [
+                role
+                for role in user.roles
+                if not role.is_default() and role not in roles_to_remove_from_user
+            ] + roles_to_add
+            try:
+                await user.edit(
+                    roles=final_roles,
+                    reason=f"User invite created by {interaction.user.display_name} - plan: {plan_type}",
                 )
-        elif trial_role_name_config:  # Configured but not found
-            assigned_roles_messages.append(
+            except discord.Forbidden:
+                role_edit_outcome = "permission"
+                _create_user_invite_logger.warning(
+                    f"Missing permission to update roles for {user.display_name} (ID: {user.id}): "
+                    f"removing {[role.id for role in roles_to_remove_from_user]}, "
+                    f"adding {[role.id for role in roles_to_add]}."
+                )
+            except discord.HTTPException as e:
+                role_edit_outcome = "api"
+                _create_user_invite_logger.error(
+                    f"Failed to update roles for {user.display_name} (ID: {user.id}): "
+                    f"removing {[role.id for role in roles_to_remove_from_user]}, "
+                    f"adding {[role.id for role in roles_to_add]}: {e}"
+                )
+
+        for role_to_remove in roles_to_remove_from_user:
+            removed_roles_messages.append(
                 get_message(
-                    "user_invite.warning_trial_role_not_found",
-                    role_name=trial_role_name_config,
+                    ROLE_CHANGE_MESSAGE_KEYS[("remove", role_edit_outcome)],
+                    role_name=role_to_remove.name,
                 )
             )
+        if roles_to_remove_from_user and role_edit_outcome == "ok":
+            action_details_parts.append(
+                f"Removed old roles: {', '.join(role.name for role in roles_to_remove_from_user)}."
+            )
+
+        for message_or_operation, role_or_detail in role_message_entries:
+            if message_or_operation in ("assign", "trial"):
+                assigned_roles_messages.append(
+                    get_message(
+                        ROLE_CHANGE_MESSAGE_KEYS[
+                            (message_or_operation, role_edit_outcome)
+                        ],
+                        role_name=role_or_detail.name,
+                        user_mention=user.mention,
+                    )
+                )
+                if role_edit_outcome == "ok":
+                    role_kind = "plan" if message_or_operation == "assign" else "trial"
+                    action_details_parts.append(
+                        f"Assigned {role_kind} role: {role_or_detail.name}."
+                    )
+            else:
+                assigned_roles_messages.append(message_or_operation)
+                if role_or_detail:
+                    action_details_parts.append(role_or_detail)
 
         action_details_full = "\n".join(action_details_parts)
         if len(action_details_full) > 1000:  # Discord embed field value limit
@@ -513,8 +541,8 @@ async def create_user_invite_command(
             details=action_details_full,
             performed_at=now_ts,
         )
-        bot.db.record_admin_action(action)
-        await bot.log_admin_action(action)
+        bot.queue_admin_action(action)
+        bot.log_admin_action_in_background(action)
 
         # --- Send Confirmation (Channel) ---
         embed = create_embed(
@@ -572,8 +600,9 @@ async def create_user_invite_command(
 
         # Add note about existing invite if relevant
         if existing_invite_info_key:
-            cmd_logger.debug(
-                f"Adding note to embed about existing invite: {existing_invite_info_key}"
+            _create_user_invite_logger.debug(
+                "Adding note to embed about existing invite: %s",
+                existing_invite_info_key,
             )
             embed.add_field(
                 name=get_message("user_invite.confirm_channel_note_field_name"),
@@ -608,7 +637,7 @@ async def create_user_invite_command(
 
         await interaction.followup.send(embed=embed)
 
-        cmd_logger.info(
+        _create_user_invite_logger.info(
             f"Confirmation sent. Attempting to send DM to user {user.display_name}."
         )
 
@@ -661,13 +690,15 @@ async def create_user_invite_command(
             # For now, keeping DM simpler, but this could be added.
 
             await user.send(embed=dm_embed)
-            cmd_logger.info(f"Successfully sent user invite DM to {user.display_name}.")
+            _create_user_invite_logger.info(
+                f"Successfully sent user invite DM to {user.display_name}."
+            )
             await interaction.followup.send(
                 get_message("user_invite.ephemeral_dm_sent", user_mention=user.mention),
                 ephemeral=True,
             )
         except discord.Forbidden:
-            cmd_logger.warning(
+            _create_user_invite_logger.warning(
                 f"Could not send user invite DM to {user.display_name} (ID: {user.id}): DMs disabled or bot blocked."
             )
             await interaction.followup.send(
@@ -678,7 +709,7 @@ async def create_user_invite_command(
                 ephemeral=True,
             )
         except Exception as e:
-            cmd_logger.error(
+            _create_user_invite_logger.error(
                 f"Error sending user invite DM to user {user.display_name}: {str(e)}",
                 exc_info=True,
             )
@@ -691,7 +722,7 @@ async def create_user_invite_command(
             )
 
     except Exception as e:
-        cmd_logger.error(
+        _create_user_invite_logger.error(
             f"Unhandled error in create_user_invite command: {str(e)}", exc_info=True
         )
         # Check if response already sent before sending error message
@@ -708,27 +739,30 @@ async def create_user_invite_command(
                     ephemeral=True,
                 )
             except discord.HTTPException:
-                cmd_logger.error("Failed to send error followup message.")
+                _create_user_invite_logger.error(
+                    "Failed to send error followup message."
+                )
 
 
 async def create_user_invite_error(
     interaction: discord.Interaction, error: app_commands.AppCommandError
 ):
     """Error handler for the create_user_invite command."""
-    err_logger = logger.getChild("create-user-invite.error")
-    err_logger.debug(
-        f"Error handler invoked for user {interaction.user} with error type {type(error)}"
+    _create_user_invite_err_logger.debug(
+        "Error handler invoked for user %s with error type %s",
+        interaction.user,
+        type(error),
     )
     try:
         if isinstance(error, app_commands.errors.CheckFailure):
             # The check failure message is handled by the decorator/check itself
-            err_logger.warning(
+            _create_user_invite_err_logger.warning(
                 f"CheckFailure suppressed for user {interaction.user}: {error}"
             )
             pass
         elif isinstance(error, app_commands.errors.CommandInvokeError):
             # Errors inside the command function are already logged by the main try/except
-            err_logger.error(
+            _create_user_invite_err_logger.error(
                 f"CommandInvokeError caught (error logged previously): {error.original}"
             )
             # Send a generic message only if no response has been sent yet
@@ -739,7 +773,7 @@ async def create_user_invite_error(
                 )
         else:
             # Log other unexpected AppCommandErrors
-            err_logger.error(
+            _create_user_invite_err_logger.error(
                 f"Unhandled AppCommandError in create_user_invite: {type(error).__name__} - {str(error)}",
                 exc_info=True,
             )
@@ -750,7 +784,7 @@ async def create_user_invite_error(
                 )
     except Exception as e:
         # Catch errors within the error handler itself
-        err_logger.critical(
+        _create_user_invite_err_logger.critical(
             f"CRITICAL: Error within create_user_invite_error handler: {str(e)}",
             exc_info=True,
         )
@@ -12,14 +12,18 @@ configuration available throughout the application.
 Key components:
 - APP_CONFIG: The global configuration dictionary
 - get_config_value: Function to retrieve values using dot notation
+- get_config_snapshot: Read-only view of the loaded configuration, built once per load
 - validate_config: Validates configuration against expected structure and types
+- ensure_config_validated: Runs validate_config once per process
 - load_app_config: Loads and merges configuration from all sources
 """
 
+import functools
 import logging
 import os
 import sys
-from typing import Any, Dict, Tuple, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Optional
 
 import yaml  # Added for YAML loading
 from dotenv import load_dotenv
@@ -41,7 +45,9 @@ __all__ = [
     "APP_CONFIG",
     "load_app_config",
     "get_config_value",
+    "get_config_snapshot",
     "validate_config",
+    "ensure_config_validated",
 ]
 
 # --- Default values for YAML structure (helps with validation and access) ---
@@ -98,9 +104,11 @@ DEFAULT_CONFIG_STRUCTURE = {
         "expiry_check_fetch_days": 4,
         "expiry_notification_interval_days": 2,
         "notification_days_before_expiry": [3, 0],
+        "dm_concurrency": 8,
     },
     "sync_settings": {  # New section for sync task configurations
         "jfa_user_sync_interval_hours": 12,
+        "jfa_upsert_batch_size": 500,
     },
     "commands": {
         "create_trial_invite": {
@@ -174,11 +182,13 @@ EXPECTED_CONFIG: Dict[str, Tuple[type, bool, Any]] = {
     "notification_settings.expiry_check_fetch_days": (int, False, 4),
     "notification_settings.expiry_notification_interval_days": (int, False, 2),
     "notification_settings.notification_days_before_expiry": (list, False, [3, 0]),
+    "notification_settings.dm_concurrency": (int, False, 8),
     "sync_settings.jfa_user_sync_interval_hours": (
         int,
         False,
         12,
     ),  # New expected config
+    "sync_settings.jfa_upsert_batch_size": (int, False, 500),
     "commands.create_trial_invite.jfa_user_expiry_days": (int, False, 3),
     "commands.create_trial_invite.assign_role_name": (
         str,
@@ -200,7 +210,10 @@ def _load_yaml_config(path: str = "config.yaml") -> Dict[str, Any]:
     try:
         if os.path.exists(path):
             with open(path, "r") as f:
-                yaml_config = yaml.safe_load(f)
+                # Prefer the libyaml-backed loader when PyYAML was built with it
+                yaml_config = yaml.load(
+                    f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                )
                 logger.info(f"Successfully loaded configuration from {path}")
                 return yaml_config or {}
         else:
@@ -346,11 +359,30 @@ def load_app_config(config_file_path: Optional[str] = None) -> dict:
 
     # Set global APP_CONFIG
     APP_CONFIG = merged_config
+    # Any snapshot taken before this load now points at the old dictionary
+    get_config_snapshot.cache_clear()
 
     logger.debug(f"Configuration loaded with {len(APP_CONFIG)} top-level keys.")
     return APP_CONFIG
 
 
+@functools.lru_cache(maxsize=1)
+def get_config_snapshot() -> Mapping[str, Any]:
+    """
+    Returns a read-only view of the loaded configuration.
+
+    The snapshot is built once and reused until the configuration is reloaded
+    (load_app_config clears it), so callers reading several values in a row can
+    index into it directly instead of repeating dot-path lookups.
+
+    Returns:
+        Mapping[str, Any]: Read-only mapping of the top-level configuration sections
+    """
+    if not APP_CONFIG:
+        load_app_config()
+    return MappingProxyType(APP_CONFIG)
+
+
 # Load configuration when this module is imported
 load_app_config()
 
@@ -598,6 +630,17 @@ def validate_config() -> None:
     logger.info("Configuration validated successfully.")
 
 
+@functools.lru_cache(maxsize=1)
+def ensure_config_validated() -> None:
+    """
+    Runs validate_config() once per process.
+
+    Both the CLI entry point and JfaGoBot call this, so the configuration is
+    validated exactly once no matter which of them gets there first.
+    """
+    validate_config()
+
+
 # Note: The old flat variables like TOKEN, JFA_USERNAME are kept for now to minimize
 # immediate changes in other files. Other modules will still import them directly.
 # Gradually, other modules should be updated to use get_config_value('path.to.setting')
@@ -1,17 +1,20 @@
 """Database operations for the application."""
 
 import datetime
+import itertools
 import logging
 import sqlite3
 from contextlib import contextmanager
-from typing import Generator, List, Optional, Dict, Any
+from typing import Generator, Iterable, List, Optional, Dict, Any, Tuple
 import os
 
 from modules.config import get_config_value
 from modules.models import AdminAction, InviteInfo
 
 # Database schema
-CREATE_TABLE_SQL = """
+# user_invites rows are looked up and updated by user_id only, so user_id is the
+# table's own key (WITHOUT ROWID). Kept separate for _migrate_user_invites_without_rowid.
+USER_INVITES_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS user_invites (
     user_id TEXT PRIMARY KEY,
     username TEXT NOT NULL,
@@ -24,7 +27,19 @@ CREATE TABLE IF NOT EXISTS user_invites (
     account_expires_at INTEGER NULL,-- Added: Timestamp when the JFA-GO account expires
     last_notified_at INTEGER NULL,  -- Added: Timestamp when expiry notification was last sent
     status TEXT NULL                -- Added: 'trial', 'paid', 'disabled'
-);
+) WITHOUT ROWID
+"""
+
+CREATE_TABLE_SQL = f"""
+{USER_INVITES_TABLE_SQL};
+
+-- Speeds up the expiry notification range scan on account_expires_at
+CREATE INDEX IF NOT EXISTS idx_user_invites_account_expires_at
+    ON user_invites (account_expires_at);
+
+-- Lets remove-invite look up an invite by Discord username without a table scan
+CREATE INDEX IF NOT EXISTS idx_user_invites_username
+    ON user_invites (username);
 
 CREATE TABLE IF NOT EXISTS admin_actions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -48,6 +63,12 @@ CREATE TABLE IF NOT EXISTS jfa_user_cache (
     jfa_admin BOOLEAN,
     last_synced INTEGER NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS bot_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at INTEGER NOT NULL
+);
 """
 
 
@@ -82,8 +103,12 @@ class Database:
         """Initialize the database with required tables"""
         try:
             with self._get_connection() as conn:
+                # WAL is a property of the database file, so it only needs setting once;
+                # readers no longer block the writer and commits append to the log
+                conn.execute("PRAGMA journal_mode=WAL")
                 conn.executescript(CREATE_TABLE_SQL)
                 conn.commit()
+                self._migrate_user_invites_without_rowid(conn)
                 self.logger.info(
                     f"Database initialized successfully: {self.db_file_name}"
                 )
@@ -93,6 +118,59 @@ class Database:
             )
             raise
 
+    def _migrate_user_invites_without_rowid(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a user_invites table created before it became WITHOUT ROWID.
+
+        With user_id stored as the table's own key, point lookups and updates by
+        user_id take one B-tree search instead of going through the primary key
+        index and then the rowid. Existing rows are copied into the new table in a
+        single transaction, except rows without a user_id, which are dropped and
+        counted in a warning; databases that are already migrated are left alone.
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'user_invites'"
+        ).fetchone()
+        if row is None or "WITHOUT ROWID" in row["sql"].upper():
+            return
+
+        self.logger.info("Migrating user_invites to a WITHOUT ROWID table...")
+        try:
+            conn.execute("BEGIN")
+            conn.execute("ALTER TABLE user_invites RENAME TO user_invites_old")
+            conn.execute(USER_INVITES_TABLE_SQL)
+            new_columns = {
+                column["name"]
+                for column in conn.execute("PRAGMA table_info(user_invites)")
+            }
+            old_columns = [
+                column["name"]
+                for column in conn.execute("PRAGMA table_info(user_invites_old)")
+            ]
+            columns = ", ".join(c for c in old_columns if c in new_columns)
+            # The rowid table accepted a NULL user_id, but a WITHOUT ROWID key can't
+            # hold one; such rows can't be looked up by user anyway, so skip them
+            dropped_count = conn.execute(
+                "SELECT COUNT(*) FROM user_invites_old WHERE user_id IS NULL"
+            ).fetchone()[0]
+            conn.execute(
+                f"INSERT INTO user_invites ({columns}) "
+                f"SELECT {columns} FROM user_invites_old WHERE user_id IS NOT NULL"
+            )
+            # Dropping the old table also drops its indexes
+            conn.execute("DROP TABLE user_invites_old")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        # Recreate the user_invites indexes on the new table
+        conn.executescript(CREATE_TABLE_SQL)
+        conn.commit()
+        if dropped_count:
+            self.logger.warning(
+                f"Dropped {dropped_count} user_invites row(s) without a user_id while migrating."
+            )
+        self.logger.info("Migrated user_invites to a WITHOUT ROWID table.")
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database connections with proper error handling"""
@@ -100,6 +178,9 @@ class Database:
         try:
             conn = sqlite3.connect(self.db_file_name)
             conn.row_factory = sqlite3.Row
+            # Per connection: in WAL mode NORMAL only syncs at checkpoints, not on
+            # every commit, and a power loss can at most roll back the last commits
+            conn.execute("PRAGMA synchronous=NORMAL")
             self.logger.debug(f"Database connection opened: {self.db_file_name}")
             yield conn
         except sqlite3.Error as e:
@@ -260,6 +341,46 @@ class Database:
             )
             raise
 
+    def record_admin_actions(self, actions: List[AdminAction]) -> None:
+        """Record many admin actions in a single transaction.
+
+        Args:
+            actions: The admin actions to insert, in the order they were performed
+        """
+        if not actions:
+            return
+
+        self.logger.debug(f"Recording {len(actions)} admin action(s).")
+        try:
+            with self._get_connection() as conn:
+                with conn:  # Transaction
+                    conn.executemany(
+                        """
+                        INSERT INTO admin_actions (
+                            admin_id, admin_username, action_type,
+                            target_user_id, target_username, details, performed_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                action.admin_id,
+                                action.admin_username,
+                                action.action_type,
+                                action.target_user_id,
+                                action.target_username,
+                                action.details,
+                                action.performed_at,
+                            )
+                            for action in actions
+                        ],
+                    )
+                    self.logger.info(f"Recorded {len(actions)} admin action(s).")
+        except Exception as e:
+            self.logger.error(
+                f"Error recording {len(actions)} admin action(s): {str(e)}"
+            )
+            raise
+
     def delete_invite(self, user_id: str) -> bool:
         """Delete an invite for a user"""
         self.logger.debug(f"Attempting to delete invite for user_id: {user_id}")
@@ -324,29 +445,83 @@ class Database:
             )
             # Optionally raise e
 
-    def get_expiring_users(self, days_notice: int) -> List[sqlite3.Row]:
-        """Get users from user_invites table whose accounts are expiring soon and haven't been notified recently."""
+    def batch_update_last_notified(self, updates: List[Tuple[str, int]]) -> None:
+        """Update last_notified_at for many users in a single transaction.
+
+        Args:
+            updates: (user_id, timestamp) pairs to write
+        """
+        if not updates:
+            return
+
+        self.logger.debug(f"Updating last_notified_at for {len(updates)} user(s).")
+        try:
+            with self._get_connection() as conn:
+                with conn:  # Transaction
+                    conn.executemany(
+                        "UPDATE user_invites SET last_notified_at = ? WHERE user_id = ?",
+                        [(timestamp, user_id) for user_id, timestamp in updates],
+                    )
+                    self.logger.info(
+                        f"Updated last_notified_at for {len(updates)} user(s)."
+                    )
+        except Exception as e:
+            self.logger.error(
+                f"Error batch updating last_notified_at for {len(updates)} user(s): {str(e)}"
+            )
+
+    def get_expiring_users_due_status(
+        self,
+        now_ts: int,
+        days_notice: int,
+        notification_days: Iterable[int],
+        interval_seconds: int,
+    ) -> List[sqlite3.Row]:
+        """
+        Get users whose accounts expire within days_notice days, with their notification status.
+
+        Besides the user_invites columns, each row carries the
+        whole days left until expiry (days_remaining) and whether an expiry DM is due
+        (notification_due): days_remaining is one of notification_days and the user
+        was not notified within the last interval_seconds. Both are computed by SQLite.
+
+        Args:
+            now_ts: Current Unix timestamp
+            days_notice: How many days ahead to look for expiring accounts
+            notification_days: Days before expiry on which users are notified
+            interval_seconds: Minimum number of seconds between two notifications
+
+        Returns:
+            List[sqlite3.Row]: Matching users, empty on error
+        """
         self.logger.debug(f"Fetching users expiring within {days_notice} days.")
-        now = int(
-            datetime.datetime.now(datetime.timezone.utc).timestamp()
-        )  # Ensure UTC
-        # Calculate the timestamp for X days from now
-        notice_timestamp = now + (days_notice * 86400)
-        # The check for "notified recently" is handled in bot.py using a configurable interval.
-        # recent_notification_threshold = now - 604800 # Removed unused variable
+        params: Dict[str, int] = {
+            "now_ts": now_ts,
+            "notice_ts": now_ts + (days_notice * 86400),
+            "interval_seconds": interval_seconds,
+        }
+        day_placeholders = []
+        for index, day in enumerate(notification_days):
+            params[f"day_{index}"] = day
+            day_placeholders.append(f":day_{index}")
 
         results = []
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
-                    """
-                    SELECT user_id, username, account_expires_at, plan_type, last_notified_at
+                    f"""
+                    SELECT user_id, username, account_expires_at, plan_type, last_notified_at,
+                        (account_expires_at - :now_ts) / 86400 AS days_remaining,
+                        (
+                            (account_expires_at - :now_ts) / 86400 IN ({", ".join(day_placeholders)})
+                            AND (last_notified_at IS NULL OR :now_ts - last_notified_at > :interval_seconds)
+                        ) AS notification_due
                     FROM user_invites
                     WHERE account_expires_at IS NOT NULL
-                    AND account_expires_at <= ? -- Expires within the notice period (or slightly beyond)
-                    AND account_expires_at > ?  -- Has not already expired
+                    AND account_expires_at <= :notice_ts -- Expires within the notice period
+                    AND account_expires_at > :now_ts  -- Has not already expired
                     """,
-                    (notice_timestamp, now),
+                    params,
                 )
                 results = cursor.fetchall()
                 self.logger.info(
@@ -358,30 +533,81 @@ class Database:
 
         return results
 
-    def upsert_jfa_users(self, users_data: List[Dict[str, Any]]) -> None:
-        """Bulk inserts or updates JFA-GO user data into the jfa_user_cache table."""
+    def get_next_notification_day_start(
+        self, now_ts: int, notification_days: Iterable[int]
+    ) -> Optional[int]:
+        """
+        Get the earliest future time at which a user's days_remaining enters a notification day.
+
+        days_remaining is computed as in get_expiring_users_due_status, i.e. the whole
+        days between now and account_expires_at.
+
+        Args:
+            now_ts: Current Unix timestamp
+            notification_days: Days before expiry on which users are notified
+
+        Returns:
+            Optional[int]: Unix timestamp of the next such moment, or None if there is none
+        """
+        notification_days = list(notification_days)
+        if not notification_days:
+            return None
+
+        day_values = ", ".join("(?)" for _ in notification_days)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    f"""
+                    WITH notification_days(day) AS (VALUES {day_values})
+                    SELECT MIN(account_expires_at - (day + 1) * 86400 + 1) AS next_start
+                    FROM user_invites, notification_days
+                    WHERE account_expires_at IS NOT NULL
+                    AND account_expires_at - (day + 1) * 86400 + 1 > ?
+                    """,
+                    (*notification_days, now_ts),
+                )
+                row = cursor.fetchone()
+                return row["next_start"] if row else None
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching next expiry notification day start: {str(e)}"
+            )
+            return None
+
+    def upsert_jfa_users(
+        self, users_data: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> None:
+        """Bulk inserts or updates JFA-GO user data into the jfa_user_cache table.
+
+        Rows are converted and written in batches of batch_size (default
+        sync_settings.jfa_upsert_batch_size) with executemany, all inside a
+        single transaction, so only one batch of parameters is held at a time.
+        """
         if not users_data:
             self.logger.info("upsert_jfa_users: No user data provided to upsert.")
             return
 
+        if batch_size is None:
+            batch_size = get_config_value("sync_settings.jfa_upsert_batch_size", 500)
+        batch_size = max(1, int(batch_size))
+
         self.logger.info(f"Upserting {len(users_data)} users into jfa_user_cache.")
         now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
 
-        records_to_upsert = []
-        for user_info in users_data:
-            if not user_info.get("id") or not user_info.get("name"):
-                self.logger.warning(
-                    f"Skipping user data due to missing id or name: {user_info}"
-                )
-                continue
+        def _records_to_upsert() -> Generator[Tuple[Any, ...], None, None]:
+            for user_info in users_data:
+                if not user_info.get("id") or not user_info.get("name"):
+                    self.logger.warning(
+                        f"Skipping user data due to missing id or name: {user_info}"
+                    )
+                    continue
 
-            discord_id_val = user_info.get("discord_id")
-            # Convert empty string discord_id to None to play well with UNIQUE constraint if multiple users have no Discord ID
-            if discord_id_val == "":
-                discord_id_val = None
+                discord_id_val = user_info.get("discord_id")
+                # Convert empty string discord_id to None to play well with UNIQUE constraint if multiple users have no Discord ID
+                if discord_id_val == "":
+                    discord_id_val = None
 
-            records_to_upsert.append(
-                (
+                yield (
                     user_info.get("id"),
                     user_info.get("name"),
                     discord_id_val,  # Use the potentially modified value
@@ -392,39 +618,42 @@ class Database:
                     user_info.get("admin"),  # from JFA-GO field name
                     now,
                 )
-            )
-
-        if not records_to_upsert:
-            self.logger.info(
-                "upsert_jfa_users: No valid records to upsert after filtering."
-            )
-            return
 
+        upserted_count = 0
         try:
             with self._get_connection() as conn:
                 with conn:  # Transaction
-                    conn.executemany(
-                        """
-                        INSERT INTO jfa_user_cache (
-                            jfa_id, jellyfin_username, discord_id, email, expiry,
-                            disabled, jfa_accounts_admin, jfa_admin, last_synced
+                    records = _records_to_upsert()
+                    while batch := list(itertools.islice(records, batch_size)):
+                        conn.executemany(
+                            """
+                            INSERT INTO jfa_user_cache (
+                                jfa_id, jellyfin_username, discord_id, email, expiry,
+                                disabled, jfa_accounts_admin, jfa_admin, last_synced
+                            )
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT(jfa_id) DO UPDATE SET
+                                jellyfin_username = excluded.jellyfin_username,
+                                discord_id = excluded.discord_id,
+                                email = excluded.email,
+                                expiry = excluded.expiry,
+                                disabled = excluded.disabled,
+                                jfa_accounts_admin = excluded.jfa_accounts_admin,
+                                jfa_admin = excluded.jfa_admin,
+                                last_synced = excluded.last_synced;
+                        """,
+                            batch,
                         )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(jfa_id) DO UPDATE SET
-                            jellyfin_username = excluded.jellyfin_username,
-                            discord_id = excluded.discord_id,
-                            email = excluded.email,
-                            expiry = excluded.expiry,
-                            disabled = excluded.disabled,
-                            jfa_accounts_admin = excluded.jfa_accounts_admin,
-                            jfa_admin = excluded.jfa_admin,
-                            last_synced = excluded.last_synced;
-                    """,
-                        records_to_upsert,
-                    )
-                    self.logger.info(
-                        f"Successfully upserted {len(records_to_upsert)} records into jfa_user_cache."
-                    )
+                        upserted_count += len(batch)
+
+            if upserted_count:
+                self.logger.info(
+                    f"Successfully upserted {upserted_count} records into jfa_user_cache."
+                )
+            else:
+                self.logger.info(
+                    "upsert_jfa_users: No valid records to upsert after filtering."
+                )
         except sqlite3.Error as e:
             self.logger.error(
                 f"Database error during jfa_user_cache upsert: {e}", exc_info=True
@@ -514,6 +743,62 @@ class Database:
             )
             return None
 
+    def resolve_jfa_user_from_cache(
+        self, discord_id: Optional[str], jellyfin_usernames: Iterable[str] = ()
+    ) -> Optional[sqlite3.Row]:
+        """Finds a cached JFA-GO user by Discord ID or by any of several Jellyfin usernames.
+
+        All candidates are checked with a single query. When more than one row
+        matches, the row linked to discord_id wins, followed by the usernames in the
+        order given, so callers get the same result as trying each lookup in turn.
+
+        Args:
+            discord_id: Discord ID to match against the discord_id column, if any.
+            jellyfin_usernames: Jellyfin usernames to try, in priority order.
+
+        Returns:
+            The best matching jfa_user_cache row, or None if nothing matched.
+        """
+        usernames = list(dict.fromkeys(jellyfin_usernames))
+        conditions: List[str] = []
+        priority_cases: List[str] = []
+        params: List[Any] = []
+        priority_params: List[Any] = []
+        if discord_id is not None:
+            conditions.append("discord_id = ?")
+            params.append(discord_id)
+            priority_cases.append("WHEN discord_id = ? THEN 0")
+            priority_params.append(discord_id)
+        if usernames:
+            conditions.append(
+                f"jellyfin_username IN ({', '.join('?' for _ in usernames)})"
+            )
+            params.extend(usernames)
+            for rank, username in enumerate(usernames, start=1):
+                priority_cases.append(f"WHEN jellyfin_username = ? THEN {rank}")
+                priority_params.append(username)
+        if not conditions:
+            return None
+
+        self.logger.debug(
+            "Resolving JFA user from cache by discord_id %s or jellyfin_usernames %s",
+            discord_id,
+            usernames,
+        )
+        query = (
+            f"SELECT * FROM jfa_user_cache WHERE {' OR '.join(conditions)} "
+            f"ORDER BY CASE {' '.join(priority_cases)} END LIMIT 1"
+        )
+        try:
+            with self._get_connection() as conn:
+                return conn.execute(query, params + priority_params).fetchone()
+        except Exception as e:
+            self.logger.error(
+                f"Error resolving JFA user from cache (discord_id {discord_id}, jellyfin_usernames {usernames}): {e}",
+                exc_info=True,
+            )
+            return None
+
     def update_user_invite_status(self, user_id: str, status: str) -> bool:
         """Update the status of a user's invite record (e.g., 'trial', 'paid', 'disabled')."""
         allowed_statuses = [
@@ -559,6 +844,65 @@ class Database:
             )
             return False
 
+    def disable_invite_by_username(
+        self, username: str
+    ) -> Tuple[Optional[str], Optional[str], bool]:
+        """Find a user's invite by username and set its status to 'disabled'.
+
+        An exact username match is tried first, then the newest invite whose
+        username contains the given text. The lookup and the update run in one
+        transaction.
+
+        Args:
+            username: The username to look for in user_invites.
+
+        Returns:
+            Tuple of (user_id, match_type, updated). match_type is "exact" or
+            "pattern", or None (with user_id None) when no invite matched.
+        """
+        self.logger.debug(f"Disabling invite by username: {username}")
+        try:
+            with self._get_connection() as conn:
+                with conn:  # Lookup and update in one transaction
+                    match_type = "exact"
+                    row = conn.execute(
+                        "SELECT user_id FROM user_invites WHERE username = ? LIMIT 1",
+                        (username,),
+                    ).fetchone()
+                    if row is None:
+                        match_type = "pattern"
+                        row = conn.execute(
+                            "SELECT user_id FROM user_invites WHERE username LIKE ? "
+                            "ORDER BY created_at DESC LIMIT 1",
+                            (f"%{username}%",),
+                        ).fetchone()
+                    if row is None:
+                        self.logger.debug(f"No invite record found for {username}")
+                        return None, None, False
+
+                    user_id = row["user_id"]
+                    cursor = conn.execute(
+                        "UPDATE user_invites SET status = ?, updated_at = ? WHERE user_id = ?",
+                        (
+                            "disabled",
+                            int(
+                                datetime.datetime.now(datetime.timezone.utc).timestamp()
+                            ),
+                            user_id,
+                        ),
+                    )
+                    updated = cursor.rowcount > 0
+                    self.logger.info(
+                        f"Disabled invite for user_id {user_id} matched by username {username} ({match_type})"
+                    )
+                    return user_id, match_type, updated
+        except Exception as e:
+            self.logger.error(
+                f"Error disabling invite by username {username}: {str(e)}",
+                exc_info=True,
+            )
+            return None, None, False
+
     def get_invite_status(self, user_id: str) -> Optional[str]:
         """Get the status of a user's invite record."""
         self.logger.debug(f"Getting invite status for user_id: {user_id}")
@@ -628,3 +972,37 @@ class Database:
                 f"Error finding invites by username pattern {pattern}: {str(e)}"
             )
             return []
+
+    def get_bot_state(self, key: str) -> Optional[str]:
+        """Get a value persisted with set_bot_state, or None if it is not set."""
+        self.logger.debug(f"Getting bot state for key: {key}")
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT value FROM bot_state WHERE key = ?", (key,)
+                )
+                row = cursor.fetchone()
+                return row["value"] if row else None
+        except Exception as e:
+            self.logger.error(f"Error getting bot state for key {key}: {str(e)}")
+            return None
+
+    def set_bot_state(self, key: str, value: str) -> None:
+        """Persist a bot state value (e.g. the last command sync hash) under a key."""
+        self.logger.debug(f"Setting bot state for key: {key}")
+        now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        try:
+            with self._get_connection() as conn:
+                with conn:  # Transaction
+                    conn.execute(
+                        """
+                        INSERT INTO bot_state (key, value, updated_at)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(key) DO UPDATE SET
+                            value = excluded.value,
+                            updated_at = excluded.updated_at
+                        """,
+                        (key, value, now),
+                    )
+        except Exception as e:
+            self.logger.error(f"Error setting bot state for key {key}: {str(e)}")
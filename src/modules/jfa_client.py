@@ -3,12 +3,23 @@
 import datetime
 import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from modules.config import get_config_value
 
+# Maximum number of kept-alive connections to the JFA-GO host
+JFA_CONNECTION_POOL_SIZE = 16
+
+# How long a looked-up JFA-GO user's details are reused. Kept short because the
+# details include the account expiry, which other admins or JFA-GO itself may change.
+JFA_USER_DETAILS_CACHE_SECONDS = 30
+# Most users whose details are kept at once; the least recently used is dropped first
+JFA_USER_DETAILS_CACHE_SIZE = 256
+
 
 class JfaGoClient:
     """Client for interacting with JFA-GO API"""
@@ -36,6 +47,12 @@ class JfaGoClient:
         self._invite_cache_expiry: Optional[float] = None
         self._profile_cache_expiry: Optional[float] = None
         self._cache_duration_seconds = 300  # 5 minutes cache duration
+        # Lowercased username -> (expiry timestamp, user details), least recently used
+        # first. Guarded by a lock since JfaGoBot.run_jfa calls in from several threads.
+        self._user_details_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._user_details_cache_lock = threading.Lock()
 
     def _setup_session(self) -> None:
         """Setup the session with proper timeouts and retries"""
@@ -47,7 +64,14 @@ class JfaGoClient:
             retry_strategy = requests.adapters.Retry(
                 total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]
             )
-            adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
+            # All requests go to the single JFA-GO host, so one pool is enough; size it
+            # for the calls commands now issue concurrently (via JfaGoBot.run_jfa) so
+            # they reuse kept-alive connections instead of opening throwaway ones
+            adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=1,
+                pool_maxsize=JFA_CONNECTION_POOL_SIZE,
+            )
             self.session.mount("http://", adapter)
             self.session.mount("https://", adapter)
             self.logger.info("Requests Session configured with retry strategy.")
@@ -300,6 +324,8 @@ class JfaGoClient:
         exact_timestamp: Optional[int] = None,  # Optional exact expiry timestamp
     ) -> Tuple[bool, str]:
         """Extend expiry for a JFA-GO user or set an exact expiry timestamp."""
+        # The cached expiry is stale whatever the outcome of the request below
+        self._invalidate_user_details(jfa_username)
         if not self.ensure_auth():
             return False, "Authentication failed"
 
@@ -706,7 +732,54 @@ class JfaGoClient:
     def get_jfa_user_details_by_username(
         self, username: str
     ) -> Optional[Dict[str, Any]]:
-        """Get details for a specific JFA-GO user by their username."""
+        """Get details for a specific JFA-GO user by their username.
+
+        Found users are cached for JFA_USER_DETAILS_CACHE_SECONDS, so commands run
+        back to back against the same account don't refetch the whole user list.
+        The entry is dropped when the bot extends or deletes that user. At most
+        JFA_USER_DETAILS_CACHE_SIZE users are kept, least recently used evicted first.
+        """
+        cache_key = username.lower()
+        with self._user_details_cache_lock:
+            cached = self._user_details_cache.get(cache_key)
+            if cached is not None and datetime.datetime.now().timestamp() < cached[0]:
+                self._user_details_cache.move_to_end(cache_key)
+                self.logger.debug(
+                    "Returning JFA-GO user details for %s from cache.", username
+                )
+                return cached[1]
+
+        user_details = self._fetch_jfa_user_details_by_username(username)
+        if user_details is not None:
+            now = datetime.datetime.now().timestamp()
+            with self._user_details_cache_lock:
+                # Sweep expired entries so users who are never looked up again don't
+                # linger, then evict the least recently used beyond the size cap
+                expired_keys = [
+                    key
+                    for key, (expires_at, _) in self._user_details_cache.items()
+                    if expires_at <= now
+                ]
+                for key in expired_keys:
+                    del self._user_details_cache[key]
+                self._user_details_cache[cache_key] = (
+                    now + JFA_USER_DETAILS_CACHE_SECONDS,
+                    user_details,
+                )
+                self._user_details_cache.move_to_end(cache_key)
+                while len(self._user_details_cache) > JFA_USER_DETAILS_CACHE_SIZE:
+                    self._user_details_cache.popitem(last=False)
+        return user_details
+
+    def _invalidate_user_details(self, username: str) -> None:
+        """Drop a user's cached details after the bot changes that user."""
+        with self._user_details_cache_lock:
+            self._user_details_cache.pop(username.lower(), None)
+
+    def _fetch_jfa_user_details_by_username(
+        self, username: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch details for a specific JFA-GO user by their username from the API."""
         if not self.ensure_auth():
             self.logger.error(
                 f"Authentication failed attempting to get details for user {username}."
@@ -891,6 +964,7 @@ class JfaGoClient:
         with the user's ID in the payload.
         """
         self.logger.info(f"Attempting to delete JFA-GO user: {jellyfin_username}")
+        self._invalidate_user_details(jellyfin_username)
         if not self.ensure_auth():
             return False, "Authentication failed"
 
@@ -1,9 +1,10 @@
 """Handles loading and formatting of user-facing messages and embeds from templates."""
 
+import functools
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import discord
 
@@ -13,6 +14,9 @@ from modules.config import get_config_value, DEFAULT_TEMPLATES_FILE_PATH
 logger = logging.getLogger(__name__)
 
 MESSAGE_TEMPLATES: Dict[str, Any] = {}
+_NO_VALUES: Mapping[str, Any] = {}
+# Returned by _resolve_template for keys that are not in MESSAGE_TEMPLATES
+_MISSING_TEMPLATE = object()
 
 
 def load_message_templates() -> None:
@@ -61,6 +65,10 @@ def load_message_templates() -> None:
         )
         MESSAGE_TEMPLATES = {}
 
+    # Templates and static messages cached from the previous file are now stale
+    _resolve_template.cache_clear()
+    get_static_message.cache_clear()
+
 
 def get_bot_display_name() -> str:
     """Retrieves the bot's display name from configuration."""
@@ -80,22 +88,44 @@ def get_message(key: str, default: Optional[str] = None, **kwargs: Any) -> str:
     Example: get_message("errors.not_authorized_command")
              get_message("general.hello", user_name="Bob")
     """
+    return format_message(key, kwargs, default)
+
+
+def format_message(
+    key: str, values: Optional[Mapping[str, Any]] = None, default: Optional[str] = None
+) -> str:
+    """
+    Retrieves a message template by its dot-separated key and formats it with an
+    existing mapping of placeholder values.
+
+    This is what get_message uses under the hood. Call it directly when the values
+    are already in a dict (e.g. description_kwargs in create_embed) so they are not
+    unpacked into keyword arguments and packed into a new dict again.
+
+    Args:
+        key: Dot-separated template key.
+        values: Placeholder values for the template. Not copied or modified.
+        default: Returned instead of a placeholder when the key is missing or
+            formatting fails.
+
+    Returns:
+        The formatted message string.
+
+    Example: format_message("general.hello", {"user_name": "Bob"})
+    """
+    if values is None:
+        values = _NO_VALUES
+
     if not MESSAGE_TEMPLATES:
         logger.warning(
             f"Attempted to get message for key '{key}' but templates are not loaded."
         )
         return default if default is not None else f"<Missing Template: {key}>"
 
-    keys = key.split(".")
-    value = MESSAGE_TEMPLATES
     try:
-        for k in keys:
-            if isinstance(value, dict):
-                value = value[k]
-            else:
-                raise KeyError(
-                    f"Path '{k}' not found in sub-template during lookup of '{key}'."
-                )
+        value = _resolve_template(key)
+        if value is _MISSING_TEMPLATE:
+            raise KeyError(key)
 
         if not isinstance(value, str):
             logger.warning(
@@ -103,7 +133,7 @@ def get_message(key: str, default: Optional[str] = None, **kwargs: Any) -> str:
             )
             return str(value) if default is None else default
 
-        return value.format(**kwargs)
+        return value.format_map(values)
     except KeyError:
         logger.warning(
             f"Message template key '{key}' not found. Returning default or placeholder."
@@ -111,12 +141,45 @@ def get_message(key: str, default: Optional[str] = None, **kwargs: Any) -> str:
         return default if default is not None else f"<Missing Template: {key}>"
     except Exception as e:
         logger.error(
-            f"Error formatting message for key '{key}' with args {kwargs}: {e}",
+            f"Error formatting message for key '{key}' with args {values}: {e}",
             exc_info=True,
         )
         return default if default is not None else f"<Error Formatting Template: {key}>"
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_template(key: str) -> Any:
+    """
+    Looks up the raw, unformatted template for a dot-separated key.
+
+    Results are cached per key, so repeated lookups skip walking the nested
+    template dicts. The cache is cleared whenever load_message_templates runs.
+
+    Returns:
+        The template value, or _MISSING_TEMPLATE if the key does not exist.
+    """
+    value = MESSAGE_TEMPLATES
+    for k in key.split("."):
+        if not isinstance(value, dict) or k not in value:
+            return _MISSING_TEMPLATE
+        value = value[k]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def get_static_message(key: str) -> str:
+    """
+    Cached variant of get_message for templates that take no placeholders.
+
+    Use it for fixed strings such as embed field names that are looked up on every
+    call of a frequently used code path. The cache is cleared whenever
+    load_message_templates runs.
+
+    Example: get_static_message("admin_log.field_action_type_name")
+    """
+    return get_message(key)
+
+
 def get_embed_color(color_type: str) -> discord.Color:
     """
     Retrieves a hex color string from message_settings.embed_colors based on type (e.g., 'success', 'error'),
@@ -184,15 +247,14 @@ def create_embed(
 
     # Set title if provided via key
     if title_key:
-        embed.title = get_message(title_key)
+        embed.title = get_static_message(title_key)
     # Set title directly if provided
     elif title:
         embed.title = title
 
     # Set description if provided via key
     if description_key:
-        kwargs = description_kwargs or {}
-        embed.description = get_message(description_key, **kwargs)
+        embed.description = format_message(description_key, description_kwargs)
     # Set description directly if provided
     elif description:
         embed.description = description
@@ -203,20 +265,19 @@ def create_embed(
 
     # Set footer if footer_key is provided
     if footer_key:
-        embed.set_footer(text=get_message(footer_key))
+        embed.set_footer(text=get_static_message(footer_key))
 
     # Add fields if provided
     if fields:
         for field in fields:
             name = (
-                get_message(field["name_key"])
+                get_static_message(field["name_key"])
                 if "name_key" in field
                 else field.get("name", "")
             )
 
             if "value_key" in field:
-                value_kwargs = field.get("value_kwargs", {})
-                value = get_message(field["value_key"], **value_kwargs)
+                value = format_message(field["value_key"], field.get("value_kwargs"))
             else:
                 value = field.get("value", "")
 
@@ -1,7 +1,7 @@
 """Data models for the application."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 @dataclass
@@ -31,3 +31,14 @@ class AdminAction:
     target_username: str
     details: Optional[str]
     performed_at: int
+
+
+class ExpirySummaryRow(NamedTuple):
+    """Model for one user entry in the expiry notification summary."""
+
+    username: str
+    user_id: str
+    plan_type_display: str
+    expiry_date_str: str
+    human_readable_expiry: str
+    dm_status_key: str